@@ -0,0 +1,111 @@
+"""Incoming-transaction backfill throughput by shard count.
+
+Serves ``--rows`` incoming transactions from a local stand-in daemon that
+implements the ``/v1/wallet/incoming`` since/until filters and
+``(detectedAt, id)`` cursors, with a fixed per-request latency, and times
+``backfill_incoming`` over the whole range with 1/2/4/8/16 shards.
+
+The stand-in shares the client's process and event loop, so at low
+latencies the run becomes CPU bound (JSON encoding on the server side,
+decoding on the client side) and stops scaling with shard count.
+
+Run from the ``python-sdk`` directory:
+
+    python -m benchmarks.bench_backfill [--rows 20000] [--latency 0.05]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import time
+from typing import Any
+
+from waiaas import PoolLimits, WAIaaSClient
+
+from benchmarks.standin import WALLET_ID, Reply, Request, StandInDaemon
+
+SHARD_COUNTS = (1, 2, 4, 8, 16)
+START = 1_700_000_000
+
+
+def make_rows(n: int) -> list[dict[str, Any]]:
+    """Incoming rows sorted oldest first, several per second."""
+    return [
+        {
+            "id": f"in-{i:08d}",
+            "txHash": f"0x{i:064x}",
+            "walletId": WALLET_ID,
+            "fromAddress": f"0x{i:040x}",
+            "amount": "1000",
+            "tokenAddress": None,
+            "chain": "ethereum",
+            "network": "ethereum-mainnet",
+            "status": "CONFIRMED",
+            "blockNumber": 19_000_000 + i,
+            "detectedAt": START + i // 4,
+            "confirmedAt": START + i // 4 + 12,
+            "suspicious": False,
+        }
+        for i in range(n)
+    ]
+
+
+def incoming_handler(rows: list[dict[str, Any]]) -> Any:
+    keys = [(r["detectedAt"], r["id"]) for r in rows]
+
+    async def handler(request: Request) -> Reply:
+        if request.path != "/v1/wallet/incoming":
+            return Reply.json(404, {"code": "NOT_FOUND", "message": "Not found"})
+        q = request.query
+        lo = bisect.bisect_left(keys, (int(q.get("since", 0)), ""))
+        hi = bisect.bisect_right(keys, (int(q.get("until", 2**62)), "~"))
+        if "cursor" in q:
+            at, _, last_id = q["cursor"].partition(":")
+            hi = min(hi, bisect.bisect_left(keys, (int(at), last_id)))
+        limit = int(q.get("limit", 20))
+        page = rows[max(lo, hi - limit) : hi][::-1]
+        has_more = hi - limit > lo
+        last = page[-1] if page else None
+        return Reply.json(
+            200,
+            {
+                "data": page,
+                "nextCursor": f"{last['detectedAt']}:{last['id']}" if has_more and last else None,
+                "hasMore": has_more,
+            },
+        )
+
+    return handler
+
+
+async def main(n: int, latency: float) -> None:
+    rows = make_rows(n)
+    since, until = rows[0]["detectedAt"], rows[-1]["detectedAt"]
+    print(f"{n} incoming rows, {latency * 1000:.1f} ms server latency, 100 per page\n")
+    print(f"{'shards':>6} | {'seconds':>8} | {'rows/s':>8} | {'speedup':>7}")
+    print("-" * 40)
+    baseline = None
+    async with StandInDaemon(incoming_handler(rows), latency=latency) as daemon:
+        for shards in SHARD_COUNTS:
+            limits = PoolLimits(max_connections=shards, max_keepalive_connections=shards)
+            async with WAIaaSClient(
+                daemon.base_url, "wai_sess_bench", pool_limits=limits
+            ) as client:
+                start = time.perf_counter()
+                count = 0
+                async for _ in client.backfill_incoming(since, until, shards=shards):
+                    count += 1
+                elapsed = time.perf_counter() - start
+            assert count == n, count
+            baseline = baseline or elapsed
+            print(f"{shards:>6} | {elapsed:>8.2f} | {n / elapsed:>8.0f} | {baseline / elapsed:>6.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.latency))
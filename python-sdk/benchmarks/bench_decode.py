@@ -0,0 +1,151 @@
+"""Response decoding: ``model_validate(json.loads(...))`` vs bytes-to-model.
+
+Measures CPU time per decode and peak allocations (tracemalloc) for
+``TransactionList``, ``IncomingTransactionList`` and
+``MultiNetworkAssetsResponse`` payloads, comparing the previous
+dict-first path with ``waiaas.decoding.validate_json``.  The raw-dict
+rows compare ``json.loads`` with ``waiaas.decoding.loads`` (orjson when
+installed).
+
+Run from the ``python-sdk`` directory:
+
+    python -m benchmarks.bench_decode [--items 200] [--rounds 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from waiaas.decoding import loads, orjson, validate_json
+from waiaas.models import (
+    IncomingTransactionList,
+    MultiNetworkAssetsResponse,
+    TransactionList,
+)
+
+WALLET_ID = "01234567-89ab-cdef-0123-456789abcdef"
+
+
+def transaction_list(n: int) -> dict[str, Any]:
+    return {
+        "items": [
+            {
+                "id": f"tx-{i:08d}",
+                "walletId": WALLET_ID,
+                "type": "TRANSFER",
+                "status": "CONFIRMED",
+                "tier": "INSTANT",
+                "chain": "ethereum",
+                "toAddress": f"0x{i:040x}",
+                "amount": str(10**15 * i),
+                "txHash": f"0x{i:064x}",
+                "error": None,
+                "createdAt": 1_700_000_000 + i,
+            }
+            for i in range(n)
+        ],
+        "cursor": f"tx-{n - 1:08d}",
+        "hasMore": True,
+    }
+
+
+def incoming_list(n: int) -> dict[str, Any]:
+    return {
+        "data": [
+            {
+                "id": f"in-{i:08d}",
+                "txHash": f"0x{i:064x}",
+                "walletId": WALLET_ID,
+                "fromAddress": f"0x{i:040x}",
+                "amount": str(10**15 * i),
+                "tokenAddress": None,
+                "chain": "ethereum",
+                "network": "ethereum-mainnet",
+                "status": "CONFIRMED",
+                "blockNumber": 19_000_000 + i,
+                "detectedAt": 1_700_000_000 + i,
+                "confirmedAt": 1_700_000_060 + i,
+                "suspicious": False,
+            }
+            for i in range(n)
+        ],
+        "nextCursor": f"in-{n - 1:08d}",
+        "hasMore": True,
+    }
+
+
+def multi_network_assets(n: int) -> dict[str, Any]:
+    networks = ["ethereum-mainnet", "polygon-mainnet", "base-mainnet", "arbitrum-mainnet"]
+    return {
+        "walletId": WALLET_ID,
+        "chain": "ethereum",
+        "environment": "mainnet",
+        "networkAssets": [
+            {
+                "network": network,
+                "assets": [
+                    {
+                        "mint": f"0x{i:040x}",
+                        "symbol": f"TK{i}",
+                        "name": f"Token {i}",
+                        "balance": str(10**18 * i),
+                        "decimals": 18,
+                        "isNative": i == 0,
+                        "usdValue": i * 1.25,
+                    }
+                    for i in range(n // len(networks))
+                ],
+            }
+            for network in networks
+        ],
+    }
+
+
+def measure(fn: Callable[[], Any], rounds: int) -> tuple[float, int]:
+    """Return (microseconds per call, peak bytes allocated by one call)."""
+    fn()
+    start = time.process_time()
+    for _ in range(rounds):
+        fn()
+    per_call = (time.process_time() - start) / rounds * 1e6
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return per_call, peak
+
+
+def main(items: int, rounds: int) -> None:
+    cases = [
+        ("TransactionList", TransactionList, transaction_list(items)),
+        ("IncomingTransactionList", IncomingTransactionList, incoming_list(items)),
+        ("MultiNetworkAssetsResponse", MultiNetworkAssetsResponse, multi_network_assets(items)),
+    ]
+    print(f"{items} items per payload, {rounds} rounds\n")
+    print(f"{'model':<27} | {'path':<22} | {'us/call':>9} | {'peak KiB':>9}")
+    print("-" * 76)
+    for name, model, payload in cases:
+        raw = json.dumps(payload).encode()
+        rows = [
+            ("json.loads+validate", lambda: model.model_validate(json.loads(raw))),
+            ("validate_json (bytes)", lambda: validate_json(raw, model)),
+            ("json.loads (dict)", lambda: json.loads(raw)),
+        ]
+        if orjson is not None:
+            rows.append(("orjson loads (dict)", lambda: loads(raw)))
+        for label, fn in rows:
+            per_call, peak = measure(fn, rounds)
+            print(f"{name:<27} | {label:<22} | {per_call:>9.1f} | {peak / 1024:>9.1f}")
+        print("-" * 76)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    main(args.items, args.rounds)
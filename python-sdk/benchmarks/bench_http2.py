@@ -0,0 +1,107 @@
+"""HTTP/1.1 vs HTTP/2 throughput and socket count for concurrent reads.
+
+Fans out ``get_balance`` calls at 1/10/100 concurrency against local
+stand-in daemons that add a fixed per-request latency (simulating the
+chain RPC behind the real daemon), and reports requests/second together
+with the number of TCP connections the client opened and how many of
+them spoke HTTP/2.
+
+Three client setups are compared:
+
+* ``HTTP/1.1`` -- the default client.
+* ``h2 -> 1.1`` -- ``http2=True`` against an HTTP/1.1-only server, like
+  the real daemon on ``http://``.  Cleartext has no protocol negotiation,
+  so the client falls back to HTTP/1.1 and every call still succeeds.
+* ``h2c`` -- ``http2_prior_knowledge=True`` against a server that accepts
+  cleartext HTTP/2, multiplexing all calls over one connection.
+
+Run from the ``python-sdk`` directory:
+
+    python -m benchmarks.bench_http2 [--requests 2000] [--latency 0.005]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from waiaas import PoolLimits, WAIaaSClient
+
+from benchmarks.standin import StandInDaemon
+
+CONCURRENCY_LEVELS = (1, 10, 100)
+
+# (label, http2, http2_prior_knowledge, server speaks HTTP/2)
+MODES = (
+    ("HTTP/1.1", False, False, False),
+    ("h2 -> 1.1", True, False, False),
+    ("h2c", False, True, True),
+)
+
+
+async def run_mode(
+    daemon: StandInDaemon,
+    *,
+    http2: bool,
+    prior_knowledge: bool,
+    concurrency: int,
+    total: int,
+) -> tuple[float, int, int]:
+    daemon.reset_counters()
+    limits = (
+        PoolLimits(max_connections=1, max_streams=concurrency)
+        if prior_knowledge
+        else PoolLimits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        )
+    )
+    async with WAIaaSClient(
+        daemon.base_url,
+        "wai_sess_bench",
+        http2=http2,
+        http2_prior_knowledge=prior_knowledge,
+        pool_limits=limits,
+    ) as client:
+        queue: asyncio.Queue[None] = asyncio.Queue()
+        for _ in range(total):
+            queue.put_nowait(None)
+
+        async def worker() -> None:
+            while not queue.empty():
+                queue.get_nowait()
+                await client.get_balance()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return total / elapsed, daemon.connections, daemon.h2_connections
+
+
+async def main(total: int, latency: float) -> None:
+    print(f"{total} get_balance calls, {latency * 1000:.1f} ms server latency\n")
+    print(f"{'concurrency':>11} | {'mode':>9} | {'req/s':>9} | {'sockets':>7} | {'h2':>3}")
+    print("-" * 53)
+    async with StandInDaemon(latency=latency, http2=False) as h1_daemon, StandInDaemon(
+        latency=latency
+    ) as h2_daemon:
+        for concurrency in CONCURRENCY_LEVELS:
+            for mode, http2, prior_knowledge, server_h2 in MODES:
+                rps, sockets, h2_sockets = await run_mode(
+                    h2_daemon if server_h2 else h1_daemon,
+                    http2=http2,
+                    prior_knowledge=prior_knowledge,
+                    concurrency=concurrency,
+                    total=total,
+                )
+                print(
+                    f"{concurrency:>11} | {mode:>9} | {rps:>9.0f} | {sockets:>7} | {h2_sockets:>3}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.latency))
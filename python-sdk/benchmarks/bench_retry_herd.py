@@ -0,0 +1,148 @@
+"""Thundering-herd simulation: 500 clients against a rate-limited daemon.
+
+A local stand-in daemon enforces a sliding-window limit (``--limit``
+requests per ``--window`` seconds, like the daemon's rate-limiter
+middleware) and answers excess requests with 429 + ``Retry-After``.
+``--clients`` independent ``WAIaaSClient`` instances each issue one
+``get_balance`` at the same instant, under several retry policies:
+
+- ``lockstep``: plain exponential backoff, Retry-After ignored (the old
+  behaviour) -- every client retries at the same moments.
+- ``full`` / ``decorrelated``: jittered backoff, Retry-After ignored.
+- ``full+retry-after``: full jitter on top of the server's Retry-After.
+- ``+budget``: the above with a per-client RetryBudget.
+
+Reported per policy: requests the server saw, how many were rejected
+(429), calls that eventually succeeded, and completion time percentiles.
+
+Run from the ``python-sdk`` directory:
+
+    python -m benchmarks.bench_retry_herd [--clients 500] [--limit 100] [--window 1.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import collections
+import math
+import time
+from typing import Callable
+
+from waiaas import WAIaaSClient
+from waiaas.errors import WAIaaSError
+from waiaas.retry import RetryBudget, RetryPolicy
+
+from benchmarks.standin import Reply, Request, StandInDaemon, default_handler
+
+
+class SlidingWindowLimiter:
+    """Admits ``limit`` requests per ``window`` seconds, like the daemon."""
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self.accepted: collections.deque[float] = collections.deque()
+        self.rejected = 0
+        self.enabled = True
+
+    async def handler(self, request: Request) -> Reply:
+        if not self.enabled:
+            return await default_handler(request)
+        now = time.monotonic()
+        while self.accepted and self.accepted[0] <= now - self.window:
+            self.accepted.popleft()
+        if len(self.accepted) >= self.limit:
+            self.rejected += 1
+            retry_after = max(1, math.ceil(self.accepted[0] + self.window - now))
+            return Reply.json(
+                429,
+                {"code": "RATE_LIMITED", "message": "Too many requests", "retryable": True},
+                **{"Retry-After": str(retry_after)},
+            )
+        self.accepted.append(now)
+        return await default_handler(request)
+
+
+def policies(base_delay: float) -> dict[str, Callable[[], RetryPolicy]]:
+    common = dict(max_retries=8, base_delay=base_delay, max_delay=8.0)
+    return {
+        "lockstep": lambda: RetryPolicy(**common, respect_retry_after=False),
+        "full": lambda: RetryPolicy(**common, jitter="full", respect_retry_after=False),
+        "decorrelated": lambda: RetryPolicy(
+            **common, jitter="decorrelated", respect_retry_after=False
+        ),
+        "full+retry-after": lambda: RetryPolicy(**common, jitter="full"),
+        "full+retry-after+budget": lambda: RetryPolicy(
+            **common, jitter="full", budget=RetryBudget(max_tokens=2.0, min_per_second=0.2)
+        ),
+    }
+
+
+async def run(
+    daemon: StandInDaemon,
+    limiter: SlidingWindowLimiter,
+    make_policy: Callable[[], RetryPolicy],
+    clients: int,
+) -> tuple[int, int, int, list[float]]:
+    # One connection per agent, opened before the clock starts, so the
+    # run measures retry timing rather than connection setup.
+    agents = [
+        WAIaaSClient(daemon.base_url, f"wai_sess_agent_{i}", retry_policy=make_policy())
+        for i in range(clients)
+    ]
+    limiter.enabled = False
+    await asyncio.gather(*(a.get_address() for a in agents))
+    limiter.enabled = True
+    limiter.accepted.clear()
+    daemon.reset_counters()
+    start = time.perf_counter()
+    done: list[float] = []
+
+    async def call(agent: WAIaaSClient) -> bool:
+        try:
+            await agent.get_balance()
+        except WAIaaSError:
+            return False
+        done.append(time.perf_counter() - start)
+        return True
+
+    limiter.rejected = 0
+    ok = sum(await asyncio.gather(*(call(a) for a in agents)))
+    await asyncio.gather(*(a.close() for a in agents))
+    return daemon.requests, limiter.rejected, ok, sorted(done)
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return float("nan")
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def main(clients: int, limit: int, window: float, base_delay: float) -> None:
+    limiter = SlidingWindowLimiter(limit, window)
+    print(
+        f"{clients} clients, server limit {limit} req / {window:.1f}s, "
+        f"base_delay {base_delay}s, up to 8 retries\n"
+    )
+    header = f"{'policy':<24} | {'requests':>8} | {'429s':>6} | {'ok':>5} | {'p50 s':>6} | {'p99 s':>6}"
+    print(header)
+    print("-" * len(header))
+    async with StandInDaemon(limiter.handler, backlog=clients) as daemon:
+        for name, make_policy in policies(base_delay).items():
+            requests, rejected, ok, done = await run(daemon, limiter, make_policy, clients)
+            print(
+                f"{name:<24} | {requests:>8} | {rejected:>6} | {ok:>5} | "
+                f"{percentile(done, 0.5):>6.2f} | {percentile(done, 0.99):>6.2f}"
+            )
+            await asyncio.sleep(window)  # let the window drain between runs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--window", type=float, default=1.0)
+    parser.add_argument("--base-delay", type=float, default=0.25)
+    args = parser.parse_args()
+    asyncio.run(main(args.clients, args.limit, args.window, args.base_delay))
@@ -0,0 +1,105 @@
+"""Decode cost per model type under each validation mode.
+
+Prints microseconds per decode of a daemon-shaped payload for each
+validation mode of ``waiaas.decoding.decode``.  Lenient and construct
+modes cost the same as strict on well-formed payloads: all take
+pydantic-core's Rust JSON validator, and construct's ``model_construct``
+fallback only runs when a field fails -- the last column is strict time
+divided by construct time.  Lazy mode
+validates paginated list items only when they are read, which this
+benchmark never does.
+
+Run from the ``python-sdk`` directory:
+
+    python -m benchmarks.bench_validation [--items 200] [--rounds 300]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any
+
+from waiaas.decoding import VALIDATION_MODES, decode
+from waiaas.models import (
+    ConnectInfo,
+    IncomingTransactionList,
+    MultiNetworkAssetsResponse,
+    TransactionDetail,
+    TransactionList,
+    WalletBalance,
+)
+
+from benchmarks.bench_decode import (
+    WALLET_ID,
+    incoming_list,
+    multi_network_assets,
+    transaction_list,
+)
+
+
+def wallet_balance() -> dict[str, Any]:
+    return {
+        "walletId": WALLET_ID,
+        "chain": "solana",
+        "network": "solana-mainnet",
+        "address": "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+        "balance": "1000000000",
+        "decimals": 9,
+        "symbol": "SOL",
+    }
+
+
+def connect_info(wallets: int) -> dict[str, Any]:
+    return {
+        "session": {"id": "sess", "expiresAt": 1_700_000_000, "source": "api"},
+        "wallets": [
+            {
+                "id": f"w-{i}",
+                "name": f"wallet {i}",
+                "chain": "ethereum",
+                "environment": "mainnet",
+                "address": f"0x{i:040x}",
+            }
+            for i in range(wallets)
+        ],
+        "policies": {f"w-{i}": [{"type": "SPENDING_LIMIT"}] for i in range(wallets)},
+        "capabilities": ["transfer", "sign", "actions"],
+        "daemon": {"version": "2.0.0", "baseUrl": "http://localhost:3100"},
+        "prompt": "You are connected to WAIaaS. " * 200,
+    }
+
+
+def main(items: int, rounds: int) -> None:
+    cases = [
+        ("WalletBalance", WalletBalance, wallet_balance()),
+        ("TransactionDetail", TransactionDetail, transaction_list(1)["items"][0]),
+        ("ConnectInfo", ConnectInfo, connect_info(10)),
+        (f"TransactionList[{items}]", TransactionList, transaction_list(items)),
+        (f"IncomingTransactionList[{items}]", IncomingTransactionList, incoming_list(items)),
+        (f"MultiNetworkAssetsResponse[{items}]", MultiNetworkAssetsResponse, multi_network_assets(items)),
+    ]
+    header = " | ".join(f"{mode:>10}" for mode in VALIDATION_MODES)
+    print(f"us per decode, {rounds} rounds\n")
+    print(f"{'model':<32} | {header} | {'s/c':>7}")
+    print("-" * (32 + 13 * len(VALIDATION_MODES) + 12))
+    for name, model, payload in cases:
+        raw = json.dumps(payload).encode()
+        timings = []
+        for mode in VALIDATION_MODES:
+            decode(raw, model, mode)  # warm caches
+            start = time.process_time()
+            for _ in range(rounds):
+                decode(raw, model, mode)
+            timings.append((time.process_time() - start) / rounds * 1e6)
+        row = " | ".join(f"{t:>10.1f}" for t in timings)
+        print(f"{name:<32} | {row} | {timings[0] / timings[-1]:>6.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=300)
+    args = parser.parse_args()
+    main(args.items, args.rounds)
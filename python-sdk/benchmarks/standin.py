@@ -0,0 +1,256 @@
+"""Minimal local stand-in for the WAIaaS daemon, used by the benchmarks.
+
+Speaks HTTP/1.1 with keep-alive and, when the ``h2`` package is installed,
+cleartext HTTP/2 with prior knowledge.  With ``http2=False`` it is an
+HTTP/1.1-only server like the real daemon and drops HTTP/2 connections.
+Every accepted TCP connection is counted so benchmarks can report how many
+sockets a client opened, and over which protocol.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+WALLET_ID = "01234567-89ab-cdef-0123-456789abcdef"
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    query: dict[str, str]
+    headers: dict[str, str]
+    body: bytes
+
+
+@dataclass
+class Reply:
+    status: int = 200
+    body: bytes = b"{}"
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def json(cls, status: int, payload: object, **headers: str) -> "Reply":
+        return cls(status, json.dumps(payload).encode(), dict(headers))
+
+
+Handler = Callable[[Request], Awaitable[Reply]]
+
+
+async def default_handler(request: Request) -> Reply:
+    """Answer the wallet read routes with fixed payloads."""
+    if request.path == "/v1/wallet/balance":
+        return Reply.json(
+            200,
+            {
+                "walletId": WALLET_ID,
+                "chain": "solana",
+                "network": request.query.get("network", "devnet"),
+                "address": "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+                "balance": "1000000000",
+                "decimals": 9,
+                "symbol": "SOL",
+            },
+        )
+    if request.path == "/v1/wallet/address":
+        return Reply.json(
+            200,
+            {
+                "walletId": WALLET_ID,
+                "chain": "solana",
+                "network": "devnet",
+                "address": "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+            },
+        )
+    return Reply.json(404, {"code": "NOT_FOUND", "message": "Not found"})
+
+
+class StandInDaemon:
+    """Async TCP server answering requests through ``handler``.
+
+    Usage:
+        async with StandInDaemon(latency=0.005) as daemon:
+            client = WAIaaSClient(daemon.base_url, "wai_sess_bench")
+    """
+
+    def __init__(
+        self,
+        handler: Handler = default_handler,
+        *,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        backlog: int = 100,
+        http2: bool = True,
+    ) -> None:
+        self._handler = handler
+        self._latency = latency
+        self._http2 = http2
+        self._host = host
+        self._backlog = backlog
+        self._server: Optional[asyncio.base_events.Server] = None
+        self.connections = 0
+        self.h2_connections = 0
+        self.requests = 0
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://{self._host}:{port}"
+
+    async def __aenter__(self) -> "StandInDaemon":
+        self._server = await asyncio.start_server(
+            self._on_connect, self._host, 0, backlog=self._backlog
+        )
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    def reset_counters(self) -> None:
+        self.connections = 0
+        self.h2_connections = 0
+        self.requests = 0
+
+    async def _dispatch(self, request: Request) -> Reply:
+        self.requests += 1
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        return await self._handler(request)
+
+    async def _on_connect(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            head = await reader.readexactly(len(H2_PREFACE))
+        except asyncio.IncompleteReadError:
+            writer.close()
+            return
+        try:
+            if head == H2_PREFACE:
+                if not self._http2:
+                    return
+                self.h2_connections += 1
+                await self._serve_h2(head, reader, writer)
+            else:
+                await self._serve_h1(head, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_h1(
+        self,
+        head: bytes,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        buffered = head
+        while True:
+            while b"\r\n\r\n" not in buffered:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                buffered += chunk
+            raw_head, buffered = buffered.split(b"\r\n\r\n", 1)
+            lines = raw_head.decode("latin-1").split("\r\n")
+            method, target, _ = lines[0].split(" ", 2)
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            length = int(headers.get("content-length", "0"))
+            while len(buffered) < length:
+                buffered += await reader.readexactly(length - len(buffered))
+            body, buffered = buffered[:length], buffered[length:]
+            url = urlsplit(target)
+            reply = await self._dispatch(
+                Request(method, url.path, dict(parse_qsl(url.query)), headers, body)
+            )
+            out_headers = {
+                "content-type": "application/json",
+                "content-length": str(len(reply.body)),
+                **reply.headers,
+            }
+            status_line = f"HTTP/1.1 {reply.status} X\r\n"
+            header_block = "".join(f"{k}: {v}\r\n" for k, v in out_headers.items())
+            writer.write((status_line + header_block + "\r\n").encode() + reply.body)
+            await writer.drain()
+
+    async def _serve_h2(
+        self,
+        head: bytes,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        streams: dict[int, tuple[dict[str, str], bytearray]] = {}
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def respond(stream_id: int, request: Request) -> None:
+            reply = await self._dispatch(request)
+            conn.send_headers(
+                stream_id,
+                [
+                    (":status", str(reply.status)),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(reply.body))),
+                    *reply.headers.items(),
+                ],
+            )
+            conn.send_data(stream_id, reply.body, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        data = head
+        while True:
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    headers = {
+                        (k.decode() if isinstance(k, bytes) else k): (
+                            v.decode() if isinstance(v, bytes) else v
+                        )
+                        for k, v in event.headers
+                    }
+                    streams[event.stream_id] = (headers, bytearray())
+                elif isinstance(event, h2.events.DataReceived):
+                    streams[event.stream_id][1].extend(event.data)
+                    conn.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id
+                    )
+                elif isinstance(event, h2.events.StreamEnded):
+                    headers, body = streams.pop(event.stream_id)
+                    url = urlsplit(headers[":path"])
+                    request = Request(
+                        headers[":method"],
+                        url.path,
+                        dict(parse_qsl(url.query)),
+                        headers,
+                        bytes(body),
+                    )
+                    task = asyncio.create_task(respond(event.stream_id, request))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+            data = await reader.read(65536)
+            if not data:
+                return
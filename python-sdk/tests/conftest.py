@@ -1,6 +1,13 @@
 """Shared pytest fixtures for WAIaaS SDK tests."""
 
+import base64
+import json
+
 import httpx
+import pytest
+
+from waiaas.client import WAIaaSClient
+from waiaas.retry import RetryPolicy
 
 # Standard response fixtures
 WALLET_ID = "01234567-89ab-cdef-0123-456789abcdef"
@@ -19,3 +26,45 @@ def make_response(status_code: int, body: dict) -> httpx.Response:
 def mock_transport(handler):
     """Create httpx.MockTransport from a request handler function."""
     return httpx.MockTransport(handler)
+
+
+def make_session_token(iat: int, exp: int | None, session_id: str = SESSION_ID) -> str:
+    """Create a ``wai_sess_<JWT>`` token with the given claims (unsigned)."""
+
+    def part(obj: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(obj).encode()).rstrip(b"=").decode()
+
+    claims = {"sub": session_id, "iat": iat}
+    if exp is not None:
+        claims["exp"] = exp
+    return f"wai_sess_{part({'alg': 'HS256'})}.{part(claims)}.sig"
+
+
+@pytest.fixture
+async def make_client():
+    """Factory for WAIaaSClients talking to a MockTransport ``handler``.
+
+    ``make_client(handler, **kwargs)`` passes ``kwargs`` on to
+    WAIaaSClient; retries are off unless ``retry_policy`` is given, and
+    ``base_url``/``session_token`` default to a test daemon and token.
+    Every client made is closed on teardown.
+    """
+    made: list[tuple[WAIaaSClient, httpx.AsyncClient]] = []
+
+    def make(
+        handler,
+        *,
+        base_url: str = "http://test",
+        session_token: str = "wai_sess_test_token",
+        **kwargs,
+    ) -> WAIaaSClient:
+        kwargs.setdefault("retry_policy", RetryPolicy(max_retries=0))
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=base_url)
+        client = WAIaaSClient(base_url, session_token, http_client=http_client, **kwargs)
+        made.append((client, http_client))
+        return client
+
+    yield make
+    for client, http_client in made:
+        await client.close()
+        await http_client.aclose()
@@ -0,0 +1,238 @@
+"""Load balancer tests for WAIaaS SDK."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from waiaas.balancer import LoadBalancer
+from waiaas.client import WAIaaSClient
+from waiaas.errors import WAIaaSError
+from waiaas.retry import RetryPolicy
+
+A, B, C = "http://a:3100", "http://b:3100", "http://c:3100"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Replicas:
+    """Stand-in for several daemons, told apart by host."""
+
+    def __init__(self) -> None:
+        self.delays: dict[str, float] = {}
+        self.down: set[str] = set()
+        self.unhealthy: set[str] = set()
+        self.hits: dict[str, list[str]] = {}
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        if host in self.down:
+            raise httpx.ConnectError("connection refused", request=request)
+        if request.url.path == "/health":
+            status = 503 if host in self.unhealthy else 200
+            return httpx.Response(status, json={"status": "ok"})
+        self.hits.setdefault(host, []).append(f"{request.method} {request.url.path}")
+        await asyncio.sleep(self.delays.get(host, 0.0))
+        if request.method == "POST":
+            return httpx.Response(201, json={"id": "tx-1", "status": "PENDING"})
+        return httpx.Response(
+            200,
+            json={"walletId": "w", "chain": "solana", "network": "devnet", "address": host},
+        )
+
+    def count(self, host: str, method: str = "GET") -> int:
+        return sum(1 for hit in self.hits.get(host, []) if hit.startswith(method))
+
+
+def make_client(replicas: Replicas, balancer: LoadBalancer) -> WAIaaSClient:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(replicas.handler), base_url=A
+    )
+    return WAIaaSClient(
+        A,
+        "wai_sess_test_token",
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_retries=0),
+        balancer=balancer,
+    )
+
+
+class TestLoadBalancer:
+    def test_rejects_bad_configuration(self):
+        with pytest.raises(ValueError):
+            LoadBalancer([])
+        with pytest.raises(ValueError):
+            LoadBalancer([A], strategy="random")  # type: ignore[arg-type]
+        with pytest.raises(ValueError):
+            LoadBalancer(["unix:///run/waiaas.sock"])
+
+    def test_writes_go_to_the_primary(self):
+        balancer = LoadBalancer([A + "/", B])
+        assert balancer.primary == A
+        for _ in range(5):
+            assert balancer.pick("POST") == A
+        assert balancer.pick("POST", [A]) is None
+
+    def test_least_outstanding(self):
+        balancer = LoadBalancer([A, B, C], strategy="least_outstanding")
+        balancer.begin(A)
+        balancer.begin(A)
+        balancer.begin(B)
+        assert balancer.pick("GET") == C
+        balancer.begin(C)
+        assert balancer.pick("GET") in (B, C)
+
+    def test_ties_rotate(self):
+        balancer = LoadBalancer([A, B, C], strategy="least_outstanding")
+        assert {balancer.pick("GET") for _ in range(3)} == {A, B, C}
+
+    def test_peak_ewma_prefers_the_faster_replica(self):
+        clock = FakeClock()
+        balancer = LoadBalancer([A, B], clock=clock)
+        for url, latency in ((A, 0.5), (B, 0.05)):
+            started = balancer.begin(url)
+            clock.now += latency
+            balancer.finish(url, started, "success")
+        assert balancer.pick("GET") == B
+        # Busy enough, the fast replica costs more than the idle slow one.
+        for _ in range(10):
+            balancer.begin(B)
+        assert balancer.pick("GET") == A
+
+    def test_peak_ewma_jumps_up_and_decays_down(self):
+        clock = FakeClock()
+        balancer = LoadBalancer([A], decay=10.0, clock=clock)
+        started = balancer.begin(A)
+        clock.now += 1.0
+        balancer.finish(A, started, "success")
+        assert balancer.state(A).latency == pytest.approx(1.0)
+        clock.now += 10.0
+        started = balancer.begin(A)
+        balancer.finish(A, started, "success")
+        assert 0.3 < balancer.state(A).latency < 0.4  # 1.0 * e^-1
+        started = balancer.begin(A)
+        clock.now += 2.0
+        balancer.finish(A, started, "success")
+        assert balancer.state(A).latency == pytest.approx(2.0)
+
+    def test_down_replicas_are_skipped_until_healthy(self):
+        balancer = LoadBalancer([A, B])
+        balancer.mark_down(B)
+        assert {balancer.pick("GET") for _ in range(4)} == {A}
+        balancer.mark_health(B, True)
+        assert {balancer.pick("GET") for _ in range(4)} == {A, B}
+
+    def test_all_down_still_picks_one(self):
+        balancer = LoadBalancer([A, B])
+        balancer.mark_down(A)
+        balancer.mark_down(B)
+        assert balancer.pick("GET") in (A, B)
+        assert balancer.stats.marked_down == 2
+
+    def test_health_checks_come_due(self):
+        clock = FakeClock()
+        balancer = LoadBalancer([A, B], health_interval=5.0, clock=clock)
+        assert balancer.due_checks() == [A, B]
+        assert balancer.due_checks() == []
+        clock.now = 5.0
+        assert balancer.due_checks() == [A, B]
+
+
+class TestClientBalancing:
+    async def test_reads_spread_and_writes_stay_on_the_primary(self):
+        replicas = Replicas()
+        replicas.delays = {"a": 0.02, "b": 0.02, "c": 0.02}
+        balancer = LoadBalancer([A, B, C], strategy="least_outstanding")
+        client = make_client(replicas, balancer)
+        await asyncio.gather(*(client.get_address() for _ in range(30)))
+        assert [replicas.count(h) for h in "abc"] == [10, 10, 10]
+        for _ in range(3):
+            await client.send_token(to="addr", amount="1")
+        assert replicas.count("a", "POST") == 3
+        assert replicas.count("b", "POST") == replicas.count("c", "POST") == 0
+        assert all(state.outstanding == 0 for state in balancer.states)
+        await client.close()
+
+    async def test_peak_ewma_shifts_reads_off_a_slow_replica(self):
+        replicas = Replicas()
+        replicas.delays = {"a": 0.05, "b": 0.001}
+        balancer = LoadBalancer([A, B])
+        client = make_client(replicas, balancer)
+        for _ in range(20):
+            await client.get_address()
+        assert replicas.count("b") > 15
+        await client.close()
+
+    async def test_read_fails_over_on_connection_error(self):
+        replicas = Replicas()
+        replicas.down.add("a")
+        balancer = LoadBalancer([A, B])
+        client = make_client(replicas, balancer)
+        addresses = [(await client.get_address()).address for _ in range(3)]
+        assert addresses == ["b", "b", "b"]
+        assert balancer.stats.failovers == 1  # a is out of rotation after that
+        assert not balancer.state(A).healthy
+        await client.close()
+
+    async def test_write_does_not_fail_over(self):
+        replicas = Replicas()
+        replicas.down.add("a")
+        balancer = LoadBalancer([A, B])
+        client = make_client(replicas, balancer)
+        with pytest.raises(httpx.ConnectError):
+            await client.send_token(to="addr", amount="1")
+        assert replicas.count("b", "POST") == 0
+        await client.close()
+
+    async def test_every_replica_down_raises(self):
+        replicas = Replicas()
+        replicas.down.update({"a", "b"})
+        client = make_client(replicas, LoadBalancer([A, B]))
+        with pytest.raises(httpx.ConnectError):
+            await client.get_address()
+        await client.close()
+
+    async def test_health_checks_take_replicas_in_and_out(self):
+        replicas = Replicas()
+        replicas.unhealthy.add("b")
+        clock = FakeClock()
+        balancer = LoadBalancer([A, B], health_interval=10.0, clock=clock)
+        client = make_client(replicas, balancer)
+        assert await client.check_health() == {A: True, B: False}
+        for _ in range(4):
+            await client.get_address()
+        assert replicas.count("b") == 0
+        replicas.unhealthy.clear()
+        clock.now = 20.0
+        await client.get_address()  # starts the due checks in the background
+        await asyncio.sleep(0.01)
+        assert balancer.state(B).healthy
+        for _ in range(4):
+            await client.get_address()
+        assert replicas.count("b") > 0
+        await client.close()
+
+    async def test_check_health_deadline(self):
+        replicas = Replicas()
+        replicas.unhealthy.add("b")
+        balancer = LoadBalancer([A, B])
+        client = make_client(replicas, balancer)
+        with pytest.raises(WAIaaSError) as exc:
+            await client.check_health(deadline=time.monotonic() - 1.0)
+        assert exc.value.code == "DEADLINE_EXCEEDED"
+        assert balancer.state(B).healthy  # not marked by a check that never ran
+        assert await client.check_health(timeout=1.0) == {A: True, B: False}
+        await client.close()
+
+    async def test_check_health_needs_a_balancer(self):
+        client = WAIaaSClient("http://test", "wai_sess_test_token")
+        with pytest.raises(ValueError):
+            await client.check_health()
+        await client.close()
@@ -0,0 +1,163 @@
+"""Response cache tests for WAIaaS SDK."""
+
+import asyncio
+
+import httpx
+
+from waiaas.cache import CachePolicy, ResponseCache
+from waiaas.client import WAIaaSClient
+from waiaas.retry import RetryPolicy
+
+from tests.conftest import WALLET_ID, TX_ID
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Daemon:
+    """Stand-in daemon counting hits per path and serving an adjustable balance."""
+
+    def __init__(self) -> None:
+        self.hits: dict[str, int] = {}
+        self.balance = "100"
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.hits[path] = self.hits.get(path, 0) + 1
+        if path == "/v1/wallet/balance":
+            return httpx.Response(
+                200,
+                json={
+                    "walletId": WALLET_ID,
+                    "chain": "solana",
+                    "network": "devnet",
+                    "address": "addr",
+                    "balance": self.balance,
+                    "decimals": 9,
+                    "symbol": "SOL",
+                },
+            )
+        if path == "/v1/transactions/send":
+            return httpx.Response(201, json={"id": TX_ID, "status": "PENDING"})
+        if path == f"/v1/transactions/{TX_ID}":
+            return httpx.Response(
+                200,
+                json={
+                    "id": TX_ID,
+                    "walletId": WALLET_ID,
+                    "type": "TRANSFER",
+                    "status": "CONFIRMED",
+                    "chain": "solana",
+                },
+            )
+        return httpx.Response(404, json={"code": "NOT_FOUND", "message": "Not found"})
+
+
+def make_client(daemon: Daemon, cache: ResponseCache) -> WAIaaSClient:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    return WAIaaSClient(
+        "http://test",
+        "wai_sess_test_token",
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_retries=0),
+        cache=cache,
+    )
+
+
+class TestResponseCache:
+    def test_policy_longest_prefix(self):
+        cache = ResponseCache(
+            policies={"/v1/wallet/": CachePolicy(1.0), "/v1/wallet/balance": CachePolicy(2.0)}
+        )
+        assert cache.policy_for("/v1/wallet/balance").ttl == 2.0
+        assert cache.policy_for("/v1/wallet/assets").ttl == 1.0
+        assert cache.policy_for("/v1/transactions") is None
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        response = httpx.Response(200, json={})
+        cache.set(("/a", (), "t"), response)
+        cache.set(("/b", (), "t"), response)
+        cache.get(("/a", (), "t"))
+        cache.set(("/c", (), "t"), response)
+        assert cache.get(("/b", (), "t")) is None
+        assert cache.get(("/a", (), "t")) is not None
+        assert cache.stats.evictions == 1
+
+    def test_stale_generation_not_stored(self):
+        cache = ResponseCache()
+        generation = cache.generation
+        cache.invalidate("/v1/wallet/balance")
+        cache.set(("/v1/wallet/balance", (), "t"), httpx.Response(200), generation)
+        assert len(cache) == 0
+
+
+class TestClientCache:
+    async def test_fresh_hits_skip_daemon(self):
+        daemon = Daemon()
+        client = make_client(daemon, ResponseCache(clock=FakeClock()))
+        for _ in range(5):
+            assert (await client.get_balance()).balance == "100"
+        assert daemon.hits["/v1/wallet/balance"] == 1
+
+    async def test_uncached_endpoints_always_fetch(self):
+        daemon = Daemon()
+        client = make_client(daemon, ResponseCache(clock=FakeClock()))
+        await client.get_transaction(TX_ID)
+        await client.get_transaction(TX_ID)
+        assert daemon.hits[f"/v1/transactions/{TX_ID}"] == 2
+
+    async def test_stale_while_revalidate(self):
+        daemon = Daemon()
+        clock = FakeClock()
+        cache = ResponseCache(
+            clock=clock,
+            policies={"/v1/wallet/balance": CachePolicy(ttl=5.0, stale_ttl=10.0)},
+        )
+        client = make_client(daemon, cache)
+        await client.get_balance()
+        daemon.balance = "200"
+        clock.now += 6.0
+        # Stale entry served immediately while a refresh runs in the background.
+        assert (await client.get_balance()).balance == "100"
+        await asyncio.gather(*client._background_tasks)
+        assert daemon.hits["/v1/wallet/balance"] == 2
+        assert (await client.get_balance()).balance == "200"
+        assert cache.stats.stale_hits == 1
+
+    async def test_expired_entry_fetches_in_foreground(self):
+        daemon = Daemon()
+        clock = FakeClock()
+        cache = ResponseCache(
+            clock=clock,
+            policies={"/v1/wallet/balance": CachePolicy(ttl=5.0, stale_ttl=10.0)},
+        )
+        client = make_client(daemon, cache)
+        await client.get_balance()
+        daemon.balance = "200"
+        clock.now += 20.0
+        assert (await client.get_balance()).balance == "200"
+
+    async def test_send_token_invalidates_balance(self):
+        daemon = Daemon()
+        client = make_client(daemon, ResponseCache(clock=FakeClock()))
+        await client.get_balance()
+        daemon.balance = "50"
+        await client.send_token(to="addr", amount="50")
+        assert (await client.get_balance()).balance == "50"
+        assert daemon.hits["/v1/wallet/balance"] == 2
+
+    async def test_entries_keyed_by_session_token(self):
+        daemon = Daemon()
+        client = make_client(daemon, ResponseCache(clock=FakeClock()))
+        await client.get_balance()
+        client.set_session_token("wai_sess_other")
+        await client.get_balance()
+        assert daemon.hits["/v1/wallet/balance"] == 2
@@ -0,0 +1,281 @@
+"""Per-network circuit breaker tests for WAIaaS SDK."""
+
+import httpx
+import pytest
+
+from waiaas.circuit import CircuitBreaker
+from waiaas.client import WAIaaSClient
+from waiaas.errors import WAIaaSError
+from waiaas.retry import RetryPolicy
+
+from tests.conftest import WALLET_ID
+
+KEY = ("/v1/wallet/balance", "polygon-mainnet")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ChainDaemon:
+    """Stand-in whose balance/assets calls fail on the networks in ``down``."""
+
+    networks = ["ethereum-mainnet", "polygon-mainnet", "base-mainnet"]
+
+    def __init__(self) -> None:
+        self.down: set[str] = set()
+        self.timeouts: set[str] = set()
+        self.calls: list[str] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        network = request.url.params.get("network", "ethereum-mainnet")
+        self.calls.append(network)
+        if network in self.timeouts:
+            raise httpx.ReadTimeout("RPC hung", request=request)
+        if request.url.path == "/v1/wallet/assets":
+            if network == "all":
+                return httpx.Response(
+                    200,
+                    json={
+                        "walletId": WALLET_ID,
+                        "chain": "ethereum",
+                        "environment": "mainnet",
+                        "networkAssets": [
+                            {"network": n, "error": "RPC timeout"}
+                            if n in self.down
+                            else {"network": n, "assets": []}
+                            for n in self.networks
+                        ],
+                    },
+                )
+            return httpx.Response(
+                200,
+                json={"walletId": WALLET_ID, "chain": "ethereum", "network": network, "assets": []},
+            )
+        if network == "all":
+            return httpx.Response(
+                200,
+                json={
+                    "walletId": WALLET_ID,
+                    "chain": "ethereum",
+                    "environment": "mainnet",
+                    "balances": [
+                        {"network": n, "error": "RPC timeout"}
+                        if n in self.down
+                        else {"network": n, "balance": "1", "decimals": 18, "symbol": "ETH"}
+                        for n in self.networks
+                    ],
+                },
+            )
+        if network in self.down:
+            return httpx.Response(
+                502,
+                json={"code": "CHAIN_ERROR", "message": "Blockchain RPC error", "retryable": True},
+            )
+        return httpx.Response(
+            200,
+            json={
+                "walletId": WALLET_ID,
+                "chain": "ethereum",
+                "network": network,
+                "address": "0xabc",
+                "balance": "1",
+                "decimals": 18,
+                "symbol": "ETH",
+            },
+        )
+
+
+def make_client(daemon: ChainDaemon, breaker: CircuitBreaker) -> WAIaaSClient:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    return WAIaaSClient(
+        "http://test",
+        "wai_sess_test_token",
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_retries=5, base_delay=0.001),
+        circuit_breaker=breaker,
+    )
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, clock=FakeClock())
+        for _ in range(2):
+            breaker.before_call(KEY)
+            breaker.record_failure(KEY)
+        assert breaker.state(KEY) == "closed"
+        breaker.before_call(KEY)
+        breaker.record_failure(KEY)
+        assert breaker.state(KEY) == "open"
+        assert breaker.stats.opened == 1
+
+    def test_success_resets_the_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        breaker.record_failure(KEY)
+        breaker.record_success(KEY)
+        breaker.record_failure(KEY)
+        assert breaker.state(KEY) == "closed"
+
+    def test_open_circuit_fails_fast(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0, clock=clock)
+        breaker.record_failure(KEY)
+        clock.now = 10.0
+        with pytest.raises(WAIaaSError) as exc:
+            breaker.before_call(KEY)
+        assert exc.value.code == "CIRCUIT_OPEN"
+        assert exc.value.retryable is False
+        assert exc.value.retry_after == pytest.approx(20.0)
+        assert exc.value.details["network"] == "polygon-mainnet"
+        assert breaker.stats.rejected == 1
+
+    def test_half_open_admits_one_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0, clock=clock)
+        breaker.record_failure(KEY)
+        clock.now = 30.0
+        assert breaker.state(KEY) == "half_open"
+        breaker.before_call(KEY)
+        with pytest.raises(WAIaaSError):
+            breaker.before_call(KEY)
+        breaker.record_success(KEY)
+        assert breaker.state(KEY) == "closed"
+        assert breaker.stats.probes == 1
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30.0, clock=clock)
+        for _ in range(3):
+            breaker.record_failure(KEY)
+        clock.now = 40.0
+        breaker.before_call(KEY)
+        breaker.record_failure(KEY)
+        assert breaker.state(KEY) == "open"
+        clock.now = 60.0
+        with pytest.raises(WAIaaSError) as exc:
+            breaker.before_call(KEY)
+        assert exc.value.retry_after == pytest.approx(10.0)
+
+    def test_client_errors_release_the_probe_without_closing(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=1.0, clock=clock)
+        breaker.record_failure(KEY)
+        clock.now = 1.0
+        breaker.before_call(KEY)
+        breaker.record_status(KEY, 404)
+        assert breaker.state(KEY) == "half_open"
+        breaker.before_call(KEY)  # slot free again
+
+    def test_record_networks(self):
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+        breaker.record_networks(
+            "/v1/wallet/balance", {"polygon-mainnet": "RPC timeout", "base-mainnet": None}
+        )
+        assert breaker.state(KEY) == "open"
+        assert breaker.state(("/v1/wallet/balance", "base-mainnet")) == "closed"
+        assert breaker.state(("/v1/wallet/assets", "polygon-mainnet")) == "closed"
+
+    def test_only_guards_configured_gets(self):
+        breaker = CircuitBreaker()
+        assert breaker.key_for("GET", "/v1/wallet/balance", None) == ("/v1/wallet/balance", None)
+        assert breaker.key_for("GET", "/v1/wallet/address", None) is None
+        assert breaker.key_for("POST", "/v1/wallet/balance", None) is None
+
+
+class TestClientCircuitBreaker:
+    async def test_dead_network_stops_retrying_and_fails_fast(self):
+        daemon = ChainDaemon()
+        daemon.down.add("polygon-mainnet")
+        client = make_client(daemon, CircuitBreaker(failure_threshold=3))
+        with pytest.raises(WAIaaSError) as exc:
+            await client.get_balance(network="polygon-mainnet")
+        # Three 502s open the circuit and cut the remaining retries short.
+        assert exc.value.code == "CIRCUIT_OPEN"
+        assert daemon.calls == ["polygon-mainnet"] * 3
+        with pytest.raises(WAIaaSError) as exc:
+            await client.get_balance(network="polygon-mainnet")
+        assert exc.value.code == "CIRCUIT_OPEN"
+        assert len(daemon.calls) == 3
+        balance = await client.get_balance(network="base-mainnet")
+        assert balance.network == "base-mainnet"
+        await client.close()
+
+    async def test_transport_errors_count_as_failures(self):
+        daemon = ChainDaemon()
+        daemon.timeouts.add("polygon-mainnet")
+        breaker = CircuitBreaker(failure_threshold=2)
+        client = make_client(daemon, breaker)
+        for _ in range(2):
+            with pytest.raises(httpx.ReadTimeout):
+                await client.get_balance(network="polygon-mainnet")
+        with pytest.raises(WAIaaSError) as exc:
+            await client.get_balance(network="polygon-mainnet")
+        assert exc.value.code == "CIRCUIT_OPEN"
+        await client.close()
+
+    async def test_learns_from_network_all_errors(self):
+        daemon = ChainDaemon()
+        daemon.down.add("polygon-mainnet")
+        client = make_client(daemon, CircuitBreaker(failure_threshold=2))
+        await client.get_all_balances()
+        await client.get_all_balances()
+        daemon.calls.clear()
+        with pytest.raises(WAIaaSError) as exc:
+            await client.get_balance(network="polygon-mainnet")
+        assert exc.value.code == "CIRCUIT_OPEN"
+        assert daemon.calls == []
+        await client.close()
+
+    async def test_network_all_fans_out_around_open_circuits(self):
+        daemon = ChainDaemon()
+        daemon.down.add("polygon-mainnet")
+        client = make_client(daemon, CircuitBreaker(failure_threshold=1))
+        await client.get_all_balances()
+        daemon.calls.clear()
+        result = await client.get_all_balances()
+        assert "all" not in daemon.calls
+        assert sorted(daemon.calls) == ["base-mainnet", "ethereum-mainnet"]
+        by_network = {b.network: b for b in result.balances}
+        assert [b.network for b in result.balances] == ChainDaemon.networks
+        assert "Circuit open" in by_network["polygon-mainnet"].error
+        assert by_network["base-mainnet"].balance == "1"
+        assert result.wallet_id == WALLET_ID
+        await client.close()
+
+    async def test_assets_fan_out_and_recover(self):
+        clock = FakeClock()
+        daemon = ChainDaemon()
+        daemon.down.add("polygon-mainnet")
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0, clock=clock)
+        client = make_client(daemon, breaker)
+        await client.get_all_assets()
+        daemon.down.clear()
+        clock.now = 30.0
+        daemon.calls.clear()
+        result = await client.get_all_assets()
+        # The half-open probe for polygon goes out with the per-network calls ...
+        assert sorted(daemon.calls) == sorted(ChainDaemon.networks)
+        assert all(n.error is None for n in result.network_assets)
+        # ... and once it succeeds network=all is used again.
+        daemon.calls.clear()
+        await client.get_all_assets()
+        assert daemon.calls == ["all"]
+        await client.close()
+
+    async def test_without_breaker_network_all_is_unchanged(self):
+        daemon = ChainDaemon()
+        daemon.down.add("polygon-mainnet")
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+        )
+        client = WAIaaSClient("http://test", "wai_sess_test_token", http_client=http_client)
+        for _ in range(3):
+            await client.get_all_balances()
+        assert daemon.calls == ["all"] * 3
+        await client.close()
@@ -0,0 +1,212 @@
+"""Adaptive concurrency limiter tests for WAIaaS SDK."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from waiaas.client import WAIaaSClient
+from waiaas.concurrency import AdaptiveConcurrency
+from waiaas.errors import WAIaaSError
+from waiaas.retry import RetryPolicy
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAdaptiveConcurrency:
+    async def test_queues_calls_over_the_limit(self):
+        limiter = AdaptiveConcurrency(initial_limit=2, clock=FakeClock())
+        a = await limiter.acquire()
+        await limiter.acquire()
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiting.done()
+        assert limiter.queue_depth == 1
+        limiter.release(a, "ignored")
+        await waiting
+        assert limiter.in_flight == 2
+        assert limiter.queue_depth == 0
+        assert limiter.stats.queued == 1
+
+    async def test_waiters_are_served_in_order(self):
+        limiter = AdaptiveConcurrency(initial_limit=1, clock=FakeClock())
+        first = await limiter.acquire()
+        order: list[int] = []
+
+        async def call(i: int) -> None:
+            started = await limiter.acquire()
+            order.append(i)
+            limiter.release(started, "ignored")
+
+        tasks = [asyncio.ensure_future(call(i)) for i in range(5)]
+        await asyncio.sleep(0)
+        limiter.release(first, "ignored")
+        await asyncio.gather(*tasks)
+        assert order == [0, 1, 2, 3, 4]
+
+    async def test_wait_time_is_recorded(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrency(initial_limit=1, clock=clock)
+        first = await limiter.acquire()
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        clock.now = 2.0
+        limiter.release(first, "ignored")
+        await waiting
+        assert limiter.stats.total_wait == pytest.approx(2.0)
+        assert limiter.mean_wait == pytest.approx(1.0)
+
+    async def test_grows_additively_while_latency_is_flat(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrency(initial_limit=4, clock=clock)
+        limits = []
+        for _ in range(10):  # full rounds at the limit
+            starts = [await limiter.acquire() for _ in range(limiter.limit)]
+            clock.now += 0.1
+            for started in starts:
+                limiter.release(started, "success")
+            limits.append(limiter.limit)
+        assert limits == sorted(limits)
+        assert 8 <= limiter.limit <= 14
+        assert limiter.stats.decreases == 0
+
+    async def test_does_not_grow_when_underused(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrency(initial_limit=4, clock=clock)
+        for _ in range(50):
+            started = await limiter.acquire()
+            clock.now += 0.1
+            limiter.release(started, "success")
+        assert limiter.limit == 4
+
+    async def test_overload_cuts_once_per_round_trip(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrency(initial_limit=10, backoff=0.5, clock=clock)
+        starts = [await limiter.acquire() for _ in range(10)]
+        clock.now = 1.0
+        for started in starts:
+            limiter.release(started, "dropped")
+        assert limiter.limit == 5
+        assert limiter.stats.decreases == 1
+        # A request sent after the cut can cut again.
+        started = await limiter.acquire()
+        clock.now = 2.0
+        limiter.release(started, "dropped")
+        assert limiter.limit == 2
+
+    async def test_latency_spike_cuts_the_limit(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrency(initial_limit=10, backoff=0.5, clock=clock)
+        started = await limiter.acquire()
+        clock.now += 0.1
+        limiter.release(started, "success")
+        assert limiter.baseline_latency == pytest.approx(0.1)
+        started = await limiter.acquire()
+        clock.now += 0.5
+        limiter.release(started, "success")
+        assert limiter.limit == 5
+
+    async def test_respects_min_and_max(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrency(initial_limit=2, min_limit=2, max_limit=3, clock=clock)
+        started = await limiter.acquire()
+        limiter.release(started, "dropped")
+        assert limiter.limit == 2
+        for _ in range(20):
+            starts = [await limiter.acquire() for _ in range(limiter.limit)]
+            clock.now += 0.1
+            for s in starts:
+                limiter.release(s, "success")
+        assert limiter.limit == 3
+
+    async def test_cancelled_waiter_does_not_leak_a_slot(self):
+        limiter = AdaptiveConcurrency(initial_limit=1, clock=FakeClock())
+        first = await limiter.acquire()
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert limiter.queue_depth == 0
+        limiter.release(first, "ignored")
+        assert limiter.in_flight == 0
+        await limiter.acquire()
+        assert limiter.in_flight == 1
+
+
+class CapacityDaemon:
+    """Stand-in that slows down in proportion to load beyond ``capacity``."""
+
+    def __init__(self, capacity: int, latency: float = 0.005, reject_above: int = 0) -> None:
+        self.capacity = capacity
+        self.latency = latency
+        self.reject_above = reject_above
+        self.in_flight = 0
+        self.peak = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if self.reject_above and self.in_flight >= self.reject_above:
+            return httpx.Response(
+                503, json={"code": "SERVICE_UNAVAILABLE", "message": "busy", "retryable": True}
+            )
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency * max(1.0, self.in_flight / self.capacity))
+        finally:
+            self.in_flight -= 1
+        return httpx.Response(
+            200,
+            json={
+                "walletId": "w",
+                "chain": "solana",
+                "network": "devnet",
+                "address": "addr",
+            },
+        )
+
+
+def make_client(daemon: CapacityDaemon, limiter: AdaptiveConcurrency) -> WAIaaSClient:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    return WAIaaSClient(
+        "http://test",
+        "wai_sess_test_token",
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_retries=0),
+        concurrency=limiter,
+    )
+
+
+class TestClientConcurrency:
+    async def test_bounds_load_on_a_saturated_daemon(self):
+        daemon = CapacityDaemon(capacity=8)
+        limiter = AdaptiveConcurrency(initial_limit=2)
+        client = make_client(daemon, limiter)
+        await asyncio.gather(*(client.get_address() for _ in range(300)))
+        # Grew past the initial limit, but well short of firing all 300.
+        assert limiter.stats.increases > 0
+        assert 2 < limiter.limit < 100
+        assert daemon.peak < 100
+        assert limiter.in_flight == 0
+        assert limiter.stats.queued > 0
+        await client.close()
+
+    async def test_503_responses_cut_the_limit(self):
+        daemon = CapacityDaemon(capacity=100, reject_above=4)
+        limiter = AdaptiveConcurrency(initial_limit=32)
+        client = make_client(daemon, limiter)
+        results = await asyncio.gather(
+            *(client.get_address() for _ in range(64)), return_exceptions=True
+        )
+        assert any(isinstance(r, WAIaaSError) and r.status_code == 503 for r in results)
+        assert limiter.limit < 32
+        assert limiter.stats.decreases > 0
+        await client.close()
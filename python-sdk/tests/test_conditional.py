@@ -0,0 +1,122 @@
+"""Conditional GET (ETag / Last-Modified) tests for WAIaaS SDK."""
+
+import hashlib
+import json
+
+import httpx
+
+from waiaas.client import WAIaaSClient
+from waiaas.conditional import ValidatorCache, conditional_headers
+from waiaas.retry import RetryPolicy
+
+from tests.conftest import WALLET_ID
+
+
+def assets_body(balance: str) -> dict:
+    return {
+        "walletId": WALLET_ID,
+        "chain": "ethereum",
+        "environment": "mainnet",
+        "networkAssets": [
+            {
+                "network": "ethereum-mainnet",
+                "assets": [
+                    {
+                        "mint": "0x0",
+                        "symbol": "ETH",
+                        "name": "Ether",
+                        "balance": balance,
+                        "decimals": 18,
+                        "isNative": True,
+                    }
+                ],
+            }
+        ],
+    }
+
+
+class EtagDaemon:
+    """Stand-in daemon answering GETs with ETags and honoring If-None-Match."""
+
+    def __init__(self) -> None:
+        self.balance = "1"
+        self.requests: list[httpx.Request] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        body = json.dumps(assets_body(self.balance)).encode()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(
+            200,
+            content=body,
+            headers={"ETag": etag, "Content-Type": "application/json"},
+        )
+
+
+def make_client(daemon: EtagDaemon, validator_cache: ValidatorCache) -> WAIaaSClient:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    return WAIaaSClient(
+        "http://test",
+        "wai_sess_test_token",
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_retries=0),
+        validator_cache=validator_cache,
+    )
+
+
+class TestConditionalHeaders:
+    def test_builds_both_validators(self):
+        response = httpx.Response(
+            200,
+            headers={"ETag": '"abc"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+        assert conditional_headers(response) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+
+    def test_responses_without_validators_not_stored(self):
+        cache = ValidatorCache()
+        cache.store("k", httpx.Response(200, json={}))
+        assert len(cache) == 0
+
+
+class TestClientConditionalGet:
+    async def test_first_request_is_unconditional(self):
+        daemon = EtagDaemon()
+        client = make_client(daemon, ValidatorCache())
+        await client.get_all_assets()
+        assert "if-none-match" not in daemon.requests[0].headers
+
+    async def test_304_reuses_parsed_model(self):
+        daemon = EtagDaemon()
+        cache = ValidatorCache()
+        client = make_client(daemon, cache)
+        first = await client.get_all_assets()
+        second = await client.get_all_assets()
+        assert daemon.requests[1].headers["if-none-match"].startswith('"')
+        assert second is first
+        assert cache.stats.not_modified == 1
+        assert cache.stats.bytes_saved > 0
+
+    async def test_changed_resource_refetched(self):
+        daemon = EtagDaemon()
+        client = make_client(daemon, ValidatorCache())
+        await client.get_all_assets()
+        daemon.balance = "2"
+        result = await client.get_all_assets()
+        assert result.network_assets[0].assets[0].balance == "2"
+
+    async def test_validators_keyed_by_session_token(self):
+        daemon = EtagDaemon()
+        cache = ValidatorCache()
+        client = make_client(daemon, cache)
+        await client.get_all_assets()
+        client.set_session_token("wai_sess_other")
+        await client.get_all_assets()
+        assert "if-none-match" not in daemon.requests[1].headers
+        assert len(cache) == 2
@@ -0,0 +1,226 @@
+"""Deadline tests for WAIaaS SDK."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from waiaas.client import WAIaaSClient
+from waiaas.deadline import current_deadline, deadline_scope, remaining, resolve_deadline
+from waiaas.errors import WAIaaSError
+from waiaas.retry import RetryPolicy, with_retry
+
+ADDRESS = {"walletId": "w", "chain": "solana", "network": "devnet", "address": "addr"}
+
+
+class SlowDaemon:
+    """Stand-in answering after ``delays[path]`` seconds, or with ``errors[path]``."""
+
+    def __init__(self) -> None:
+        self.delays: dict[str, float] = {}
+        self.errors: dict[str, httpx.Response] = {}
+        self.requests = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        await asyncio.sleep(self.delays.get(request.url.path, 0.0))
+        error = self.errors.get(request.url.path)
+        if error is not None:
+            return error
+        return httpx.Response(200, json=ADDRESS)
+
+
+def make_client(daemon: SlowDaemon, **kwargs) -> WAIaaSClient:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    return WAIaaSClient("http://test", "wai_sess_test_token", http_client=http_client, **kwargs)
+
+
+class TestDeadlineScope:
+    def test_no_deadline_by_default(self):
+        assert current_deadline() is None
+        assert remaining() is None
+        assert resolve_deadline() is None
+
+    def test_scope_sets_and_restores(self):
+        with deadline_scope(10.0) as deadline:
+            assert current_deadline() == deadline
+            assert 9.0 < remaining() <= 10.0
+        assert current_deadline() is None
+
+    def test_nested_scopes_only_tighten(self):
+        with deadline_scope(1.0) as outer:
+            with deadline_scope(60.0) as inner:
+                assert inner == outer
+            with deadline_scope(0.5) as inner:
+                assert inner < outer
+
+    def test_earliest_of_timeout_and_deadline_wins(self):
+        now = time.monotonic()
+        assert resolve_deadline(5.0, now + 1.0) == now + 1.0
+        assert resolve_deadline(1.0, now + 60.0) < now + 2.0
+
+    async def test_tasks_inherit_the_scope(self):
+        with deadline_scope(5.0) as deadline:
+            seen = await asyncio.gather(*(asyncio.ensure_future(self._read()) for _ in range(3)))
+        assert seen == [deadline] * 3
+
+    @staticmethod
+    async def _read():
+        return current_deadline()
+
+
+class TestCallDeadlines:
+    async def test_timeout_bounds_a_slow_call(self):
+        daemon = SlowDaemon()
+        daemon.delays["/v1/wallet/address"] = 5.0
+        client = make_client(daemon)
+        start = time.monotonic()
+        with pytest.raises(WAIaaSError) as exc:
+            await client.get_address(timeout=0.05)
+        assert exc.value.code == "DEADLINE_EXCEEDED"
+        assert time.monotonic() - start < 1.0
+        await client.close()
+
+    async def test_timeout_bounds_send_token(self):
+        daemon = SlowDaemon()
+        daemon.delays["/v1/transactions/send"] = 0.3
+        client = make_client(daemon)
+        with pytest.raises(WAIaaSError) as exc:
+            await client.send_token(to="addr", amount="1", timeout=0.05)
+        assert exc.value.code == "DEADLINE_EXCEEDED"
+        with pytest.raises(WAIaaSError) as exc:
+            await client.send_token(to="addr", amount="1", deadline=time.monotonic() - 1.0)
+        assert exc.value.code == "DEADLINE_EXCEEDED"
+        assert daemon.requests == 1
+        await client.close()
+
+    async def test_expired_deadline_sends_nothing(self):
+        daemon = SlowDaemon()
+        client = make_client(daemon)
+        with pytest.raises(WAIaaSError) as exc:
+            await client.get_address(deadline=time.monotonic() - 1.0)
+        assert exc.value.code == "DEADLINE_EXCEEDED"
+        assert daemon.requests == 0
+        await client.close()
+
+    async def test_scope_bounds_a_whole_step(self):
+        daemon = SlowDaemon()
+        daemon.delays["/v1/wallet/address"] = 0.06
+        client = make_client(daemon)
+        with deadline_scope(0.1):
+            await client.get_address()
+            with pytest.raises(WAIaaSError) as exc:
+                await client.get_address()
+        assert exc.value.code == "DEADLINE_EXCEEDED"
+        # Outside the scope the same call has all the time it needs.
+        await client.get_address()
+        await client.close()
+
+    async def test_per_call_timeout_cannot_extend_the_scope(self):
+        daemon = SlowDaemon()
+        daemon.delays["/v1/wallet/address"] = 0.2
+        client = make_client(daemon)
+        with deadline_scope(0.05):
+            with pytest.raises(WAIaaSError) as exc:
+                await client.get_address(timeout=10.0)
+        assert exc.value.code == "DEADLINE_EXCEEDED"
+        await client.close()
+
+    async def test_retry_that_cannot_finish_in_time_is_skipped(self):
+        daemon = SlowDaemon()
+        daemon.errors["/v1/wallet/address"] = httpx.Response(
+            503,
+            json={"code": "SERVICE_UNAVAILABLE", "message": "busy", "retryable": True},
+            headers={"Retry-After": "5"},
+        )
+        client = make_client(daemon, retry_policy=RetryPolicy(max_retries=3))
+        start = time.monotonic()
+        with pytest.raises(WAIaaSError) as exc:
+            await client.get_address(timeout=1.0)
+        assert exc.value.code == "DEADLINE_EXCEEDED"
+        assert exc.value.__cause__.status_code == 503
+        assert time.monotonic() - start < 0.5
+        assert daemon.requests == 1
+        await client.close()
+
+    async def test_retries_within_the_deadline_still_happen(self):
+        calls = 0
+
+        async def flaky(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return httpx.Response(502, json={"code": "BAD_GATEWAY", "message": "x", "retryable": True})
+            return httpx.Response(200, json=ADDRESS)
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(flaky), base_url="http://test")
+        client = WAIaaSClient(
+            "http://test",
+            "wai_sess_test_token",
+            http_client=http_client,
+            retry_policy=RetryPolicy(max_retries=3, base_delay=0.01),
+        )
+        address = await client.get_address(timeout=1.0)
+        assert address.address == "addr"
+        assert calls == 2
+        await client.close()
+
+    async def test_wallet_info_shares_one_deadline(self):
+        daemon = SlowDaemon()
+        daemon.delays["/v1/wallet/address"] = 0.06
+        daemon.delays["/v1/wallets/w/networks"] = 0.06
+        client = make_client(daemon)
+        with pytest.raises(WAIaaSError) as exc:
+            await client.get_wallet_info(timeout=0.1)
+        assert exc.value.code == "DEADLINE_EXCEEDED"
+        await client.close()
+
+    async def test_timeout_bounds_a_whole_iteration(self):
+        pages = 0
+
+        async def endless(request: httpx.Request) -> httpx.Response:
+            nonlocal pages
+            pages += 1
+            await asyncio.sleep(0.03)
+            item = {
+                "id": f"tx-{pages}",
+                "walletId": "w",
+                "type": "TRANSFER",
+                "status": "CONFIRMED",
+                "chain": "solana",
+            }
+            return httpx.Response(200, json={"items": [item], "cursor": str(pages), "hasMore": True})
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(endless), base_url="http://test")
+        client = WAIaaSClient("http://test", "wai_sess_test_token", http_client=http_client)
+        seen = []
+        with pytest.raises(WAIaaSError) as exc:
+            async for tx in client.iter_transactions(prefetch=0, timeout=0.1):
+                seen.append(tx.id)
+        assert exc.value.code == "DEADLINE_EXCEEDED"
+        assert 1 <= len(seen) <= 4
+        await client.close()
+
+
+class TestWithRetryDeadline:
+    async def test_no_sleep_past_the_deadline(self):
+        class Busy(Exception):
+            status_code = 503
+            retryable = True
+
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            raise Busy()
+
+        policy = RetryPolicy(max_retries=3, base_delay=10.0)
+        with pytest.raises(WAIaaSError) as exc:
+            await with_retry(fn, policy, deadline=time.monotonic() + 1.0)
+        assert exc.value.code == "DEADLINE_EXCEEDED"
+        assert isinstance(exc.value.__cause__, Busy)
+        assert calls == 1
@@ -0,0 +1,182 @@
+"""JSON decoding helper tests for WAIaaS SDK."""
+
+import json
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from waiaas import decoding
+from waiaas.client import WAIaaSClient
+from waiaas.decoding import decode, loads, type_adapter, validate_json
+from waiaas.models import (
+    AssetInfo,
+    MultiNetworkAssetsResponse,
+    TransactionDetail,
+    TransactionList,
+)
+from waiaas.retry import RetryPolicy
+
+from tests.conftest import WALLET_ID, TX_ID
+
+TX = {
+    "id": TX_ID,
+    "walletId": WALLET_ID,
+    "type": "TRANSFER",
+    "status": "CONFIRMED",
+    "chain": "solana",
+}
+
+
+class TestLoads:
+    def test_decodes_bytes_and_str(self):
+        assert loads(b'{"a": 1}') == {"a": 1}
+        assert loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_stdlib_fallback_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(decoding, "orjson", None)
+        assert loads(b'{"a": null}') == {"a": None}
+
+    def test_invalid_json_raises_value_error(self):
+        with pytest.raises(ValueError):
+            loads(b"not json")
+
+
+class TestValidateJson:
+    def test_validates_model_from_bytes(self):
+        raw = json.dumps({"items": [TX], "cursor": None, "hasMore": False}).encode()
+        result = validate_json(raw, TransactionList)
+        assert isinstance(result, TransactionList)
+        assert result.items[0].wallet_id == WALLET_ID
+
+    def test_validates_non_model_types(self):
+        raw = json.dumps([TX, TX]).encode()
+        result = validate_json(raw, list[TransactionDetail])
+        assert [tx.id for tx in result] == [TX_ID, TX_ID]
+
+    def test_type_adapters_are_cached(self):
+        assert type_adapter(TransactionDetail) is type_adapter(TransactionDetail)
+
+    def test_invalid_payload_raises_validation_error(self):
+        with pytest.raises(ValidationError):
+            validate_json(b'{"id": 1}', TransactionDetail)
+
+
+class TestDecodeModes:
+    PAYLOAD = {
+        "items": [
+            {**TX, "createdAt": "not-a-timestamp"},
+            {"id": "broken", "type": "TRANSFER", "status": "FAILED", "chain": "solana"},
+            TX,
+        ],
+        "cursor": None,
+        "hasMore": False,
+        "unknownField": 1,
+    }
+
+    def test_strict_raises_on_mismatch(self):
+        with pytest.raises(ValidationError):
+            decode(b'{"items": [], "hasMore": "maybe"}', TransactionList, "strict")
+
+    def test_strict_does_not_coerce(self):
+        raw = json.dumps({**TX, "createdAt": "1700000000"})
+        with pytest.raises(ValidationError):
+            decode(raw, TransactionDetail, "strict")
+        assert decode(raw, TransactionDetail, "lenient").created_at == 1_700_000_000
+
+    def test_strict_raises_on_malformed_item(self):
+        with pytest.raises(ValidationError):
+            decode(json.dumps(self.PAYLOAD), TransactionList, "strict")
+
+    def test_lenient_coerces_and_ignores_unknown_fields(self):
+        raw = json.dumps({**TX, "createdAt": "1700000000", "unknownField": 1})
+        result = decode(raw, TransactionDetail, "lenient")
+        assert result.created_at == 1_700_000_000
+        assert not hasattr(result, "unknownField")
+
+    def test_lenient_raises_on_what_cannot_be_coerced(self):
+        with pytest.raises(ValidationError):
+            decode(json.dumps({**TX, "createdAt": "not-a-timestamp"}), TransactionDetail, "lenient")
+
+    def test_construct_builds_nested_models_without_validation(self):
+        result = decode(json.dumps(self.PAYLOAD), TransactionList, "construct")
+        assert isinstance(result, TransactionList)
+        assert isinstance(result.items[0], TransactionDetail)
+        assert result.items[0].wallet_id == WALLET_ID
+        assert result.items[0].created_at == "not-a-timestamp"
+        assert result.has_more is False
+        assert result.items[2].tier is None  # defaults still applied
+
+    def test_construct_falls_back_to_model_construct_only_on_failure(self):
+        raw = json.dumps({**TX, "createdAt": "1700000000"})
+        assert decode(raw, TransactionDetail, "construct").created_at == 1_700_000_000
+        raw = json.dumps({**TX, "createdAt": "later"})
+        result = decode(raw, TransactionDetail, "construct")
+        assert result.created_at == "later"
+        assert result.model_fields_set == {"id", "wallet_id", "type", "status", "chain", "created_at"}
+
+    def test_construct_handles_optional_nested_lists(self):
+        raw = json.dumps(
+            {
+                "walletId": WALLET_ID,
+                "chain": "ethereum",
+                "environment": "mainnet",
+                "networkAssets": [
+                    {"network": "base-mainnet", "error": "RPC timeout"},
+                    {
+                        "network": "ethereum-mainnet",
+                        "assets": [
+                            {
+                                "mint": "0x0",
+                                "symbol": "ETH",
+                                "name": "Ether",
+                                "balance": "1",
+                                "decimals": 18,
+                                "isNative": True,
+                            }
+                        ],
+                    },
+                ],
+            }
+        )
+        result = decode(raw, MultiNetworkAssetsResponse, "construct")
+        assert result.network_assets[0].assets is None
+        assert isinstance(result.network_assets[1].assets[0], AssetInfo)
+        assert result.network_assets[1].assets[0].is_native is True
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            decode(b"{}", TransactionList, "fast")  # type: ignore[arg-type]
+
+
+class TestClientValidationMode:
+    def make_client(self, **kwargs) -> WAIaaSClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={**TX, "createdAt": "later"})
+
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="http://test"
+        )
+        return WAIaaSClient(
+            "http://test",
+            "wai_sess_test_token",
+            http_client=http_client,
+            retry_policy=RetryPolicy(max_retries=0),
+            **kwargs,
+        )
+
+    async def test_client_level_mode(self):
+        client = self.make_client(validation="construct")
+        result = await client.get_transaction(TX_ID)
+        assert result.created_at == "later"
+
+    async def test_per_call_override(self):
+        client = self.make_client()
+        with pytest.raises(ValidationError):
+            await client.get_transaction(TX_ID)
+        result = await client.get_transaction(TX_ID, validation="construct")
+        assert result.created_at == "later"
+
+    def test_invalid_client_mode_rejected(self):
+        with pytest.raises(ValueError):
+            self.make_client(validation="fast")
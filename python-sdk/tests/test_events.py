@@ -0,0 +1,262 @@
+"""Webhook event receiver tests for WAIaaS SDK."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from waiaas.client import WAIaaSClient
+from waiaas.errors import WAIaaSError
+from waiaas.events import EventReceiver, sign, verify_signature
+from waiaas.models import WebhookEvent
+
+SECRET = "ab" * 32
+NOW = 1_700_000_000
+
+
+def delivery(event: str = "TX_CONFIRMED", event_id: str = "d-1", **data) -> bytes:
+    return json.dumps(
+        {"id": event_id, "event": event, "timestamp": NOW, "data": data}
+    ).encode()
+
+
+def signed(body: bytes, secret: str = SECRET) -> dict[str, str]:
+    return {"x-waiaas-signature": sign(secret, body), "x-waiaas-event": "TX_CONFIRMED"}
+
+
+def make_receiver(**kwargs) -> EventReceiver:
+    return EventReceiver([SECRET], clock=lambda: NOW + 1, **kwargs)
+
+
+class TestSignatures:
+    def test_matches_the_daemon_format(self):
+        # createHmac('sha256', 'key').update(body).digest('hex'), prefixed
+        body = b"The quick brown fox jumps over the lazy dog"
+        assert sign("key", body) == (
+            "sha256=f7bc83f430538424b13298e6aa6fb143ef4d59a14946175997479dbc2d1a3cd8"
+        )
+        assert verify_signature([SECRET], b"{}", sign(SECRET, b"{}"))
+
+    def test_rejects_other_secrets_and_bodies(self):
+        signature = sign(SECRET, b"{}")
+        assert not verify_signature(["other"], b"{}", signature)
+        assert not verify_signature([SECRET], b"{ }", signature)
+        assert not verify_signature([], b"{}", signature)
+        assert verify_signature(["other", SECRET], b"{}", signature)
+
+
+class TestHandle:
+    async def test_accepts_and_dispatches(self):
+        receiver = make_receiver()
+        seen: list[WebhookEvent] = []
+
+        async def on_confirmed(event: WebhookEvent) -> None:
+            seen.append(event)
+
+        receiver.subscribe("TX_CONFIRMED", on_confirmed)
+        body = delivery(txId="tx-1", walletId="w")
+        assert await receiver.handle(body, signed(body)) == 200
+        await asyncio.sleep(0)
+        assert [(e.event, e.tx_id, e.wallet_id) for e in seen] == [("TX_CONFIRMED", "tx-1", "w")]
+
+    async def test_bad_signature_is_refused(self):
+        receiver = make_receiver()
+        body = delivery()
+        assert await receiver.handle(body, signed(body, "forged")) == 401
+        assert await receiver.handle(body, {}) == 401
+        assert receiver.stats.rejected == 2
+
+    async def test_malformed_and_stale_deliveries_are_refused(self):
+        receiver = EventReceiver([SECRET], clock=lambda: NOW + 3600)
+        stale = delivery()
+        assert await receiver.handle(stale, signed(stale)) == 400
+        garbage = b'{"event": 1}'
+        assert await receiver.handle(garbage, signed(garbage)) == 400
+
+    async def test_redeliveries_are_dispatched_once(self):
+        receiver = make_receiver()
+        calls = 0
+
+        async def handler(event: WebhookEvent) -> None:
+            nonlocal calls
+            calls += 1
+
+        receiver.subscribe(None, handler)
+        body = delivery(txId="tx-1")
+        for _ in range(3):
+            assert await receiver.handle(body, signed(body)) == 200
+        await asyncio.sleep(0)
+        assert calls == 1
+        assert receiver.stats.duplicates == 2
+
+    async def test_failing_subscriber_is_counted_not_raised(self):
+        receiver = make_receiver()
+
+        async def broken(event: WebhookEvent) -> None:
+            raise RuntimeError("boom")
+
+        receiver.subscribe("TX_CONFIRMED", broken)
+        body = delivery()
+        assert await receiver.handle(body, signed(body)) == 200
+        await asyncio.sleep(0)
+        assert receiver.stats.handler_errors == 1
+
+    async def test_unsubscribe(self):
+        receiver = make_receiver()
+        seen = []
+
+        async def handler(event: WebhookEvent) -> None:
+            seen.append(event)
+
+        unsubscribe = receiver.subscribe("TX_CONFIRMED", handler)
+        unsubscribe()
+        body = delivery()
+        await receiver.handle(body, signed(body))
+        await asyncio.sleep(0)
+        assert seen == []
+
+
+class TestWaitFor:
+    async def test_resolves_on_a_matching_event(self):
+        receiver = make_receiver()
+        waiting = asyncio.ensure_future(receiver.wait_for_transaction("tx-2", timeout=1.0))
+        await asyncio.sleep(0)
+        for event_id, tx_id in (("d-1", "tx-1"), ("d-2", "tx-2")):
+            body = delivery(event_id=event_id, txId=tx_id)
+            await receiver.handle(body, signed(body))
+        event = await waiting
+        assert event.tx_id == "tx-2"
+
+    async def test_transaction_event_that_already_arrived(self):
+        receiver = make_receiver()
+        body = delivery("TX_FAILED", txId="tx-1", error="reverted")
+        await receiver.handle(body, signed(body))
+        event = await receiver.wait_for_transaction("tx-1", timeout=0.1)
+        assert event.event == "TX_FAILED"
+
+    async def test_times_out(self):
+        receiver = make_receiver()
+        with pytest.raises(WAIaaSError) as exc:
+            await receiver.wait_for("KILL_SWITCH_ACTIVATED", timeout=0.01)
+        assert exc.value.code == "WAIT_TIMEOUT"
+        assert receiver._waiters == []
+
+
+class WebhookDaemon:
+    """Stand-in for the /v1/webhooks routes that delivers events like the daemon."""
+
+    def __init__(self) -> None:
+        self.webhooks: dict[str, dict] = {}
+        self.master_passwords: list[str | None] = []
+        self.polls = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.master_passwords.append(request.headers.get("X-Master-Password"))
+        if request.url.path == "/v1/webhooks" and request.method == "POST":
+            body = json.loads(request.content)
+            hook = {
+                "id": f"wh-{len(self.webhooks) + 1}",
+                "url": body["url"],
+                "events": body["events"],
+                "description": body.get("description"),
+                "enabled": True,
+                "createdAt": NOW,
+                "updatedAt": NOW,
+            }
+            self.webhooks[hook["id"]] = hook
+            return httpx.Response(201, json={**hook, "secret": SECRET})
+        if request.url.path == "/v1/webhooks":
+            return httpx.Response(200, json={"data": list(self.webhooks.values())})
+        if request.method == "DELETE":
+            self.webhooks.pop(request.url.path.rsplit("/", 1)[1])
+            return httpx.Response(204)
+        if request.url.path == "/v1/transactions/send":
+            return httpx.Response(201, json={"id": "tx-9", "status": "PENDING"})
+        self.polls += 1
+        return httpx.Response(404, json={"code": "NOT_FOUND", "message": "x", "retryable": False})
+
+    async def push(self, event: str, event_id: str, **data) -> int:
+        """POST a signed event to every webhook, over real HTTP."""
+        body = json.dumps({"id": event_id, "event": event, "timestamp": NOW, "data": data})
+        async with httpx.AsyncClient() as http:
+            statuses = []
+            for hook in self.webhooks.values():
+                response = await http.post(
+                    hook["url"],
+                    content=body,
+                    headers={
+                        "Content-Type": "application/json",
+                        "X-WAIaaS-Signature": sign(SECRET, body.encode()),
+                        "X-WAIaaS-Event": event,
+                        "X-WAIaaS-Delivery": event_id,
+                    },
+                )
+                statuses.append(response.status_code)
+        return statuses[0]
+
+
+class TestReceiverEndToEnd:
+    async def test_register_receive_and_clean_up(self):
+        daemon = WebhookDaemon()
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+        )
+        client = WAIaaSClient("http://test", "wai_sess_test_token", http_client=http_client)
+        async with EventReceiver(clock=lambda: NOW) as receiver:
+            created = await receiver.register(
+                client, master_password="pw", events=["TX_CONFIRMED", "TX_FAILED"]
+            )
+            assert created.url == receiver.url
+            assert [w.id for w in await client.list_webhooks(master_password="pw")] == [created.id]
+            tx = await client.send_token(to="addr", amount="1")
+            waiting = asyncio.ensure_future(receiver.wait_for_transaction(tx.id, timeout=5.0))
+            assert await daemon.push("TX_CONFIRMED", "d-1", txId=tx.id, txHash="0xabc") == 200
+            assert await daemon.push("TX_CONFIRMED", "d-1", txId=tx.id, txHash="0xabc") == 200
+            event = await waiting
+            assert event.data["txHash"] == "0xabc"
+            assert receiver.stats.duplicates == 1
+        assert daemon.webhooks == {}  # deleted on close
+        assert daemon.polls == 0
+        assert daemon.master_passwords.count("pw") == 3  # create, list, delete
+        await client.close()
+
+    async def test_server_refuses_other_paths_and_forgeries(self):
+        async with EventReceiver([SECRET], clock=lambda: NOW) as receiver:
+            async with httpx.AsyncClient() as http:
+                base = f"http://{receiver.host}:{receiver.port}"
+                assert (await http.post(base + "/elsewhere", content=b"{}")).status_code == 404
+                assert (await http.get(receiver.url)).status_code == 404
+                forged = await http.post(
+                    receiver.url, content=delivery(), headers={"X-WAIaaS-Signature": "sha256=00"}
+                )
+                assert forged.status_code == 401
+
+    async def test_webhook_logs(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["X-Master-Password"] == "pw"
+            assert request.url.params["status"] == "failed"
+            return httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {
+                            "id": "l-1",
+                            "webhookId": "wh-1",
+                            "eventType": "TX_CONFIRMED",
+                            "status": "failed",
+                            "httpStatus": 500,
+                            "attempt": 1,
+                            "error": "HTTP 500: server error",
+                            "requestDuration": 12,
+                            "createdAt": NOW,
+                        }
+                    ]
+                },
+            )
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://test")
+        client = WAIaaSClient("http://test", "wai_sess_test_token", http_client=http_client)
+        [log] = await client.list_webhook_logs("wh-1", master_password="pw", status="failed")
+        assert (log.event_type, log.http_status) == ("TX_CONFIRMED", 500)
+        await client.close()
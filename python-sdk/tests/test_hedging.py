@@ -0,0 +1,173 @@
+"""Hedged request tests for WAIaaS SDK."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from waiaas.client import WAIaaSClient
+from waiaas.hedging import RequestHedger
+from waiaas.retry import RetryBudget, RetryPolicy
+
+BALANCE = {
+    "walletId": "w",
+    "chain": "solana",
+    "network": "devnet",
+    "address": "addr",
+    "balance": "1",
+    "decimals": 9,
+    "symbol": "SOL",
+}
+
+
+def warmed(hedger: RequestHedger, key: str = "/v1/wallet/balance", latency: float = 0.01) -> RequestHedger:
+    for _ in range(hedger.min_samples):
+        hedger.record(key, latency)
+    return hedger
+
+
+class ScriptedDaemon:
+    """Stand-in answering the n-th request after ``delays[n]`` seconds (default 0)."""
+
+    def __init__(self, delays: dict[int, float] | None = None) -> None:
+        self.delays = delays or {}
+        self.requests = 0
+        self.cancelled = 0
+        self.fail: set[int] = set()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        n = self.requests
+        self.requests += 1
+        try:
+            await asyncio.sleep(self.delays.get(n, 0.0))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if n in self.fail:
+            raise httpx.ConnectError("connection reset", request=request)
+        return httpx.Response(200, json={**BALANCE, "balance": str(n)})
+
+
+def make_client(daemon: ScriptedDaemon, hedger: RequestHedger) -> WAIaaSClient:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    return WAIaaSClient(
+        "http://test",
+        "wai_sess_test_token",
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_retries=0),
+        hedger=hedger,
+    )
+
+
+class TestRequestHedger:
+    def test_only_configured_gets_are_hedged(self):
+        hedger = RequestHedger()
+        assert hedger.key_for("GET", "/v1/wallet/balance") == "/v1/wallet/balance"
+        assert hedger.key_for("GET", "/v1/transactions/abc") == "/v1/transactions/"
+        assert hedger.key_for("GET", "/v1/wallet/address") is None
+        assert hedger.key_for("POST", "/v1/transactions/send") is None
+
+    def test_threshold_tracks_the_percentile(self):
+        hedger = RequestHedger(percentile=0.9, min_samples=10)
+        assert hedger.threshold("k") is None
+        for i in range(1, 101):
+            hedger.record("k", i / 1000)
+        assert hedger.threshold("k") == pytest.approx(0.090)
+
+    def test_threshold_has_a_floor(self):
+        hedger = warmed(RequestHedger(min_delay=0.05), "k", 0.001)
+        assert hedger.threshold("k") == 0.05
+
+    def test_window_forgets_old_latencies(self):
+        hedger = RequestHedger(window=20, min_samples=20)
+        warmed(hedger, "k", 1.0)
+        warmed(hedger, "k", 0.01)
+        assert hedger.threshold("k") == pytest.approx(0.01)
+
+    async def test_fast_answer_is_not_hedged(self):
+        hedger = warmed(RequestHedger())
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            return "ok"
+
+        assert await hedger.run("/v1/wallet/balance", fn) == "ok"
+        assert calls == 1
+        assert hedger.stats.hedged == 0
+
+
+class TestClientHedging:
+    async def test_slow_first_attempt_is_hedged_and_loses(self):
+        daemon = ScriptedDaemon({0: 1.0})
+        hedger = warmed(RequestHedger())
+        client = make_client(daemon, hedger)
+        balance = await asyncio.wait_for(client.get_balance(), 0.5)
+        assert balance.balance == "1"  # the hedge answered
+        assert daemon.requests == 2
+        await asyncio.sleep(0)
+        assert daemon.cancelled == 1  # the slow attempt was cancelled
+        assert hedger.stats.hedged == 1
+        assert hedger.stats.hedge_wins == 1
+        await client.close()
+
+    async def test_first_attempt_can_still_win(self):
+        daemon = ScriptedDaemon({0: 0.03, 1: 1.0})
+        hedger = warmed(RequestHedger())
+        client = make_client(daemon, hedger)
+        balance = await asyncio.wait_for(client.get_balance(), 0.5)
+        assert balance.balance == "0"
+        assert hedger.stats.hedged == 1
+        assert hedger.stats.hedge_wins == 0
+        await client.close()
+
+    async def test_failed_attempt_waits_for_the_other(self):
+        daemon = ScriptedDaemon({0: 0.05, 1: 0.1})
+        daemon.fail.add(0)
+        hedger = warmed(RequestHedger())
+        client = make_client(daemon, hedger)
+        balance = await client.get_balance()
+        assert balance.balance == "1"
+        await client.close()
+
+    async def test_both_failing_raises(self):
+        daemon = ScriptedDaemon({0: 0.05})
+        daemon.fail.update({0, 1})
+        hedger = warmed(RequestHedger())
+        client = make_client(daemon, hedger)
+        with pytest.raises(httpx.ConnectError):
+            await client.get_balance()
+        await client.close()
+
+    async def test_budget_caps_hedges(self):
+        daemon = ScriptedDaemon({i: 0.05 for i in range(100)})
+        hedger = RequestHedger(budget=RetryBudget(ratio=0.1, min_per_second=0.0, max_tokens=1.0))
+        for _ in range(hedger.window):  # enough history that ten slow answers stay above p95
+            hedger.record("/v1/wallet/balance", 0.01)
+        client = make_client(daemon, hedger)
+        for _ in range(10):
+            await client.get_balance()
+        assert hedger.stats.hedged <= 2
+        assert hedger.stats.budget_denied >= 8
+        assert hedger.stats.extra_load <= 0.2
+        await client.close()
+
+    async def test_not_hedged_while_learning(self):
+        daemon = ScriptedDaemon({0: 0.05})
+        hedger = RequestHedger()
+        client = make_client(daemon, hedger)
+        await client.get_balance()
+        assert daemon.requests == 1
+        assert hedger.stats.requests == 1
+        await client.close()
+
+    async def test_writes_are_never_hedged(self):
+        daemon = ScriptedDaemon()
+        hedger = RequestHedger()
+        client = make_client(daemon, hedger)
+        await client.get_address()
+        assert hedger.stats.requests == 0
+        await client.close()
@@ -0,0 +1,116 @@
+"""Idempotency key tests for WAIaaS SDK."""
+
+import random
+
+import httpx
+import pytest
+
+from waiaas.client import WAIaaSClient
+from waiaas.errors import WAIaaSError
+from waiaas.retry import RetryPolicy
+
+
+class DedupingDaemon:
+    """Stand-in that submits each transaction once per Idempotency-Key.
+
+    ``fail_rate`` of responses are replaced by a 502 *after* the
+    transaction was submitted, as a proxy timing out on the daemon would.
+    """
+
+    def __init__(self, fail_rate: float = 0.0, seed: int = 0) -> None:
+        self.fail_rate = fail_rate
+        self.random = random.Random(seed)
+        self.submissions: list[dict] = []
+        self.responses: dict[str, dict] = {}
+        self.keys: list[str | None] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        key = request.headers.get("Idempotency-Key")
+        self.keys.append(key)
+        body = self.responses.get(key) if key else None
+        if body is None:
+            self.submissions.append({"key": key, "content": request.content})
+            body = {"id": f"tx-{len(self.submissions)}", "status": "PENDING"}
+            if key:
+                self.responses[key] = body
+        if self.random.random() < self.fail_rate:
+            return httpx.Response(
+                502, json={"code": "BAD_GATEWAY", "message": "upstream timeout", "retryable": True}
+            )
+        return httpx.Response(201, json=body)
+
+
+def make_client(daemon: DedupingDaemon, **kwargs) -> WAIaaSClient:
+    """Client that opts keyed POSTs into 5xx retries, as behind a deduplicating proxy."""
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    return WAIaaSClient(
+        "http://test",
+        "wai_sess_test_token",
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_retries=10, base_delay=0.0, retry_with_idempotency_key=True),
+        **kwargs,
+    )
+
+
+class TestIdempotencyKeys:
+    async def test_retries_reuse_the_key(self):
+        daemon = DedupingDaemon(fail_rate=0.5, seed=1)
+        client = make_client(daemon)
+        tx = await client.send_token(to="addr", amount="1")
+        assert len(daemon.keys) > 1
+        assert len(set(daemon.keys)) == 1
+        assert tx.id == "tx-1"
+        await client.close()
+
+    async def test_no_duplicate_submissions_under_5xx(self):
+        daemon = DedupingDaemon(fail_rate=0.3, seed=7)
+        client = make_client(daemon)
+        ids = [(await client.send_token(to="addr", amount=str(i))).id for i in range(50)]
+        assert len(daemon.keys) > 50  # failures were retried...
+        assert len(daemon.submissions) == 50  # ...without submitting twice
+        assert len(set(ids)) == 50
+        await client.close()
+
+    async def test_reads_carry_no_key(self):
+        seen: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("Idempotency-Key"))
+            return httpx.Response(
+                200, json={"walletId": "w", "chain": "solana", "network": "devnet", "address": "a"}
+            )
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://test")
+        client = WAIaaSClient("http://test", "wai_sess_test_token", http_client=http_client)
+        await client.get_address()
+        assert seen == [None]
+        await client.close()
+
+    async def test_without_keys_posts_are_not_retried_after_5xx(self):
+        daemon = DedupingDaemon(fail_rate=1.0)
+        client = make_client(daemon, idempotency_keys=False)
+        with pytest.raises(WAIaaSError) as exc:
+            await client.send_token(to="addr", amount="1")
+        assert exc.value.status_code == 502
+        assert daemon.keys == [None]
+        assert len(daemon.submissions) == 1
+        await client.close()
+
+    async def test_keyed_posts_are_not_retried_by_default(self):
+        daemon = DedupingDaemon(fail_rate=1.0)
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+        )
+        client = WAIaaSClient(
+            "http://test",
+            "wai_sess_test_token",
+            http_client=http_client,
+            retry_policy=RetryPolicy(base_delay=0.0),
+        )
+        with pytest.raises(WAIaaSError):
+            await client.execute_action("0x-swap", "swap", params={})
+        assert len(daemon.keys) == 1
+        assert daemon.keys[0] is not None  # still sent, just not relied on
+        await client.close()
@@ -0,0 +1,212 @@
+"""In-flight tracking and drain tests for WAIaaS SDK."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from waiaas.cache import CachePolicy, ResponseCache
+from waiaas.client import WAIaaSClient
+from waiaas.errors import WAIaaSError
+from waiaas.inflight import InFlightRegistry
+from waiaas.pool import WAIaaSClientPool
+from waiaas.retry import RetryPolicy
+
+ADDRESS = {"walletId": "w", "chain": "solana", "network": "devnet", "address": "addr"}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class GatedDaemon:
+    """Stand-in whose answers wait for ``delays[path]`` seconds."""
+
+    def __init__(self) -> None:
+        self.delays: dict[str, float] = {}
+        self.requests = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        await asyncio.sleep(self.delays.get(request.url.path, 0.0))
+        if request.method == "POST":
+            return httpx.Response(201, json={"id": "tx-1", "status": "PENDING"})
+        return httpx.Response(200, json=ADDRESS)
+
+
+def make_client(daemon: GatedDaemon, **kwargs) -> WAIaaSClient:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    return WAIaaSClient(
+        "http://test",
+        "wai_sess_test_token",
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_retries=0),
+        **kwargs,
+    )
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestInFlightRegistry:
+    async def test_tracks_calls_oldest_first(self):
+        clock = FakeClock()
+        registry = InFlightRegistry(clock)
+        with registry.track("GET", "/a", asyncio.current_task()) as first:
+            clock.now = 5.0
+            with registry.track("POST", "/b") as second:
+                assert [r.path for r in registry.requests] == ["/a", "/b"]
+                assert first.age(now=7.0) == 7.0
+                assert first.task is asyncio.current_task()
+                assert second.task is None
+            assert len(registry) == 1
+        assert registry.requests == []
+
+    async def test_wait_idle(self):
+        registry = InFlightRegistry()
+        await asyncio.wait_for(registry.wait_idle(), 0.1)
+        gate = asyncio.Event()
+
+        async def call():
+            with registry.track("GET", "/a"):
+                await gate.wait()
+
+        task = asyncio.ensure_future(call())
+        await settle()
+        waiter = asyncio.ensure_future(registry.wait_idle())
+        await settle()
+        assert not waiter.done()
+        gate.set()
+        await task
+        await asyncio.wait_for(waiter, 0.1)
+
+
+class TestClientDrain:
+    async def test_in_flight_lists_running_calls(self):
+        daemon = GatedDaemon()
+        daemon.delays["/v1/transactions/send"] = 0.05
+        client = make_client(daemon)
+        task = asyncio.ensure_future(client.send_token(to="addr", amount="1"))
+        await settle()
+        [request] = client.in_flight
+        assert (request.method, request.path) == ("POST", "/v1/transactions/send")
+        assert request.age() >= 0.0
+        await task
+        assert client.in_flight == []
+        await client.close()
+
+    async def test_drain_lets_calls_finish(self):
+        daemon = GatedDaemon()
+        daemon.delays["/v1/transactions/send"] = 0.05
+        client = make_client(daemon)
+        tasks = [
+            asyncio.ensure_future(client.send_token(to="addr", amount="1")) for _ in range(3)
+        ]
+        await settle()
+        report = await client.close(drain_timeout=1.0)
+        assert report.clean
+        assert report.completed == 3
+        assert all(t.result().id == "tx-1" for t in tasks)
+
+    async def test_closed_client_rejects_new_calls(self):
+        daemon = GatedDaemon()
+        client = make_client(daemon)
+        await client.close()
+        with pytest.raises(WAIaaSError) as exc:
+            await client.get_address()
+        assert exc.value.code == "CLIENT_CLOSED"
+        assert daemon.requests == 0
+
+    async def test_calls_past_the_timeout_are_cancelled_and_reported(self):
+        daemon = GatedDaemon()
+        daemon.delays["/v1/wallet/address"] = 0.01
+        daemon.delays["/v1/transactions/send"] = 10.0
+        client = make_client(daemon)
+        fast = asyncio.ensure_future(client.get_address())
+        stuck = asyncio.ensure_future(client.send_token(to="addr", amount="1"))
+        await settle()
+        report = await client.close(drain_timeout=0.1)
+        assert report.completed == 1
+        assert [(r.method, r.path) for r in report.cancelled] == [
+            ("POST", "/v1/transactions/send")
+        ]
+        assert not report.clean
+        assert 0.1 <= report.duration < 1.0
+        assert fast.result().address == "addr"
+        with pytest.raises(WAIaaSError) as exc:
+            await stuck
+        assert exc.value.code == "CLIENT_CLOSED"
+
+    async def test_close_never_cancels_the_callers_task(self):
+        daemon = GatedDaemon()
+        daemon.delays["/v1/transactions/send"] = 0.5
+        client = make_client(daemon)
+        outcome: list[str] = []
+
+        async def agent() -> None:
+            try:
+                await client.send_token(to="addr", amount="1")
+            except Exception as e:
+                outcome.append(getattr(e, "code", type(e).__name__))
+            await asyncio.sleep(0)  # the caller's task carries on
+            outcome.append("after")
+
+        task = asyncio.ensure_future(agent())
+        await settle()
+        await client.close()
+        await task
+        assert outcome == ["CLIENT_CLOSED", "after"]
+        assert not task.cancelled()
+
+    async def test_callers_own_cancellation_still_propagates(self):
+        daemon = GatedDaemon()
+        daemon.delays["/v1/transactions/send"] = 10.0
+        client = make_client(daemon)
+        task = asyncio.ensure_future(client.send_token(to="addr", amount="1"))
+        await settle()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await settle()
+        assert client.in_flight == []
+        await client.close()
+
+    async def test_background_refreshes_are_drained(self):
+        clock = FakeClock()
+        daemon = GatedDaemon()
+        cache = ResponseCache(
+            policies={"/v1/wallet/address": CachePolicy(ttl=1.0, stale_ttl=60.0)}, clock=clock
+        )
+        client = make_client(daemon, cache=cache)
+        await client.get_address()
+        daemon.delays["/v1/wallet/address"] = 0.05
+        clock.now = 2.0
+        await client.get_address()  # stale: refreshed in the background
+        report = await client.close(drain_timeout=1.0)
+        assert report.clean
+        assert daemon.requests == 2
+
+    async def test_pool_close_drains_every_client(self):
+        daemon = GatedDaemon()
+        daemon.delays["/v1/transactions/send"] = 0.05
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+        )
+        pool = WAIaaSClientPool(
+            "http://test", http_client=http_client, retry_policy=RetryPolicy(max_retries=0)
+        )
+        clients = [pool.client(f"wai_sess_{i}") for i in range(3)]
+        tasks = [asyncio.ensure_future(c.send_token(to="addr", amount="1")) for c in clients]
+        await settle()
+        report = await pool.close(drain_timeout=1.0)
+        assert report.completed == 3
+        assert report.clean
+        await asyncio.gather(*tasks)
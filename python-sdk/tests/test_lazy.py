@@ -0,0 +1,128 @@
+"""Lazily validated list field tests for WAIaaS SDK."""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from waiaas.decoding import decode
+from waiaas.lazy import LazyList
+from waiaas.models import (
+    DeFiPositionsResponse,
+    IncomingTransactionList,
+    TransactionDetail,
+    TransactionList,
+)
+
+from tests.conftest import WALLET_ID
+
+
+def tx(i: int) -> dict:
+    return {
+        "id": f"tx-{i}",
+        "walletId": WALLET_ID,
+        "type": "TRANSFER",
+        "status": "CONFIRMED",
+        "chain": "solana",
+        "createdAt": 1_700_000_000 + i,
+    }
+
+
+def page(n: int) -> bytes:
+    return json.dumps({"items": [tx(i) for i in range(n)], "hasMore": True}).encode()
+
+
+class TestLazyList:
+    def test_items_are_not_validated_until_accessed(self):
+        result = decode(page(50), TransactionList, "lazy")
+        assert isinstance(result.items, LazyList)
+        assert result.has_more is True
+        assert len(result.items) == 50
+        assert result.items.materialized == 0
+
+    def test_indexing_validates_one_item(self):
+        result = decode(page(50), TransactionList, "lazy")
+        first = result.items[0]
+        assert isinstance(first, TransactionDetail)
+        assert first.wallet_id == WALLET_ID
+        assert result.items.materialized == 1
+        assert result.items[0] is first  # built once
+        assert result.items[-1].id == "tx-49"
+
+    def test_index_out_of_range(self):
+        result = decode(page(2), TransactionList, "lazy")
+        with pytest.raises(IndexError):
+            result.items[2]
+
+    def test_slicing_returns_validated_list(self):
+        result = decode(page(10), TransactionList, "lazy")
+        window = result.items[2:8:2]
+        assert [t.id for t in window] == ["tx-2", "tx-4", "tx-6"]
+        assert result.items.materialized == 3
+
+    def test_iteration_stops_early(self):
+        result = decode(page(10), TransactionList, "lazy")
+        found = next(t for t in result.items if t.id == "tx-3")
+        assert found.created_at == 1_700_000_003
+        assert result.items.materialized == 4
+
+    def test_behaves_as_a_list(self):
+        raw = json.dumps({"walletId": WALLET_ID, "positions": []})
+        assert decode(raw, DeFiPositionsResponse, "lazy").positions == []
+        result = decode(page(2), TransactionList, "lazy")
+        expected = [TransactionDetail.model_validate(tx(i)) for i in range(2)]
+        assert isinstance(result.items, list)
+        assert result.items == expected
+        assert result.items != [1]
+        extra = TransactionDetail.model_validate(tx(9))
+        result.items.append(extra)
+        result.items[0] = extra
+        assert [t.id for t in result.items] == ["tx-9", "tx-1", "tx-9"]
+        assert result.items.materialized == 3
+
+    def test_mutation_validates_the_rest_first(self):
+        result = decode(page(3), TransactionList, "lazy")
+        del result.items[0]
+        assert all(isinstance(t, TransactionDetail) for t in list.__iter__(result.items))
+
+    def test_serialization_round_trip(self):
+        result = decode(page(3), TransactionList, "lazy")
+        dumped = result.model_dump(by_alias=True)
+        assert dumped["items"][1]["walletId"] == WALLET_ID
+        assert TransactionList.model_validate_json(result.model_dump_json()) == result
+
+    def test_malformed_item_raises_on_access(self):
+        raw = json.dumps({"items": [tx(0), {"id": "broken"}], "hasMore": False})
+        result = decode(raw, TransactionList, "lazy")
+        assert result.items[0].id == "tx-0"
+        with pytest.raises(ValidationError):
+            result.items[1]
+
+    def test_items_are_validated_strictly(self):
+        raw = json.dumps({"items": [{**tx(0), "createdAt": "1700000000"}], "hasMore": False})
+        result = decode(raw, TransactionList, "lazy")
+        with pytest.raises(ValidationError):
+            result.items[0]
+
+
+class TestEagerModes:
+    def test_fields_are_plain_lists(self):
+        for mode in ("strict", "lenient", "construct"):
+            result = decode(page(3), TransactionList, mode)
+            assert type(result.items) is list, mode
+            assert isinstance(result.items[2], TransactionDetail)
+
+    def test_strict_mode_raises_on_decode(self):
+        raw = json.dumps({"items": [tx(0), {"id": "broken"}], "hasMore": False})
+        with pytest.raises(ValidationError):
+            decode(raw, TransactionList)
+
+    def test_accepts_model_instances(self):
+        detail = TransactionDetail.model_validate(tx(1))
+        model = TransactionList(items=[detail], has_more=False)
+        assert model.items[0] is detail
+
+    def test_json_schema_describes_items(self):
+        schema = IncomingTransactionList.model_json_schema()
+        assert schema["properties"]["data"]["type"] == "array"
+        assert "$ref" in schema["properties"]["data"]["items"]
@@ -0,0 +1,364 @@
+"""Paginating iterator tests for WAIaaS SDK."""
+
+import asyncio
+import contextlib
+
+import httpx
+import pytest
+
+from waiaas.client import WAIaaSClient
+from waiaas.errors import WAIaaSError
+from waiaas.pagination import paginate, time_shards
+from waiaas.retry import RetryPolicy
+
+from tests.conftest import WALLET_ID
+
+
+class PagedDaemon:
+    """Stand-in daemon serving ``total`` transactions in cursor pages."""
+
+    def __init__(self, total: int, latency: float = 0.0) -> None:
+        self.total = total
+        self.latency = latency
+        self.requests: list[httpx.Request] = []
+        self.in_flight = 0
+        self.fail_after: int | None = None
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        if self.fail_after is not None and len(self.requests) > self.fail_after:
+            return httpx.Response(500, json={"code": "INTERNAL", "message": "boom"})
+        limit = int(request.url.params["limit"])
+        cursor = request.url.params.get("cursor")
+        start = int(cursor) + 1 if cursor else 0
+        ids = list(range(start, min(start + limit, self.total)))
+        has_more = start + limit < self.total
+        if request.url.path == "/v1/wallet/incoming":
+            return httpx.Response(
+                200,
+                json={
+                    "data": [self.incoming(i) for i in ids],
+                    "nextCursor": str(ids[-1]) if ids else None,
+                    "hasMore": has_more,
+                },
+            )
+        return httpx.Response(
+            200,
+            json={
+                "items": [self.tx(i) for i in ids],
+                "cursor": str(ids[-1]) if ids else None,
+                "hasMore": has_more,
+            },
+        )
+
+    @staticmethod
+    def tx(i: int) -> dict:
+        return {
+            "id": f"tx-{i}",
+            "walletId": WALLET_ID,
+            "type": "TRANSFER",
+            "status": "CONFIRMED",
+            "chain": "solana",
+        }
+
+    @staticmethod
+    def incoming(i: int) -> dict:
+        return {
+            "id": f"in-{i}",
+            "txHash": f"hash-{i}",
+            "walletId": WALLET_ID,
+            "fromAddress": "sender",
+            "amount": "1",
+            "chain": "solana",
+            "network": "devnet",
+            "status": "CONFIRMED",
+            "detectedAt": 1_700_000_000 + i,
+        }
+
+
+def make_client(daemon) -> WAIaaSClient:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    return WAIaaSClient(
+        "http://test",
+        "wai_sess_test_token",
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_retries=0),
+    )
+
+
+class TestPaginate:
+    async def test_yields_every_item_in_order(self):
+        pages = {None: ([1, 2], "a"), "a": ([3, 4], "b"), "b": ([5], None)}
+
+        async def fetch(cursor):
+            return pages[cursor]
+
+        for prefetch in (0, 1, 3):
+            assert [x async for x in paginate(fetch, prefetch=prefetch)] == [1, 2, 3, 4, 5]
+
+    async def test_prefetch_stays_bounded(self):
+        fetched: list[int] = []
+
+        async def fetch(cursor):
+            page = int(cursor or 0)
+            fetched.append(page)
+            return [page], str(page + 1)
+
+        gen = paginate(fetch, prefetch=2)
+        assert await gen.__anext__() == 0
+        await asyncio.sleep(0.01)
+        assert fetched == [0, 1, 2]  # consuming page 0, two pages ahead
+        await gen.aclose()
+
+    async def test_rejects_negative_prefetch(self):
+        async def fetch(cursor):
+            return [], None
+
+        with pytest.raises(ValueError):
+            await paginate(fetch, prefetch=-1).__anext__()
+
+    async def test_error_raised_after_earlier_pages(self):
+        async def fetch(cursor):
+            if cursor is None:
+                return [1, 2], "next"
+            raise WAIaaSError(code="BOOM", message="boom", status_code=500)
+
+        seen = []
+        with pytest.raises(WAIaaSError):
+            async for item in paginate(fetch):
+                seen.append(item)
+        assert seen == [1, 2]
+
+    async def test_close_cancels_in_flight_fetch(self):
+        cancelled = asyncio.Event()
+
+        async def fetch(cursor):
+            if cursor is None:
+                return [1], "next"
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return [2], None
+
+        async with contextlib.aclosing(paginate(fetch)) as items:
+            async for item in items:
+                await asyncio.sleep(0.01)  # let the prefetch start
+                break
+        assert cancelled.is_set()
+
+    async def test_cancelling_consumer_cancels_producer(self):
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fetch(cursor):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return [], None
+
+        async def consume():
+            async for _ in paginate(fetch):
+                pass
+
+        task = asyncio.ensure_future(consume())
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert cancelled.is_set()
+
+
+class TestIterTransactions:
+    async def test_iterates_all_pages(self):
+        daemon = PagedDaemon(total=25)
+        client = make_client(daemon)
+        ids = [tx.id async for tx in client.iter_transactions(page_size=10)]
+        assert ids == [f"tx-{i}" for i in range(25)]
+        assert [r.url.params.get("cursor") for r in daemon.requests] == [None, "9", "19"]
+        await client.close()
+
+    async def test_max_items_limits_requests(self):
+        daemon = PagedDaemon(total=1000)
+        client = make_client(daemon)
+        ids = [
+            tx.id
+            async for tx in client.iter_transactions(page_size=10, max_items=15, prefetch=0)
+        ]
+        assert len(ids) == 15
+        assert len(daemon.requests) == 2
+        await client.close()
+
+    async def test_next_page_overlaps_with_consumer(self):
+        daemon = PagedDaemon(total=40, latency=0.05)
+        client = make_client(daemon)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async for tx in client.iter_transactions(page_size=10):
+            if tx.id.endswith("9"):
+                await asyncio.sleep(0.05)  # slow consumer at each page end
+        prefetched = loop.time() - start
+        daemon.requests.clear()
+        start = loop.time()
+        async for tx in client.iter_transactions(page_size=10, prefetch=0):
+            if tx.id.endswith("9"):
+                await asyncio.sleep(0.05)
+        serial = loop.time() - start
+        assert prefetched < serial - 0.1
+        await client.close()
+
+
+class TestIterIncomingTransactions:
+    async def test_passes_filters_and_follows_next_cursor(self):
+        daemon = PagedDaemon(total=5)
+        client = make_client(daemon)
+        items = [
+            item
+            async for item in client.iter_incoming_transactions(
+                page_size=2, network="devnet", since=100
+            )
+        ]
+        assert [i.tx_hash for i in items] == [f"hash-{i}" for i in range(5)]
+        first = daemon.requests[0].url.params
+        assert first["network"] == "devnet"
+        assert first["since"] == "100"
+        assert [r.url.params.get("cursor") for r in daemon.requests] == [None, "1", "3"]
+        await client.close()
+
+    async def test_error_stops_iteration(self):
+        daemon = PagedDaemon(total=10)
+        daemon.fail_after = 1
+        client = make_client(daemon)
+        seen = []
+        with pytest.raises(WAIaaSError):
+            async for item in client.iter_incoming_transactions(page_size=3):
+                seen.append(item.id)
+        assert seen == ["in-0", "in-1", "in-2"]
+        await client.close()
+
+
+class IncomingDaemon:
+    """Stand-in for GET /v1/wallet/incoming honouring since/until and cursors."""
+
+    def __init__(self, rows: list[dict], latency: float = 0.0) -> None:
+        # Newest first, as the daemon orders by (detectedAt DESC, id DESC).
+        self.rows = sorted(rows, key=lambda r: (r["detectedAt"], r["id"]), reverse=True)
+        self.latency = latency
+        self.requests: list[httpx.Request] = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await asyncio.sleep(self.latency)
+        params = request.url.params
+        since = int(params.get("since", 0))
+        until = int(params.get("until", 2**62))
+        rows = [r for r in self.rows if since <= r["detectedAt"] <= until]
+        if "cursor" in params:
+            at, _, last_id = params["cursor"].partition(":")
+            rows = [r for r in rows if (r["detectedAt"], r["id"]) < (int(at), last_id)]
+        limit = int(params["limit"])
+        page = rows[:limit]
+        has_more = len(rows) > limit
+        return httpx.Response(
+            200,
+            json={
+                "data": page,
+                "nextCursor": f"{page[-1]['detectedAt']}:{page[-1]['id']}" if has_more else None,
+                "hasMore": has_more,
+            },
+        )
+
+
+def incoming_rows(n: int, start: int = 1_700_000_000) -> list[dict]:
+    return [
+        {**PagedDaemon.incoming(i), "id": f"in-{i:05d}", "detectedAt": start + i // 3}
+        for i in range(n)
+    ]
+
+
+class TestTimeShards:
+    def test_shards_cover_range_without_overlap(self):
+        assert time_shards(0, 99, 4) == [(75, 99), (50, 74), (25, 49), (0, 24)]
+
+    def test_short_ranges_get_fewer_shards(self):
+        assert time_shards(10, 11, 8) == [(11, 11), (10, 10)]
+
+    def test_rejects_inverted_range(self):
+        with pytest.raises(ValueError):
+            time_shards(10, 9, 2)
+
+
+class TestBackfillIncoming:
+    async def test_yields_every_row_newest_first(self):
+        rows = incoming_rows(200)
+        daemon = IncomingDaemon(rows)
+        client = make_client(daemon)
+        since, until = rows[0]["detectedAt"], rows[-1]["detectedAt"]
+        got = [
+            item.id
+            async for item in client.backfill_incoming(since, until, shards=5, page_size=15)
+        ]
+        assert got == [r["id"] for r in daemon.rows]
+        windows = {(r.url.params["since"], r.url.params["until"]) for r in daemon.requests}
+        assert len(windows) == 5
+        await client.close()
+
+    async def test_deduplicates_by_tx_hash(self):
+        rows = incoming_rows(10)
+        rows.append({**rows[0], "id": "in-dup"})  # same (walletId, txHash)
+        daemon = IncomingDaemon(rows)
+        client = make_client(daemon)
+        got = [item.id async for item in client.backfill_incoming(0, 2**40, shards=3)]
+        assert len(got) == 10
+        assert len(set(got)) == 10
+        await client.close()
+
+    async def test_scales_with_shards(self):
+        rows = incoming_rows(240)
+        since, until = rows[0]["detectedAt"], rows[-1]["detectedAt"]
+        loop = asyncio.get_running_loop()
+        elapsed = {}
+        for shards in (1, 4):
+            daemon = IncomingDaemon(rows, latency=0.01)
+            client = make_client(daemon)
+            start = loop.time()
+            count = 0
+            async for _ in client.backfill_incoming(since, until, shards=shards, page_size=10):
+                count += 1
+            elapsed[shards] = loop.time() - start
+            assert count == 240
+            await client.close()
+        assert elapsed[4] < elapsed[1] / 2.5
+
+    async def test_bounded_concurrency(self):
+        rows = incoming_rows(90)
+        daemon = IncomingDaemon(rows, latency=0.005)
+        in_flight = peak = 0
+        inner = daemon.handler
+
+        async def counting(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await inner(request)
+            finally:
+                in_flight -= 1
+
+        daemon.handler = counting  # type: ignore[method-assign]
+        client = make_client(daemon)
+        items = client.backfill_incoming(0, 2**40, shards=6, concurrency=2, page_size=5)
+        assert len([i async for i in items]) == 90
+        assert peak == 2
+        await client.close()
@@ -0,0 +1,74 @@
+"""WAIaaSClientPool tests using httpx MockTransport."""
+
+import asyncio
+
+import httpx
+
+from waiaas.client import WAIaaSClient
+from waiaas.pool import WAIaaSClientPool
+from waiaas.retry import RetryPolicy
+
+from tests.conftest import WALLET_ID
+
+
+def address_handler(seen: list[str]):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        await asyncio.sleep(0)
+        return httpx.Response(
+            200,
+            json={
+                "walletId": WALLET_ID,
+                "chain": "solana",
+                "network": "devnet",
+                "address": "addr",
+            },
+        )
+
+    return handler
+
+
+def make_pool(handler) -> WAIaaSClientPool:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url="http://test"
+    )
+    return WAIaaSClientPool(
+        "http://test",
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_retries=0),
+    )
+
+
+class TestWAIaaSClientPool:
+    async def test_clients_share_one_http_client(self):
+        pool = make_pool(address_handler([]))
+        a = pool.client("wai_sess_a")
+        b = pool.client("wai_sess_b")
+        assert isinstance(a, WAIaaSClient)
+        assert a._client is b._client is pool._client
+
+    async def test_tokens_sent_per_request(self):
+        seen: list[str] = []
+        pool = make_pool(address_handler(seen))
+        clients = [pool.client(f"wai_sess_{i}") for i in range(50)]
+        await asyncio.gather(*(c.get_address() for c in clients))
+        assert sorted(seen) == sorted(f"Bearer wai_sess_{i}" for i in range(50))
+
+    async def test_set_session_token_does_not_leak_to_other_clients(self):
+        seen: list[str] = []
+        pool = make_pool(address_handler(seen))
+        a = pool.client("wai_sess_a")
+        b = pool.client("wai_sess_b")
+        a.set_session_token("wai_sess_a2")
+        await a.get_address()
+        await b.get_address()
+        assert seen == ["Bearer wai_sess_a2", "Bearer wai_sess_b"]
+        assert "Authorization" not in pool._client.headers
+
+    async def test_client_close_keeps_pool_open(self):
+        pool = WAIaaSClientPool("http://localhost:3100")
+        client = pool.client("wai_sess_a")
+        await client.close()
+        assert not pool._client.is_closed
+        await pool.close()
+        assert pool._client.is_closed
@@ -0,0 +1,259 @@
+"""Client-side rate limiter tests for WAIaaS SDK."""
+
+import asyncio
+import collections
+import math
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from waiaas.client import WAIaaSClient
+from waiaas.ratelimit import RateLimiter
+from waiaas.retry import RetryPolicy
+
+from tests.conftest import make_session_token
+
+_real_sleep = asyncio.sleep
+
+
+class FakeTime:
+    """Clock and sleep that advance together, without real waiting."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.now += max(0.0, delay)
+        await _real_sleep(0)
+
+
+def make_limiter(time: FakeTime, **kwargs) -> RateLimiter:
+    return RateLimiter(clock=time, sleep=time.sleep, **kwargs)
+
+
+class LimitedDaemon:
+    """Stand-in enforcing a per-session sliding window like the daemon."""
+
+    def __init__(self, time: FakeTime, limit: int, window: float = 60.0) -> None:
+        self.time = time
+        self.limit = limit
+        self.window = window
+        self.accepted: dict[str, collections.deque[float]] = collections.defaultdict(
+            collections.deque
+        )
+        self.requests = 0
+        self.rejected = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        now = self.time()
+        stamps = self.accepted[request.headers["Authorization"]]
+        while stamps and stamps[0] <= now - self.window:
+            stamps.popleft()
+        if len(stamps) >= self.limit:
+            self.rejected += 1
+            retry_after = max(1, math.ceil(stamps[0] + self.window - now))
+            return httpx.Response(
+                429,
+                json={
+                    "code": "RATE_LIMITED",
+                    "message": "Session rate limit exceeded",
+                    "retryable": True,
+                },
+                headers={"Retry-After": str(retry_after)},
+            )
+        stamps.append(now)
+        return httpx.Response(
+            200,
+            json={
+                "walletId": "w",
+                "chain": "solana",
+                "network": "devnet",
+                "address": "addr",
+                "balance": "1",
+                "decimals": 9,
+                "symbol": "SOL",
+            },
+        )
+
+
+def make_client(daemon: LimitedDaemon, limiter: RateLimiter, **kwargs) -> WAIaaSClient:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    return WAIaaSClient(
+        "http://test",
+        "wai_sess_test_token",
+        http_client=http_client,
+        rate_limiter=limiter,
+        **kwargs,
+    )
+
+
+class TestRateLimiter:
+    async def test_requests_within_limit_do_not_wait(self):
+        time = FakeTime()
+        limiter = make_limiter(time, session_rpm=5)
+        for _ in range(5):
+            assert await limiter.acquire("GET", "/v1/wallet/balance", "tok") == 0.0
+        assert time.now == 0.0
+        assert limiter.stats.delayed == 0
+
+    async def test_excess_requests_wait_for_the_window(self):
+        time = FakeTime()
+        limiter = make_limiter(time, session_rpm=5)
+        for _ in range(12):
+            await limiter.acquire("GET", "/v1/wallet/balance", "tok")
+        # Requests 6-10 go out as 1-5 leave the window, 11-12 after 6-7.
+        assert time.now == pytest.approx(120.0)
+        assert limiter.stats.acquired == 12
+        assert limiter.stats.delayed == 2  # the 6th and the 11th
+
+    async def test_transactions_are_paced_without_blocking_reads(self):
+        time = FakeTime()
+        limiter = make_limiter(time, tx_rpm=2)
+        done: list[str] = []
+
+        async def call(method: str, path: str) -> None:
+            await limiter.acquire(method, path, "tok")
+            done.append(method)
+
+        sends = [asyncio.ensure_future(call("POST", "/v1/transactions/send")) for _ in range(4)]
+        await _real_sleep(0)
+        await call("GET", "/v1/wallet/balance")
+        await asyncio.gather(*sends)
+        # The read overtakes the two sends waiting for the next tx window.
+        assert done == ["POST", "POST", "GET", "POST", "POST"]
+        assert time.now == pytest.approx(60.0)
+
+    async def test_actions_count_against_the_tx_tier(self):
+        time = FakeTime()
+        limiter = make_limiter(time, tx_rpm=1)
+        await limiter.acquire("POST", "/v1/actions/jupiter/swap", "tok")
+        await limiter.acquire("POST", "/v1/actions/jupiter/swap", "tok")
+        assert time.now == 60.0
+
+    async def test_sessions_have_separate_windows_but_share_the_ip(self):
+        time = FakeTime()
+        limiter = make_limiter(time, session_rpm=2, ip_rpm=3)
+        await limiter.acquire("GET", "/v1/wallet/balance", "alice")
+        await limiter.acquire("GET", "/v1/wallet/balance", "alice")
+        await limiter.acquire("GET", "/v1/wallet/balance", "bob")
+        assert time.now == 0.0
+        await limiter.acquire("GET", "/v1/wallet/balance", "bob")
+        assert time.now == 60.0  # IP window full, not bob's session
+
+    async def test_renewed_tokens_share_their_sessions_window(self):
+        time = FakeTime()
+        limiter = make_limiter(time, session_rpm=2)
+        for iat in (0, 1):  # the token, then its renewal
+            token = make_session_token(iat, iat + 3600)
+            await limiter.acquire("GET", "/v1/wallet/balance", token)
+        assert time.now == 0.0
+        await limiter.acquire("GET", "/v1/wallet/balance", make_session_token(2, 3602))
+        assert time.now == 60.0
+        other = make_session_token(2, 3602, session_id="other")
+        await limiter.acquire("GET", "/v1/wallet/balance", other)
+        assert time.now == 60.0
+
+    async def test_idle_session_windows_are_dropped(self):
+        time = FakeTime()
+        limiter = make_limiter(time)
+        for i in range(100):
+            await limiter.acquire("POST", "/v1/transactions/send", f"tok-{i}")
+        assert len(limiter._sessions) == len(limiter._tx) == 100
+        time.now += 61.0
+        await limiter.acquire("GET", "/v1/wallet/balance", "tok-new")
+        assert list(limiter._sessions) == ["tok-new"]
+        assert limiter._tx == {}
+
+    async def test_paths_outside_session_tier_only_count_against_ip(self):
+        time = FakeTime()
+        limiter = make_limiter(time, session_rpm=1)
+        for _ in range(5):
+            await limiter.acquire("GET", "/v1/connect-info", "tok")
+        assert time.now == 0.0
+
+    async def test_429_shrinks_the_named_tier_to_what_was_admitted(self):
+        time = FakeTime()
+        limiter = make_limiter(time, session_rpm=10)
+        for _ in range(4):
+            await limiter.acquire("GET", "/v1/wallet/balance", "tok")
+        limiter.on_rate_limited(
+            "GET", "/v1/wallet/balance", "tok", 5.0, "Session rate limit exceeded"
+        )
+        assert limiter.stats.rate_limited == 1
+        # The daemon admitted three requests this window, so the next
+        # waits for the window rather than just the 5s Retry-After ...
+        await limiter.acquire("GET", "/v1/wallet/balance", "tok")
+        assert time.now == pytest.approx(60.0)
+        # ... and only three fit per window from now on.
+        await limiter.acquire("GET", "/v1/wallet/balance", "tok")
+        await limiter.acquire("GET", "/v1/wallet/balance", "tok")
+        assert time.now == pytest.approx(60.0)
+        await limiter.acquire("GET", "/v1/wallet/balance", "tok")
+        assert time.now == pytest.approx(120.0)
+
+    async def test_429_pauses_for_retry_after(self):
+        time = FakeTime()
+        limiter = make_limiter(time)
+        await limiter.acquire("GET", "/v1/wallet/balance", "tok")
+        limiter.on_rate_limited(
+            "GET", "/v1/wallet/balance", "tok", 90.0, "IP rate limit exceeded"
+        )
+        await limiter.acquire("GET", "/v1/connect-info", "tok")
+        assert time.now == pytest.approx(90.0)
+
+    async def test_recovers_after_quiet_windows(self):
+        time = FakeTime()
+        limiter = make_limiter(time, session_rpm=10)
+        await limiter.acquire("GET", "/v1/wallet/balance", "tok")
+        await limiter.acquire("GET", "/v1/wallet/balance", "tok")
+        limiter.on_rate_limited("GET", "/v1/wallet/balance", "tok")
+        time.now = 1000.0
+        # Shrunk to one request per window, then grown by one step.
+        await limiter.acquire("GET", "/v1/wallet/balance", "tok")
+        await limiter.acquire("GET", "/v1/wallet/balance", "tok")
+        assert time.now == 1000.0
+        await limiter.acquire("GET", "/v1/wallet/balance", "tok")
+        assert time.now == pytest.approx(1060.0)
+
+    async def test_unnamed_429_penalizes_narrowest_tier(self):
+        time = FakeTime()
+        limiter = make_limiter(time, tx_rpm=10)
+        await limiter.acquire("POST", "/v1/transactions/send", "tok")
+        await limiter.acquire("POST", "/v1/transactions/send", "tok")
+        limiter.on_rate_limited("POST", "/v1/transactions/send", "tok", 30.0, "slow down")
+        await limiter.acquire("GET", "/v1/wallet/balance", "tok")
+        assert time.now == 0.0
+        await limiter.acquire("POST", "/v1/transactions/send", "tok")
+        assert time.now == pytest.approx(60.0)
+
+
+class TestClientRateLimiter:
+    async def test_paces_under_the_daemon_limit_without_429s(self):
+        time = FakeTime()
+        daemon = LimitedDaemon(time, limit=5)
+        client = make_client(daemon, make_limiter(time, session_rpm=5))
+        for _ in range(12):
+            await client.get_balance()
+        assert daemon.requests == 12
+        assert daemon.rejected == 0
+        assert time.now == pytest.approx(120.0)
+        await client.close()
+
+    async def test_adapts_when_the_daemon_allows_less(self):
+        time = FakeTime()
+        daemon = LimitedDaemon(time, limit=3)
+        limiter = make_limiter(time, session_rpm=10)
+        client = make_client(daemon, limiter, retry_policy=RetryPolicy(max_retries=3))
+        with patch("waiaas.retry.asyncio.sleep", side_effect=time.sleep):
+            for _ in range(10):
+                await client.get_balance()
+        assert daemon.rejected == 1
+        assert limiter.stats.rate_limited == 1
+        await client.close()
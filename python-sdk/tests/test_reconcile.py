@@ -0,0 +1,273 @@
+"""Missed webhook event reconciliation tests for WAIaaS SDK."""
+
+import asyncio
+import json
+
+import httpx
+
+from waiaas.client import WAIaaSClient
+from waiaas.events import EventReceiver, sign
+from waiaas.models import WebhookEvent
+from waiaas.reconcile import HighWaterMark, event_key
+
+SECRET = "ab" * 32
+NOW = 1_700_000_000
+
+
+def delivery(event: str, event_id: str, timestamp: int = NOW, **data) -> tuple[bytes, dict]:
+    body = json.dumps(
+        {"id": event_id, "event": event, "timestamp": timestamp, "data": data}
+    ).encode()
+    return body, {"x-waiaas-signature": sign(SECRET, body)}
+
+
+def tx(tx_id: str, status: str, created_at: int) -> dict:
+    return {
+        "id": tx_id,
+        "walletId": "w-1",
+        "type": "TRANSFER",
+        "status": status,
+        "chain": "solana",
+        "amount": "1",
+        "txHash": f"0x{tx_id}",
+        "createdAt": created_at,
+    }
+
+
+class ReconcileDaemon:
+    """Stand-in for webhook logs and the transaction lists, newest first."""
+
+    def __init__(self, logs: list[dict], transactions: list[dict], incoming: list[dict] = ()) -> None:
+        self.logs = logs
+        self.transactions = transactions
+        self.incoming = list(incoming)
+        self.pages: list[str] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path, params = request.url.path, request.url.params
+        self.pages.append(path)
+        if path == "/v1/webhooks/wh-1/logs":
+            assert request.headers["X-Master-Password"] == "pw"
+            assert params["status"] == "failed"
+            return httpx.Response(200, json={"data": self.logs})
+        if path == "/v1/transactions":
+            start = int(params.get("cursor", 0))
+            end = start + int(params["limit"])
+            page = self.transactions[start:end]
+            more = end < len(self.transactions)
+            return httpx.Response(
+                200, json={"items": page, "cursor": str(end) if more else None, "hasMore": more}
+            )
+        if path == "/v1/wallet/incoming":
+            since = int(params["since"])
+            items = [i for i in self.incoming if i["detectedAt"] >= since]
+            return httpx.Response(200, json={"data": items, "nextCursor": None, "hasMore": False})
+        return httpx.Response(404, json={"code": "NOT_FOUND", "message": "x", "retryable": False})
+
+
+def failed_log(event_type: str, created_at: int) -> dict:
+    return {
+        "id": f"l-{event_type}-{created_at}",
+        "webhookId": "wh-1",
+        "eventType": event_type,
+        "status": "failed",
+        "attempt": 1,
+        "createdAt": created_at,
+    }
+
+
+def make_client(daemon: ReconcileDaemon) -> WAIaaSClient:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    return WAIaaSClient("http://test", "wai_sess_test_token", http_client=http_client)
+
+
+class TestHighWaterMark:
+    def test_persists_across_restarts(self, tmp_path):
+        path = str(tmp_path / "mark.json")
+        mark = HighWaterMark(path)
+        assert mark.timestamp is None
+        event = WebhookEvent(id="d-1", event="TX_CONFIRMED", timestamp=NOW, data={"txId": "tx-1"})
+        mark.advance(event)
+        mark.advance(WebhookEvent(id="d-0", event="TX_FAILED", timestamp=NOW - 10, data={}))
+
+        reloaded = HighWaterMark(path)
+        assert reloaded.timestamp == NOW
+        assert reloaded.seen(event_key(event))
+        assert reloaded.seen("TX_FAILED:d-0")
+
+    def test_keys_are_bounded(self):
+        mark = HighWaterMark(max_keys=2)
+        for i in range(3):
+            mark.advance(WebhookEvent(id=f"d-{i}", event="TX_FAILED", timestamp=NOW + i, data={}))
+        assert not mark.seen("TX_FAILED:d-0")
+        assert mark.seen("TX_FAILED:d-2")
+        assert mark.timestamp == NOW + 2
+
+    async def test_writes_are_batched_off_the_event_loop(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "mark.json")
+        mark = HighWaterMark(path, flush_every=3, flush_interval=60.0)
+        writes: list[int] = []
+        write = HighWaterMark._write
+
+        def counting_write(path: str, state: dict) -> None:
+            writes.append(len(state["keys"]))
+            write(path, state)
+
+        monkeypatch.setattr(HighWaterMark, "_write", staticmethod(counting_write))
+        for i in range(7):
+            mark.advance(WebhookEvent(id=f"d-{i}", event="TX_FAILED", timestamp=NOW + i, data={}))
+            await asyncio.sleep(0.01)
+        assert writes == [3, 6]  # one write per flush_every events
+        await mark.close()  # and the rest on close
+        assert writes == [3, 6, 7]
+        assert HighWaterMark(path).timestamp == NOW + 6
+
+    async def test_unsaved_events_are_written_after_the_interval(self, tmp_path):
+        path = str(tmp_path / "mark.json")
+        mark = HighWaterMark(path, flush_interval=0.02)
+        mark.advance(WebhookEvent(id="d-1", event="TX_FAILED", timestamp=NOW, data={}))
+        assert HighWaterMark(path).timestamp is None
+        await asyncio.sleep(0.1)
+        assert HighWaterMark(path).timestamp == NOW
+
+    async def test_handled_events_advance_the_mark(self):
+        mark = HighWaterMark()
+        receiver = EventReceiver([SECRET], clock=lambda: NOW, high_water_mark=mark)
+        body, headers = delivery("TX_CONFIRMED", "d-1", txId="tx-1")
+        assert await receiver.handle(body, headers) == 200
+        assert mark.timestamp == NOW
+        assert mark.seen("TX_CONFIRMED:tx-1")
+
+
+class TestReconcile:
+    async def test_first_run_fetches_nothing(self):
+        daemon = ReconcileDaemon([failed_log("TX_CONFIRMED", NOW)], [tx("a", "CONFIRMED", NOW)])
+        client = make_client(daemon)
+        receiver = EventReceiver([SECRET])
+        report = await receiver.reconcile(client, webhook_id="wh-1", master_password="pw")
+        assert report.since is None and report.replayed == []
+        assert daemon.pages == []
+        await client.close()
+
+    async def test_replays_only_missed_events(self, tmp_path):
+        path = str(tmp_path / "mark.json")
+        # Before the restart: tx "old" was delivered and handled.
+        before = EventReceiver([SECRET], clock=lambda: NOW, high_water_mark=HighWaterMark(path))
+        body, headers = delivery("TX_CONFIRMED", "d-old", txId="old")
+        assert await before.handle(body, headers) == 200
+        await before.close()  # saves the mark
+
+        daemon = ReconcileDaemon(
+            logs=[
+                failed_log("TX_CONFIRMED", NOW + 60),
+                failed_log("TX_FAILED", NOW + 50),
+                failed_log("TX_CONFIRMED", NOW - 500),  # older than the mark
+            ],
+            transactions=[
+                tx("pending", "PENDING", NOW + 70),
+                tx("new", "CONFIRMED", NOW + 60),
+                tx("broken", "FAILED", NOW + 50),
+                tx("old", "CONFIRMED", NOW - 10),
+                *[tx(f"ancient-{i}", "CONFIRMED", NOW - 4000 - i) for i in range(300)],
+            ],
+        )
+        client = make_client(daemon)
+        after = EventReceiver([SECRET], high_water_mark=HighWaterMark(path))
+        seen: list[WebhookEvent] = []
+
+        async def handler(event: WebhookEvent) -> None:
+            seen.append(event)
+
+        after.subscribe(None, handler)
+        report = await after.reconcile(client, webhook_id="wh-1", master_password="pw")
+        await asyncio.sleep(0)
+
+        assert report.since == NOW
+        assert report.failed_deliveries == {"TX_CONFIRMED": 1, "TX_FAILED": 1}
+        assert [(e.event, e.tx_id) for e in seen] == [("TX_FAILED", "broken"), ("TX_CONFIRMED", "new")]
+        assert report.replayed == seen
+        assert report.already_handled == 1  # "old"
+        assert seen[1].wallet_id == "w-1" and seen[1].data["txHash"] == "0xnew"
+        # One page of transactions reaches past the lookback; no full scan.
+        assert daemon.pages.count("/v1/transactions") == 1
+
+        # Replays are recorded, so running it again replays nothing.
+        again = await after.reconcile(client, webhook_id="wh-1", master_password="pw")
+        assert again.since == NOW + 60
+        assert again.replayed == [] and again.already_handled == 2  # "new", "old"
+        await client.close()
+
+    async def test_replays_missed_incoming_and_reports_the_rest(self):
+        mark = HighWaterMark()
+        mark.advance(WebhookEvent(id="d-1", event="TX_CONFIRMED", timestamp=NOW, data={"txId": "a"}))
+        daemon = ReconcileDaemon(
+            logs=[failed_log("TX_SUBMITTED", NOW + 5), failed_log("KILL_SWITCH_ACTIVATED", NOW + 9)],
+            transactions=[],
+            incoming=[
+                {
+                    "id": "in-1",
+                    "txHash": "0xin",
+                    "walletId": "w-1",
+                    "fromAddress": "sender",
+                    "amount": "5",
+                    "chain": "solana",
+                    "network": "solana-devnet",
+                    "status": "DETECTED",
+                    "detectedAt": NOW + 5,
+                }
+            ],
+        )
+        client = make_client(daemon)
+        receiver = EventReceiver([SECRET], high_water_mark=mark)
+        report = await receiver.reconcile(client, webhook_id="wh-1", master_password="pw")
+        [event] = report.replayed
+        assert (event.event, event.data["fromAddress"], event.data["amount"]) == (
+            "TX_SUBMITTED",
+            "sender",
+            "5",
+        )
+        assert report.unrecoverable == {"KILL_SWITCH_ACTIVATED": 1}
+        assert mark.timestamp == NOW + 5
+        await client.close()
+
+    async def test_replays_missed_outgoing_submissions(self):
+        mark = HighWaterMark()
+        mark.advance(WebhookEvent(id="d-1", event="TX_CONFIRMED", timestamp=NOW, data={"txId": "a"}))
+        daemon = ReconcileDaemon(
+            logs=[failed_log("TX_SUBMITTED", NOW + 5)],
+            transactions=[
+                {**tx("queued", "QUEUED", NOW + 9), "txHash": None},
+                {**tx("signed", "SIGNED", NOW + 7), "txHash": None},
+                tx("sent", "SUBMITTED", NOW + 6),
+                tx("done", "CONFIRMED", NOW + 5),
+            ],
+        )
+        client = make_client(daemon)
+        receiver = EventReceiver([SECRET], clock=lambda: NOW + 10, high_water_mark=mark)
+        report = await receiver.reconcile(client, webhook_id="wh-1", master_password="pw")
+        assert [(e.event, e.tx_id) for e in report.replayed] == [
+            ("TX_SUBMITTED", "done"),
+            ("TX_SUBMITTED", "sent"),
+            ("TX_SUBMITTED", "signed"),
+        ]
+        assert report.unrecoverable == {}
+        # A live delivery of the same submission is recognised as handled.
+        body, headers = delivery("TX_SUBMITTED", "d-late", timestamp=NOW + 6, txId="sent")
+        assert await receiver.handle(body, headers) == 200
+        assert receiver.stats.duplicates == 1
+        await client.close()
+
+    async def test_late_live_delivery_of_a_replayed_event_is_a_duplicate(self):
+        mark = HighWaterMark()
+        mark.advance(WebhookEvent(id="d-0", event="TX_FAILED", timestamp=NOW, data={}))
+        daemon = ReconcileDaemon([failed_log("TX_CONFIRMED", NOW + 1)], [tx("x", "CONFIRMED", NOW + 1)])
+        client = make_client(daemon)
+        receiver = EventReceiver([SECRET], clock=lambda: NOW + 2, high_water_mark=mark)
+        report = await receiver.reconcile(client, webhook_id="wh-1", master_password="pw")
+        assert len(report.replayed) == 1
+        body, headers = delivery("TX_CONFIRMED", "d-late", timestamp=NOW + 1, txId="x")
+        assert await receiver.handle(body, headers) == 200
+        assert receiver.stats.duplicates == 1
+        await client.close()
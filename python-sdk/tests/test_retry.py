@@ -1,10 +1,12 @@
 """Retry logic tests for WAIaaS SDK."""
 
+import httpx
 import pytest
 from unittest.mock import AsyncMock, patch
 
+from waiaas.client import WAIaaSClient
 from waiaas.errors import WAIaaSError
-from waiaas.retry import RetryPolicy, with_retry
+from waiaas.retry import RetryBudget, RetryPolicy, parse_retry_after, with_retry
 
 
 class TestRetryPolicy:
@@ -33,6 +35,16 @@ class TestRetryPolicy:
         assert policy.is_retryable_status(401) is False
         assert policy.is_retryable_status(404) is False
 
+    def test_is_idempotent(self):
+        policy = RetryPolicy()
+        assert policy.is_idempotent("GET") is True
+        assert policy.is_idempotent("delete") is True
+        assert policy.is_idempotent("POST") is False
+        assert policy.is_idempotent("POST", idempotency_key=True) is False
+        keyed = RetryPolicy(retry_with_idempotency_key=True)
+        assert keyed.is_idempotent("POST", idempotency_key=True) is True
+        assert keyed.is_idempotent("POST") is False
+
 
 class TestWithRetry:
     @patch("waiaas.retry.asyncio.sleep", new_callable=AsyncMock)
@@ -194,3 +206,228 @@ class TestWithRetry:
         delays = [call.args[0] for call in mock_sleep.call_args_list]
         # 2.0, 4.0, 5.0 (capped), 5.0 (capped)
         assert delays == [2.0, 4.0, 5.0, 5.0]
+
+
+def rate_limited(retry_after=None):
+    return WAIaaSError(
+        code="RATE_LIMITED",
+        message="Too many requests",
+        status_code=429,
+        retryable=True,
+        retry_after=retry_after,
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestJitter:
+    def test_full_jitter_stays_within_exponential_delay(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=8.0, jitter="full")
+        for attempt in range(6):
+            cap = min(2.0**attempt, 8.0)
+            delays = [policy.get_delay(attempt) for _ in range(200)]
+            assert all(0.0 <= d <= cap for d in delays)
+            assert len(set(delays)) > 100  # actually spread out
+
+    def test_decorrelated_jitter_grows_from_previous_delay(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=30.0, jitter="decorrelated")
+        for _ in range(200):
+            delay = policy.get_delay(3, previous=2.0)
+            assert 1.0 <= delay <= 6.0
+        assert all(policy.get_delay(0) <= 3.0 for _ in range(50))
+        assert all(policy.get_delay(9, previous=100.0) <= 30.0 for _ in range(50))
+
+    @patch("waiaas.retry.random.uniform", side_effect=lambda a, b: b)
+    @patch("waiaas.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_decorrelated_jitter_feeds_previous_delay(self, mock_sleep, _):
+        async def fn():
+            raise rate_limited()
+
+        with pytest.raises(WAIaaSError):
+            await with_retry(
+                fn, RetryPolicy(max_retries=3, base_delay=1.0, max_delay=20.0, jitter="decorrelated")
+            )
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [3.0, 9.0, 20.0]
+
+
+class TestRetryAfter:
+    @patch("waiaas.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_waits_at_least_retry_after(self, mock_sleep):
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise rate_limited(retry_after=7.0)
+            return "ok"
+
+        assert await with_retry(fn, RetryPolicy(base_delay=1.0)) == "ok"
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch("waiaas.retry.random.uniform", return_value=0.25)
+    @patch("waiaas.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_jitter_spreads_past_retry_after(self, mock_sleep, _):
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise rate_limited(retry_after=3.0)
+            return "ok"
+
+        await with_retry(fn, RetryPolicy(jitter="full"))
+        mock_sleep.assert_called_once_with(3.25)
+
+    @patch("waiaas.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_can_ignore_retry_after(self, mock_sleep):
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise rate_limited(retry_after=7.0)
+            return "ok"
+
+        await with_retry(fn, RetryPolicy(base_delay=1.0, respect_retry_after=False))
+        mock_sleep.assert_called_once_with(1.0)
+
+    @patch("waiaas.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_long_retry_after_is_not_retried(self, mock_sleep):
+        async def fn():
+            raise rate_limited(retry_after=600.0)
+
+        with pytest.raises(WAIaaSError):
+            await with_retry(fn, RetryPolicy(max_retry_after=60.0))
+        mock_sleep.assert_not_called()
+
+    @patch("waiaas.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_non_idempotent_call_is_not_retried_after_5xx(self, mock_sleep):
+        call_count = 0
+
+        async def fn():
+            nonlocal call_count
+            call_count += 1
+            raise WAIaaSError(code="BAD_GATEWAY", message="x", status_code=502, retryable=True)
+
+        with pytest.raises(WAIaaSError):
+            await with_retry(fn, RetryPolicy(), idempotent=False)
+        assert call_count == 1
+
+    @patch("waiaas.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_non_idempotent_call_is_retried_after_429(self, mock_sleep):
+        call_count = 0
+
+        async def fn():
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise WAIaaSError(code="RATE_LIMITED", message="x", status_code=429, retryable=True)
+            return "ok"
+
+        assert await with_retry(fn, RetryPolicy(), idempotent=False) == "ok"
+        assert call_count == 2
+
+
+class TestParseRetryAfter:
+    def test_delay_seconds(self):
+        assert parse_retry_after({"retry-after": "12"}) == 12.0
+
+    def test_http_date(self):
+        headers = {"retry-after": "Wed, 21 Oct 2015 07:28:30 GMT"}
+        assert parse_retry_after(headers, now=1445412500.0) == 10.0
+
+    def test_ratelimit_reset_delta_and_epoch(self):
+        assert parse_retry_after({"ratelimit-reset": "5"}) == 5.0
+        assert parse_retry_after({"x-ratelimit-reset": "1700000030"}, now=1700000000.0) == 30.0
+
+    def test_missing_or_garbage(self):
+        assert parse_retry_after({}) is None
+        assert parse_retry_after({"retry-after": "soon"}) is None
+
+    def test_error_from_response_reads_headers(self):
+        error = WAIaaSError.from_response(
+            429, {"code": "RATE_LIMITED", "retryable": True}, httpx.Headers({"Retry-After": "4"})
+        )
+        assert error.retry_after == 4.0
+
+
+class TestRetryBudget:
+    def test_starts_full_and_refuses_when_empty(self):
+        clock = FakeClock()
+        budget = RetryBudget(max_tokens=2.0, min_per_second=0.0, clock=clock)
+        assert budget.try_spend() is True
+        assert budget.try_spend() is True
+        assert budget.try_spend() is False
+        assert budget.stats.rejected == 1
+
+    def test_requests_earn_a_fraction_of_a_retry(self):
+        budget = RetryBudget(ratio=0.1, min_per_second=0.0, max_tokens=10.0, clock=FakeClock())
+        while budget.try_spend():
+            pass
+        for _ in range(10):
+            budget.record_request()
+        assert budget.try_spend() is True
+        assert budget.try_spend() is False
+
+    def test_min_rate_refills_over_time(self):
+        clock = FakeClock()
+        budget = RetryBudget(min_per_second=2.0, max_tokens=4.0, clock=clock)
+        while budget.try_spend():
+            pass
+        clock.now += 1.0
+        assert budget.tokens == pytest.approx(2.0)
+        clock.now += 100.0
+        assert budget.tokens == 4.0  # capped
+
+    @patch("waiaas.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_with_retry_stops_when_budget_is_spent(self, mock_sleep):
+        budget = RetryBudget(max_tokens=2.0, min_per_second=0.0, ratio=0.0, clock=FakeClock())
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            raise rate_limited()
+
+        with pytest.raises(WAIaaSError):
+            await with_retry(fn, RetryPolicy(max_retries=5, base_delay=0.0, budget=budget))
+        assert calls == 3  # first attempt + the 2 retries the budget held
+        assert budget.stats.requests == 1
+        assert budget.stats.retries == 2
+
+
+class TestClientRetryAfter:
+    @patch("waiaas.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_client_honours_retry_after_header(self, mock_sleep):
+        calls = 0
+
+        def handler(request):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return httpx.Response(
+                    429,
+                    json={"code": "RATE_LIMITED", "message": "slow down", "retryable": True},
+                    headers={"Retry-After": "2"},
+                )
+            return httpx.Response(200, json={"walletId": "w", "chain": "solana", "network": "devnet", "address": "a"})
+
+        client = WAIaaSClient(
+            "http://test",
+            "wai_sess_test_token",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://test"),
+            retry_policy=RetryPolicy(base_delay=0.5),
+        )
+        address = await client.get_address()
+        assert address.address == "a"
+        mock_sleep.assert_called_once_with(2.0)
+        await client.close()
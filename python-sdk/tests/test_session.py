@@ -0,0 +1,260 @@
+"""Session renewal tests for WAIaaS SDK."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from waiaas.client import WAIaaSClient
+from waiaas.errors import WAIaaSError
+from waiaas.retry import RetryPolicy
+from waiaas.session import SessionRenewer, token_claims
+
+from tests.conftest import make_session_token
+
+SESSION_ID = "sess-1"
+TTL = 3600
+
+
+def make_token(iat: int, exp: int | None, sid: str = SESSION_ID) -> str:
+    return make_session_token(iat, exp, sid)
+
+
+class FakeTime:
+    """Epoch clock with a sleep that advances it, hanging after ``limit`` sleeps."""
+
+    def __init__(self, limit: int = 100) -> None:
+        self.now = 1_000_000.0
+        self.sleeps: list[float] = []
+        self.limit = limit
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        if len(self.sleeps) > self.limit:
+            await asyncio.Event().wait()
+        self.now += delay
+        await asyncio.sleep(0)
+
+
+class SessionDaemon:
+    """Stand-in that accepts only the latest token and renews it like the daemon."""
+
+    def __init__(self, time: FakeTime) -> None:
+        self.time = time
+        self.token = make_token(int(time.now), int(time.now) + TTL)
+        self.rejected: set[str] = set()  # refused on reads, still renewable
+        self.renewals = 0
+        self.unauthorized = 0
+        self.seen: list[str] = []
+
+    def issue(self) -> str:
+        now = int(self.time.now)
+        self.token = make_token(now, now + TTL)
+        return self.token
+
+    def _401(self) -> httpx.Response:
+        self.unauthorized += 1
+        return httpx.Response(
+            401, json={"code": "TOKEN_EXPIRED", "message": "expired", "retryable": False}
+        )
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        self.seen.append(token)
+        claims = token_claims(token)
+        if token != self.token or self.time.now >= claims.expires_at:
+            return self._401()
+        if request.url.path == "/v1/webhooks":
+            return httpx.Response(
+                401,
+                json={"code": "INVALID_MASTER_PASSWORD", "message": "bad", "retryable": False},
+            )
+        if request.url.path == f"/v1/sessions/{SESSION_ID}/renew":
+            if self.time.now - claims.issued_at < TTL * 0.5:
+                return httpx.Response(
+                    403, json={"code": "RENEWAL_TOO_EARLY", "message": "early", "retryable": True}
+                )
+            self.renewals += 1
+            new = self.issue()
+            return httpx.Response(
+                200,
+                json={
+                    "id": SESSION_ID,
+                    "token": new,
+                    "expiresAt": token_claims(new).expires_at,
+                    "renewalCount": self.renewals,
+                },
+            )
+        if token in self.rejected:
+            return self._401()
+        return httpx.Response(
+            200, json={"walletId": "w", "chain": "solana", "network": "devnet", "address": "a"}
+        )
+
+
+def make_client(daemon: SessionDaemon, renewer: SessionRenewer) -> WAIaaSClient:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    return WAIaaSClient(
+        "http://test",
+        daemon.token,
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_retries=0),
+        renewer=renewer,
+    )
+
+
+class TestTokenClaims:
+    def test_reads_the_jwt_payload(self):
+        claims = token_claims(make_token(100, 200))
+        assert (claims.session_id, claims.issued_at, claims.expires_at) == (SESSION_ID, 100, 200)
+
+    def test_unlimited_session(self):
+        assert token_claims(make_token(100, None)).expires_at is None
+
+    def test_unreadable_tokens(self):
+        assert token_claims("wai_sess_test_token") is None
+        assert token_claims("wai_sess_a.!!!.c") is None
+        assert token_claims("bearer.a.b") is None
+
+
+class TestSessionRenewer:
+    def test_delay_until_the_renewal_point(self):
+        time = FakeTime()
+        renewer = SessionRenewer(renew_at=0.75, clock=time)
+        token = make_token(int(time.now), int(time.now) + 1000)
+        assert renewer.delay(token) == pytest.approx(750)
+        time.now += 900
+        assert renewer.delay(token) == 0.0
+        assert renewer.delay(make_token(0, None)) is None
+
+    def test_renewal_point_must_be_one_the_daemon_accepts(self):
+        with pytest.raises(ValueError):
+            SessionRenewer(renew_at=0.3)
+        with pytest.raises(ValueError):
+            SessionRenewer(renew_at=1.0)
+
+
+class TestClientRenewal:
+    async def test_renews_in_the_background_before_expiry(self):
+        time = FakeTime(limit=3)
+        daemon = SessionDaemon(time)
+        renewer = SessionRenewer(clock=time, sleep=time.sleep)
+        client = make_client(daemon, renewer)
+        async with client:
+            for _ in range(20):
+                await asyncio.sleep(0)
+        assert time.sleeps[:3] == [pytest.approx(TTL * 0.75)] * 3
+        assert daemon.renewals == 3
+        assert renewer.stats.renewals == 3
+        assert client.session_token == daemon.token
+        assert daemon.unauthorized == 0
+
+    async def test_unlimited_session_is_not_renewed(self):
+        time = FakeTime()
+        daemon = SessionDaemon(time)
+        daemon.token = make_token(int(time.now), None)
+        client = make_client(daemon, SessionRenewer(clock=time, sleep=time.sleep))
+        async with client:
+            await asyncio.sleep(0)
+        assert time.sleeps == []
+
+    async def test_401_renews_once_and_replays(self):
+        time = FakeTime(limit=0)
+        daemon = SessionDaemon(time)
+        renewer = SessionRenewer(clock=time, sleep=time.sleep)
+        client = make_client(daemon, renewer)
+        time.now += TTL * 0.6
+        daemon.rejected.add(daemon.token)  # e.g. the daemon's clock runs ahead
+        results = await asyncio.gather(*(client.get_address() for _ in range(10)))
+        assert len(results) == 10
+        assert daemon.renewals == 1
+        assert renewer.stats.replays == daemon.unauthorized >= 1
+        await client.close()
+
+    async def test_expired_token_falls_back_to_refresh(self):
+        time = FakeTime(limit=0)
+        daemon = SessionDaemon(time)
+        refreshes = 0
+
+        async def refresh() -> str:
+            nonlocal refreshes
+            refreshes += 1
+            return daemon.issue()
+
+        renewer = SessionRenewer(refresh=refresh, clock=time, sleep=time.sleep)
+        client = make_client(daemon, renewer)
+        time.now += TTL + 1
+        await asyncio.gather(*(client.get_address() for _ in range(5)))
+        assert refreshes == 1
+        assert renewer.stats.failures == 1  # the renewal the daemon refused
+        assert renewer.stats.refreshes == 1
+        await client.close()
+
+    async def test_without_refresh_the_401_is_raised(self):
+        time = FakeTime(limit=0)
+        daemon = SessionDaemon(time)
+        client = make_client(daemon, SessionRenewer(clock=time, sleep=time.sleep))
+        time.now += TTL + 1
+        with pytest.raises(WAIaaSError) as exc:
+            await client.get_address()
+        assert exc.value.status_code == 401
+        assert exc.value.code == "TOKEN_EXPIRED"
+        await client.close()
+
+    async def test_master_password_401_is_not_a_session_error(self):
+        time = FakeTime(limit=0)
+        daemon = SessionDaemon(time)
+        refreshes = 0
+
+        async def refresh() -> str:
+            nonlocal refreshes
+            refreshes += 1
+            return daemon.issue()
+
+        token = daemon.token
+        renewer = SessionRenewer(refresh=refresh, clock=time, sleep=time.sleep)
+        client = make_client(daemon, renewer)
+        time.now += TTL * 0.6  # renewable, were the 401 about the session
+        with pytest.raises(WAIaaSError) as exc:
+            await client.create_webhook("https://hook.test", master_password="wrong")
+        assert exc.value.code == "INVALID_MASTER_PASSWORD"
+        assert daemon.renewals == 0
+        assert refreshes == 0
+        assert renewer.stats.replays == 0
+        assert daemon.token == token
+        assert len(daemon.seen) == 1
+        await client.close()
+
+    async def test_new_calls_wait_for_a_refresh_in_progress(self):
+        time = FakeTime(limit=0)
+        daemon = SessionDaemon(time)
+        stale = daemon.token
+        gate = asyncio.Event()
+
+        async def refresh() -> str:
+            await gate.wait()
+            return daemon.issue()
+
+        client = make_client(
+            daemon, SessionRenewer(refresh=refresh, clock=time, sleep=time.sleep)
+        )
+        time.now += TTL + 1
+        first = asyncio.ensure_future(client.get_address())
+        for _ in range(10):
+            await asyncio.sleep(0)
+        second = asyncio.ensure_future(client.get_address())
+        for _ in range(10):
+            await asyncio.sleep(0)
+        sent = len(daemon.seen)
+        gate.set()
+        await asyncio.gather(first, second)
+        # Nothing more went out with the stale token while refreshing.
+        assert daemon.seen[sent:] == [daemon.token, daemon.token]
+        # Only the renewal attempt: the calls waited for it instead.
+        assert daemon.seen.count(stale) == 1
+        await client.close()
@@ -0,0 +1,173 @@
+"""Single-flight read coalescing tests for WAIaaS SDK."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from waiaas.deadline import current_deadline, deadline_scope
+from waiaas.errors import WAIaaSError
+from waiaas.retry import RetryPolicy
+from waiaas.singleflight import SingleFlight
+
+from tests.conftest import WALLET_ID
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_execution(self):
+        group: SingleFlight[int] = SingleFlight()
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(group.do("k", fn) for _ in range(10)))
+        assert results == [42] * 10
+        assert calls == 1
+        assert group.stats.requests == 10
+        assert group.stats.collapsed == 9
+
+    async def test_sequential_calls_do_not_share(self):
+        group: SingleFlight[int] = SingleFlight()
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await group.do("k", fn) == 1
+        assert await group.do("k", fn) == 2
+        assert group.stats.collapsed == 0
+
+    async def test_errors_propagate_to_all_waiters(self):
+        group: SingleFlight[int] = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.01)
+            raise WAIaaSError(code="BOOM", message="boom", status_code=500)
+
+        results = await asyncio.gather(
+            *(group.do("k", fn) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, WAIaaSError) for r in results)
+
+    async def test_cancelled_waiter_does_not_cancel_flight(self):
+        group: SingleFlight[str] = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.create_task(group.do("k", fn))
+        second = asyncio.create_task(group.do("k", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_flight_does_not_inherit_the_first_callers_deadline(self):
+        group: SingleFlight[object] = SingleFlight()
+
+        async def fn():
+            return current_deadline()
+
+        with deadline_scope(5.0):
+            assert await group.do("k", fn) is None
+
+
+def counting_balance_handler(counter: dict[str, int]):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        key = request.url.params.get("network", "default")
+        counter[key] = counter.get(key, 0) + 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(
+            200,
+            json={
+                "walletId": WALLET_ID,
+                "chain": "ethereum",
+                "network": key,
+                "address": "0xabc",
+                "balance": "1",
+                "decimals": 18,
+                "symbol": "ETH",
+            },
+        )
+
+    return handler
+
+
+class TestClientCoalescing:
+    async def test_disabled_by_default(self, make_client):
+        counter: dict[str, int] = {}
+        client = make_client(counting_balance_handler(counter))
+        await asyncio.gather(*(client.get_balance() for _ in range(5)))
+        assert counter == {"default": 5}
+        assert client.coalesce_stats is None
+
+    async def test_identical_reads_collapse(self, make_client):
+        counter: dict[str, int] = {}
+        client = make_client(counting_balance_handler(counter), coalesce_reads=True)
+        results = await asyncio.gather(
+            *(client.get_balance(network="polygon-mainnet") for _ in range(20))
+        )
+        assert all(r.network == "polygon-mainnet" for r in results)
+        assert counter == {"polygon-mainnet": 1}
+        assert client.coalesce_stats.collapsed == 19
+
+    async def test_joiner_is_not_bound_by_the_first_callers_deadline(self, make_client):
+        counter: dict[str, int] = {}
+        balance = counting_balance_handler(counter)
+
+        async def flaky(request: httpx.Request) -> httpx.Response:
+            if not counter:
+                counter["failed"] = 1
+                return httpx.Response(
+                    503, json={"code": "UNAVAILABLE", "message": "busy", "retryable": True}
+                )
+            return await balance(request)
+
+        client = make_client(
+            flaky, retry_policy=RetryPolicy(max_retries=1, base_delay=0.05), coalesce_reads=True
+        )
+
+        async def hurried():
+            # Too short for the retry, which must not doom the joiner.
+            with deadline_scope(0.03):
+                await client.get_balance()
+
+        first = asyncio.ensure_future(hurried())
+        await asyncio.sleep(0)
+        patient = asyncio.ensure_future(client.get_balance())
+        with pytest.raises(WAIaaSError) as exc:
+            await first
+        assert exc.value.code == "DEADLINE_EXCEEDED"
+        assert (await patient).balance == "1"
+        assert counter == {"failed": 1, "default": 1}
+        await client.close()
+
+    async def test_different_params_not_collapsed(self, make_client):
+        counter: dict[str, int] = {}
+        client = make_client(counting_balance_handler(counter), coalesce_reads=True)
+        await asyncio.gather(
+            client.get_balance(network="polygon-mainnet"),
+            client.get_balance(network="ethereum-mainnet"),
+        )
+        assert counter == {"polygon-mainnet": 1, "ethereum-mainnet": 1}
+
+    async def test_writes_never_collapse(self, make_client):
+        posts = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal posts
+            posts += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(201, json={"id": "tx", "status": "PENDING"})
+
+        client = make_client(handler, coalesce_reads=True)
+        await asyncio.gather(*(client.send_token(to="a", amount="1") for _ in range(3)))
+        assert posts == 3
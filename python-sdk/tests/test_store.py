@@ -0,0 +1,221 @@
+"""Local transaction store tests for WAIaaS SDK."""
+
+import base64
+import json
+
+import httpx
+import pytest
+
+from waiaas.client import WAIaaSClient
+from waiaas.errors import WAIaaSError
+from waiaas.store import TransactionStore
+
+NOW = 1_700_000_000
+
+
+def tx(n: int, status: str = "CONFIRMED", network: str = "solana-devnet") -> dict:
+    # Zero-padded ids sort like the daemon's UUIDv7 ids: newer is greater.
+    return {
+        "id": f"tx-{n:04d}",
+        "walletId": "w-1",
+        "type": "TRANSFER",
+        "status": status,
+        "tier": None,
+        "chain": "solana",
+        "network": network,
+        "toAddress": "addr",
+        "amount": "1",
+        "txHash": None,
+        "error": None,
+        "createdAt": NOW + n,
+    }
+
+
+def incoming(n: int, status: str = "CONFIRMED", token: str | None = None) -> dict:
+    return {
+        "id": f"in-{n:04d}",
+        "txHash": f"0x{n}",
+        "walletId": "w-1",
+        "fromAddress": "sender",
+        "amount": "5",
+        "tokenAddress": token,
+        "chain": "solana",
+        "network": "solana-devnet",
+        "status": status,
+        "detectedAt": NOW + n,
+    }
+
+
+class StoreDaemon:
+    """Stand-in for the transaction routes, paging like the daemon."""
+
+    def __init__(self) -> None:
+        self.transactions: dict[str, dict] = {}
+        self.incoming: dict[str, dict] = {}
+        self.requests: list[httpx.Request] = []
+        self.fail_after: int | None = None
+
+    def add(self, *items: dict) -> None:
+        for item in items:
+            table = self.incoming if item["id"].startswith("in-") else self.transactions
+            table[item["id"]] = item
+
+    def count(self, path: str) -> int:
+        return sum(1 for r in self.requests if r.url.path == path)
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.fail_after is not None and len(self.requests) > self.fail_after:
+            return httpx.Response(400, json={"code": "BROKEN", "message": "x", "retryable": False})
+        path, params = request.url.path, request.url.params
+        limit = int(params["limit"]) if "limit" in params else 20
+        if path == "/v1/transactions":
+            rows = sorted(self.transactions.values(), key=lambda t: t["id"], reverse=True)
+            if "cursor" in params:
+                rows = [t for t in rows if t["id"] < params["cursor"]]
+            page, more = rows[:limit], len(rows) > limit
+            return httpx.Response(
+                200,
+                json={"items": page, "cursor": page[-1]["id"] if page else None, "hasMore": more},
+            )
+        if path.startswith("/v1/transactions/"):
+            return httpx.Response(200, json=self.transactions[path.rsplit("/", 1)[1]])
+        if path == "/v1/wallet/incoming":
+            status = params.get("status", "CONFIRMED")
+            rows = [i for i in self.incoming.values() if i["status"] == status]
+            if "since" in params:
+                rows = [i for i in rows if i["detectedAt"] >= int(params["since"])]
+            rows.sort(key=lambda i: (i["detectedAt"], i["id"]), reverse=True)
+            if "cursor" in params:
+                at, after = json.loads(base64.urlsafe_b64decode(params["cursor"]))
+                rows = [i for i in rows if (i["detectedAt"], i["id"]) < (at, after)]
+            page, more = rows[:limit], len(rows) > limit
+            cursor = None
+            if more:
+                last = [page[-1]["detectedAt"], page[-1]["id"]]
+                cursor = base64.urlsafe_b64encode(json.dumps(last).encode()).decode()
+            return httpx.Response(200, json={"data": page, "nextCursor": cursor, "hasMore": more})
+        return httpx.Response(404, json={"code": "NOT_FOUND", "message": "x", "retryable": False})
+
+
+@pytest.fixture
+def daemon() -> StoreDaemon:
+    return StoreDaemon()
+
+
+@pytest.fixture
+async def client(daemon: StoreDaemon):
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    client = WAIaaSClient("http://test", "wai_sess_test_token", http_client=http_client)
+    yield client
+    await client.close()
+
+
+class TestTransactionSync:
+    async def test_second_sync_fetches_only_new_pages(self, daemon, client):
+        daemon.add(*(tx(n) for n in range(250)))
+        store = TransactionStore()
+        report = await store.sync(client, incoming=False)
+        assert report.transactions_added == 250
+        assert daemon.count("/v1/transactions") == 3
+
+        daemon.add(tx(250), tx(251))
+        daemon.requests.clear()
+        report = await store.sync(client, incoming=False)
+        assert report.transactions_added == 2
+        assert report.pages == 1
+        assert len(store.transactions()) == 252
+
+    async def test_non_terminal_rows_are_refreshed(self, daemon, client):
+        daemon.add(tx(1, "PENDING"), tx(2, "CONFIRMED"), tx(3, "SUBMITTED"))
+        store = TransactionStore()
+        await store.sync(client, incoming=False)
+
+        daemon.add(tx(1, "CONFIRMED"), tx(3, "FAILED"))
+        daemon.requests.clear()
+        report = await store.sync(client, incoming=False)
+        assert report.refreshed == 2
+        assert report.transactions_updated == 2
+        assert daemon.count("/v1/transactions/tx-0002") == 0
+
+        daemon.requests.clear()
+        report = await store.sync(client, incoming=False)
+        assert report.refreshed == 0 and report.pages == 1
+
+    async def test_interrupted_sync_resumes_from_its_cursor(self, daemon, client, tmp_path):
+        path = str(tmp_path / "store.db")
+        daemon.add(*(tx(n) for n in range(300)))
+        daemon.fail_after = 2
+        with TransactionStore(path) as store:
+            with pytest.raises(WAIaaSError):
+                await store.sync(client, incoming=False)
+            assert len(store.transactions()) == 200
+
+        daemon.fail_after = None
+        daemon.requests.clear()
+        with TransactionStore(path) as store:
+            report = await store.sync(client, incoming=False)
+            assert report.pages == 1 and report.transactions_added == 100
+            assert daemon.requests[0].url.params["cursor"] == "tx-0100"
+
+            daemon.add(tx(300))
+            daemon.requests.clear()
+            report = await store.sync(client, incoming=False)
+            assert report.transactions_added == 1
+            assert "cursor" not in daemon.requests[0].url.params
+            assert len(store.transactions()) == 301
+
+
+class TestIncomingSync:
+    async def test_since_watermark_and_pending_rows(self, daemon, client):
+        daemon.add(incoming(1), incoming(2, "DETECTED"), incoming(3))
+        store = TransactionStore()
+        report = await store.sync(client, transactions=False)
+        assert report.incoming_added == 3
+
+        daemon.add(incoming(2, "CONFIRMED"), incoming(4, "DETECTED"))
+        daemon.requests.clear()
+        report = await store.sync(client, transactions=False)
+        assert (report.incoming_added, report.incoming_updated) == (1, 1)
+        detected, confirmed = (r.url.params for r in daemon.requests)
+        assert detected["since"] == str(NOW + 2)
+        # Reaches back to the row that was still DETECTED, not further.
+        assert confirmed["since"] == str(NOW + 2)
+        assert [i.status for i in store.incoming_transactions()] == [
+            "DETECTED",
+            "CONFIRMED",
+            "CONFIRMED",
+            "CONFIRMED",
+        ]
+
+
+class TestQueries:
+    async def test_filters_and_order(self, daemon, client):
+        daemon.add(
+            tx(1, "FAILED"),
+            tx(2, "CONFIRMED", network="solana-mainnet"),
+            tx(3, "CONFIRMED"),
+            incoming(1, token="usdc"),
+            incoming(2),
+        )
+        store = TransactionStore()
+        await store.sync(client)
+
+        assert [t.id for t in store.transactions()] == ["tx-0003", "tx-0002", "tx-0001"]
+        assert [t.id for t in store.transactions(status="CONFIRMED")] == ["tx-0003", "tx-0002"]
+        assert [t.network for t in store.transactions(network="solana-mainnet")] == ["solana-mainnet"]
+        assert [t.id for t in store.transactions(since=NOW + 2, until=NOW + 2)] == ["tx-0002"]
+        assert [t.id for t in store.transactions(limit=1)] == ["tx-0003"]
+        assert [i.id for i in store.incoming_transactions(token="usdc")] == ["in-0001"]
+        assert store.incoming_transactions(wallet_id="other") == []
+
+    def test_query_plans_use_indexes(self):
+        store = TransactionStore()
+        plan = store._db.execute(
+            "EXPLAIN QUERY PLAN SELECT data FROM incoming WHERE token_address = ? "
+            "AND detected_at >= ? ORDER BY detected_at DESC",
+            ("usdc", NOW),
+        ).fetchall()
+        assert "incoming_token" in str(plan)
@@ -0,0 +1,201 @@
+"""Transport construction tests for WAIaaS SDK."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from waiaas.client import WAIaaSClient
+from waiaas.retry import RetryPolicy
+from waiaas.transport import PoolLimits, build_http_client, resolve_base_url
+
+from tests.conftest import WALLET_ID
+
+
+class TestPoolLimits:
+    def test_defaults_match_httpx(self):
+        limits = PoolLimits().to_httpx()
+        assert limits.max_connections == 100
+        assert limits.max_keepalive_connections == 20
+        assert limits.keepalive_expiry == 5.0
+
+    def test_max_in_flight(self):
+        assert PoolLimits().max_in_flight is None
+        assert PoolLimits(max_connections=2, max_streams=50).max_in_flight == 100
+
+
+class TestBuildHttpClient:
+    async def test_http1_by_default(self):
+        client = build_http_client(
+            "http://localhost:3100", timeout=5.0, headers={}
+        )
+        try:
+            assert client._transport._pool._http1 is True
+            assert client._transport._pool._http2 is False
+        finally:
+            await client.aclose()
+
+    async def test_http2_cleartext_keeps_http1(self):
+        pytest.importorskip("h2")
+        client = build_http_client(
+            "http://localhost:3100", timeout=5.0, headers={}, http2=True
+        )
+        try:
+            assert client._transport._pool._http1 is True
+            assert client._transport._pool._http2 is True
+        finally:
+            await client.aclose()
+
+    async def test_http2_prior_knowledge_is_opt_in(self):
+        pytest.importorskip("h2")
+        client = WAIaaSClient(
+            "http://localhost:3100", "wai_sess_test", http2_prior_knowledge=True
+        )
+        try:
+            assert client._client._transport._pool._http1 is False
+            assert client._client._transport._pool._http2 is True
+        finally:
+            await client.close()
+
+    async def test_http2_tls_keeps_http1_fallback(self):
+        pytest.importorskip("h2")
+        client = build_http_client(
+            "https://daemon.example", timeout=5.0, headers={}, http2=True
+        )
+        try:
+            assert client._transport._pool._http1 is True
+            assert client._transport._pool._http2 is True
+        finally:
+            await client.aclose()
+
+    async def test_pool_limits_applied(self):
+        client = build_http_client(
+            "http://localhost:3100",
+            timeout=5.0,
+            headers={},
+            pool_limits=PoolLimits(max_connections=4, keepalive_expiry=30.0),
+        )
+        try:
+            pool = client._transport._pool
+            assert pool._max_connections == 4
+            assert pool._keepalive_expiry == 30.0
+        finally:
+            await client.aclose()
+
+
+class TestStreamSlots:
+    async def test_max_streams_bounds_in_flight_requests(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(
+                200,
+                json={
+                    "walletId": WALLET_ID,
+                    "chain": "solana",
+                    "network": "devnet",
+                    "address": "addr",
+                },
+            )
+
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="http://test"
+        )
+        client = WAIaaSClient(
+            "http://test",
+            "wai_sess_test_token",
+            http_client=http_client,
+            retry_policy=RetryPolicy(max_retries=0),
+            pool_limits=PoolLimits(max_connections=1, max_streams=3),
+        )
+        await asyncio.gather(*(client.get_address() for _ in range(10)))
+        assert peak == 3
+
+
+class TestResolveBaseUrl:
+    def test_tcp_url_passthrough(self):
+        assert resolve_base_url("http://localhost:3100/") == (
+            "http://localhost:3100",
+            None,
+        )
+
+    def test_unix_url(self):
+        assert resolve_base_url("unix:///run/waiaas.sock") == (
+            "http://localhost",
+            "/run/waiaas.sock",
+        )
+
+    def test_explicit_uds_keeps_base_url(self):
+        assert resolve_base_url("http://daemon", "/tmp/d.sock") == (
+            "http://daemon",
+            "/tmp/d.sock",
+        )
+
+    def test_unix_url_and_uds_rejected(self):
+        with pytest.raises(ValueError):
+            resolve_base_url("unix:///run/waiaas.sock", "/tmp/other.sock")
+
+    def test_unix_url_without_path_rejected(self):
+        with pytest.raises(ValueError):
+            resolve_base_url("unix://")
+
+
+@pytest.mark.skipif(not hasattr(asyncio, "start_unix_server"), reason="no AF_UNIX")
+class TestUnixSocketTransport:
+    async def _serve(self, socket_path: str, seen: list[str]):
+        async def on_connect(reader, writer):
+            head = await reader.readuntil(b"\r\n\r\n")
+            seen.append(head.decode().split("\r\n")[0])
+            body = json.dumps(
+                {
+                    "walletId": WALLET_ID,
+                    "chain": "solana",
+                    "network": "devnet",
+                    "address": "addr",
+                }
+            ).encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+            writer.close()
+
+        return await asyncio.start_unix_server(on_connect, path=socket_path)
+
+    async def test_unix_base_url_routes_over_socket(self, tmp_path):
+        socket_path = str(tmp_path / "daemon.sock")
+        seen: list[str] = []
+        server = await self._serve(socket_path, seen)
+        try:
+            async with WAIaaSClient(
+                f"unix://{socket_path}", "wai_sess_test_token"
+            ) as client:
+                result = await client.get_address()
+            assert result.wallet_id == WALLET_ID
+            assert seen == ["GET /v1/wallet/address HTTP/1.1"]
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    async def test_uds_option(self, tmp_path):
+        socket_path = str(tmp_path / "daemon.sock")
+        seen: list[str] = []
+        server = await self._serve(socket_path, seen)
+        try:
+            async with WAIaaSClient(
+                "http://localhost:3100", "wai_sess_test_token", uds=socket_path
+            ) as client:
+                await client.get_address()
+            assert len(seen) == 1
+        finally:
+            server.close()
+            await server.wait_closed()
@@ -0,0 +1,233 @@
+"""Batched transaction waiter tests for WAIaaS SDK."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from waiaas.client import WAIaaSClient
+from waiaas.deadline import deadline_scope
+from waiaas.errors import WAIaaSError
+from waiaas.retry import RetryPolicy
+
+from tests.conftest import WALLET_ID
+
+
+def tx_id(i: int) -> str:
+    """Time-ordered ids, like the daemon's UUIDv7s."""
+    return f"01900000-0000-7000-8000-{i:012d}"
+
+
+class LedgerDaemon:
+    """Stand-in serving transaction status from a mutable ledger.
+
+    ``ledger`` maps id -> status for the session wallet; ``foreign`` holds
+    transactions of other wallets, reachable only by id.
+    """
+
+    def __init__(self, ledger: dict[str, str]) -> None:
+        self.ledger = ledger
+        self.foreign: dict[str, str] = {}
+        self.calls: dict[str, int] = {"pending": 0, "list": 0, "get": 0}
+        self.delay = 0.0  # seconds each per-id lookup takes
+
+    @staticmethod
+    def detail(i: str, status: str) -> dict:
+        return {
+            "id": i,
+            "walletId": WALLET_ID,
+            "type": "TRANSFER",
+            "status": status,
+            "chain": "solana",
+        }
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/v1/transactions/pending":
+            self.calls["pending"] += 1
+            items = [
+                self.detail(i, s)
+                for i, s in sorted(self.ledger.items(), reverse=True)
+                if s in ("PENDING", "QUEUED")
+            ]
+            return httpx.Response(200, json={"items": items})
+        if path == "/v1/transactions":
+            self.calls["list"] += 1
+            ids = sorted(self.ledger, reverse=True)
+            cursor = request.url.params.get("cursor")
+            if cursor:
+                ids = [i for i in ids if i < cursor]
+            limit = int(request.url.params["limit"])
+            page = ids[:limit]
+            return httpx.Response(
+                200,
+                json={
+                    "items": [self.detail(i, self.ledger[i]) for i in page],
+                    "cursor": page[-1] if page else None,
+                    "hasMore": len(ids) > limit,
+                },
+            )
+        tx = path.rsplit("/", 1)[-1]
+        self.calls["get"] += 1
+        await asyncio.sleep(self.delay)
+        status = self.ledger.get(tx) or self.foreign.get(tx)
+        if status is None:
+            return httpx.Response(404, json={"code": "TX_NOT_FOUND", "message": "nope"})
+        return httpx.Response(200, json=self.detail(tx, status))
+
+
+def make_client(daemon: LedgerDaemon) -> WAIaaSClient:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(daemon.handler), base_url="http://test"
+    )
+    return WAIaaSClient(
+        "http://test",
+        "wai_sess_test_token",
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_retries=0),
+    )
+
+
+async def advance(daemon: LedgerDaemon, steps: list[dict[str, str]], delay: float) -> None:
+    for step in steps:
+        await asyncio.sleep(delay)
+        daemon.ledger.update(step)
+
+
+class TestWaitForTransactions:
+    async def test_yields_in_completion_order(self):
+        ids = [tx_id(i) for i in range(3)]
+        daemon = LedgerDaemon(dict.fromkeys(ids, "PENDING"))
+        client = make_client(daemon)
+        mover = asyncio.ensure_future(
+            advance(
+                daemon,
+                [{ids[2]: "CONFIRMED", ids[0]: "SUBMITTED"}, {ids[0]: "FAILED"}, {ids[1]: "CONFIRMED"}],
+                0.03,
+            )
+        )
+        done = [
+            (tx.id, tx.status)
+            async for tx in client.wait_for_transactions(ids, poll_interval=0.01, max_interval=0.02)
+        ]
+        await mover
+        assert done == [(ids[2], "CONFIRMED"), (ids[0], "FAILED"), (ids[1], "CONFIRMED")]
+        assert daemon.calls["list"] > 0  # SUBMITTED ids found without per-id lookups
+        await client.close()
+
+    async def test_pending_list_covers_unchanged_ids_in_one_call(self):
+        ids = [tx_id(i) for i in range(200)]
+        daemon = LedgerDaemon(dict.fromkeys(ids, "QUEUED"))
+        client = make_client(daemon)
+        waiting = client.wait_for_transactions(ids, timeout=0.05, poll_interval=0.01)
+        with pytest.raises(WAIaaSError) as exc:
+            async for _ in waiting:
+                pass
+        assert exc.value.code == "WAIT_TIMEOUT"
+        assert len(exc.value.details["pending"]) == 200
+        assert daemon.calls["list"] == 0
+        assert daemon.calls["get"] == 0
+        await client.close()
+
+    async def test_falls_back_to_single_lookups_for_other_wallets(self):
+        ids = [tx_id(i) for i in range(3)]
+        daemon = LedgerDaemon({ids[0]: "CONFIRMED"})
+        daemon.foreign = {ids[1]: "CONFIRMED", ids[2]: "EXPIRED"}
+        client = make_client(daemon)
+        done = {tx.id async for tx in client.wait_for_transactions(ids)}
+        assert done == set(ids)
+        assert daemon.calls["get"] == 2
+        await client.close()
+
+    async def test_list_scan_stops_at_oldest_wanted_id(self):
+        ledger = {tx_id(i): "CONFIRMED" for i in range(1000)}
+        daemon = LedgerDaemon(ledger)
+        client = make_client(daemon)
+        wanted = [tx_id(990), tx_id(950)]
+        done = [tx.id async for tx in client.wait_for_transactions(wanted)]
+        assert sorted(done) == sorted(wanted)
+        assert daemon.calls["list"] == 1
+        await client.close()
+
+    async def test_single_id_uses_get_transaction(self):
+        daemon = LedgerDaemon({tx_id(1): "CONFIRMED"})
+        client = make_client(daemon)
+        done = [tx async for tx in client.wait_for_transactions([tx_id(1)])]
+        assert done[0].status == "CONFIRMED"
+        assert daemon.calls == {"pending": 0, "list": 0, "get": 1}
+        await client.close()
+
+    async def test_custom_terminal_statuses(self):
+        daemon = LedgerDaemon({tx_id(1): "SUBMITTED"})
+        client = make_client(daemon)
+        done = [
+            tx
+            async for tx in client.wait_for_transactions(
+                [tx_id(1)], terminal_statuses={"SUBMITTED"}
+            )
+        ]
+        assert done[0].status == "SUBMITTED"
+        await client.close()
+
+    async def test_backs_off_while_nothing_changes(self):
+        daemon = LedgerDaemon({tx_id(1): "PENDING"})
+        client = make_client(daemon)
+        with pytest.raises(WAIaaSError):
+            async for _ in client.wait_for_transactions(
+                [tx_id(1)], timeout=0.3, poll_interval=0.01, max_interval=1.0
+            ):
+                pass
+        # 0.01 * 1.5^n: ~9 rounds fit in 0.3s instead of 30 at a fixed interval.
+        assert daemon.calls["get"] < 12
+        await client.close()
+
+    async def test_errors_propagate(self):
+        daemon = LedgerDaemon({})
+        client = make_client(daemon)
+        with pytest.raises(WAIaaSError) as exc:
+            async for _ in client.wait_for_transactions([tx_id(7)]):
+                pass
+        assert exc.value.code == "TX_NOT_FOUND"
+        await client.close()
+
+    async def test_missing_id_fails_only_its_own_wait(self):
+        ids = [tx_id(i) for i in range(3)]
+        daemon = LedgerDaemon({ids[0]: "PENDING", ids[1]: "PENDING"})
+        client = make_client(daemon)
+        mover = asyncio.ensure_future(advance(daemon, [{ids[0]: "CONFIRMED", ids[1]: "FAILED"}], 0.03))
+        done = []
+        with pytest.raises(WAIaaSError) as exc:
+            async for tx in client.wait_for_transactions(ids, poll_interval=0.01):
+                done.append(tx.id)
+        await mover
+        assert sorted(done) == ids[:2]  # still waited for after ids[2] got a 404
+        assert exc.value.code == "TX_NOT_FOUND"
+        assert exc.value.details == {"not_found": [ids[2]]}
+        await client.close()
+
+    async def test_timeout_bounds_a_slow_round(self):
+        daemon = LedgerDaemon({})
+        daemon.foreign = {tx_id(1): "PENDING"}
+        daemon.delay = 1.0
+        client = make_client(daemon)
+        started = asyncio.get_running_loop().time()
+        with pytest.raises(WAIaaSError) as exc:
+            async for _ in client.wait_for_transactions([tx_id(1)], timeout=0.05):
+                pass
+        assert exc.value.code == "WAIT_TIMEOUT"
+        assert exc.value.details == {"pending": [tx_id(1)]}
+        assert asyncio.get_running_loop().time() - started < 0.5
+        await client.close()
+
+    async def test_enclosing_deadline_scope_times_out_the_wait(self):
+        daemon = LedgerDaemon({})
+        daemon.foreign = {tx_id(1): "PENDING"}
+        daemon.delay = 1.0
+        client = make_client(daemon)
+        with pytest.raises(WAIaaSError) as exc:
+            with deadline_scope(0.05):
+                async for _ in client.wait_for_transactions([tx_id(1)], timeout=10):
+                    pass
+        assert exc.value.code == "WAIT_TIMEOUT"
+        assert exc.value.details == {"pending": [tx_id(1)]}
+        await client.close()
@@ -1,7 +1,24 @@
 """WAIaaS Python SDK -- AI Agent Wallet-as-a-Service client."""
 
+from waiaas.balancer import LoadBalancer
+from waiaas.cache import CachePolicy, ResponseCache
+from waiaas.circuit import CircuitBreaker
 from waiaas.client import WAIaaSClient
+from waiaas.concurrency import AdaptiveConcurrency
+from waiaas.conditional import ValidatorCache
+from waiaas.deadline import deadline_scope
+from waiaas.decoding import ValidationMode
 from waiaas.errors import WAIaaSError
+from waiaas.events import EventReceiver
+from waiaas.hedging import RequestHedger
+from waiaas.inflight import DrainReport, InFlightRequest
+from waiaas.lazy import LazyList
+from waiaas.pool import WAIaaSClientPool
+from waiaas.ratelimit import RateLimiter
+from waiaas.reconcile import HighWaterMark, ReconcileReport
+from waiaas.session import SessionRenewer
+from waiaas.store import TransactionStore
+from waiaas.transport import PoolLimits
 from waiaas.models import (
     ActionResponse,
     GasCondition,
@@ -22,6 +39,10 @@ from waiaas.models import (
     WcDisconnectResponse,
     WcPairingResponse,
     WcSessionInfo,
+    Webhook,
+    WebhookCreated,
+    WebhookEvent,
+    WebhookLog,
     X402FetchRequest,
     X402FetchResponse,
     X402PaymentInfo,
@@ -31,7 +52,27 @@ __version__ = "1.7.0"
 
 __all__ = [
     "WAIaaSClient",
+    "WAIaaSClientPool",
     "WAIaaSError",
+    "PoolLimits",
+    "CachePolicy",
+    "ResponseCache",
+    "ValidatorCache",
+    "RateLimiter",
+    "CircuitBreaker",
+    "AdaptiveConcurrency",
+    "RequestHedger",
+    "LoadBalancer",
+    "SessionRenewer",
+    "DrainReport",
+    "EventReceiver",
+    "HighWaterMark",
+    "ReconcileReport",
+    "TransactionStore",
+    "InFlightRequest",
+    "deadline_scope",
+    "ValidationMode",
+    "LazyList",
     "ActionResponse",
     "GasCondition",
     "WalletAddress",
@@ -51,6 +92,10 @@ __all__ = [
     "WcDisconnectResponse",
     "WcPairingResponse",
     "WcSessionInfo",
+    "Webhook",
+    "WebhookCreated",
+    "WebhookEvent",
+    "WebhookLog",
     "X402FetchRequest",
     "X402FetchResponse",
     "X402PaymentInfo",
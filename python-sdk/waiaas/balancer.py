@@ -0,0 +1,205 @@
+"""Load balancing across several daemon replicas."""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Literal, Optional, Sequence
+
+import httpx
+
+from waiaas.concurrency import Outcome
+from waiaas.transport import UNIX_SCHEME
+
+# How a read picks its replica: fewest requests in flight, or lowest
+# peak-EWMA latency weighted by requests in flight.
+Strategy = Literal["least_outstanding", "peak_ewma"]
+STRATEGIES: tuple[str, ...] = ("least_outstanding", "peak_ewma")
+
+# Unauthenticated daemon route answering 200 while the daemon is up.
+HEALTH_PATH = "/health"
+
+# Errors raised before the request reached the daemon; a read that hits
+# one is resent to another replica.
+FAILOVER_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+@dataclass
+class EndpointState:
+    """What a LoadBalancer knows about one replica."""
+
+    url: str
+    healthy: bool = True
+    outstanding: int = 0  # requests in flight
+    latency: Optional[float] = None  # peak-EWMA seconds, None before the first answer
+    requests: int = 0
+    failures: int = 0  # transport errors and 5xx answers
+    checked_at: float = float("-inf")  # last health check
+    sampled_at: float = 0.0  # last latency sample
+
+
+@dataclass
+class BalancerStats:
+    """Counters for a LoadBalancer."""
+
+    requests: int = 0  # requests sent, failovers included
+    failovers: int = 0  # reads resent to another replica after a connection error
+    health_checks: int = 0
+    marked_down: int = 0  # times a healthy replica was taken out of rotation
+
+
+@dataclass
+class LoadBalancer:
+    """Spread reads over daemon replicas; pin writes to the primary.
+
+    ``endpoints`` are the replicas' base URLs; the first one is the
+    primary.  GETs go to a healthy replica chosen by ``strategy``:
+
+    * ``"least_outstanding"`` -- the one with the fewest requests in flight.
+    * ``"peak_ewma"`` -- the lowest latency times (requests in flight + 1),
+      where latency jumps to any slower sample and decays back over
+      ``decay`` seconds, so a replica that slows down is avoided at once.
+
+    Every other method goes to the primary, so transactions, signing and
+    actions are never split across daemons.
+
+    A replica that refuses a connection is marked down and the read is
+    resent to another one.  Each replica is health-checked via
+    ``GET /health`` every ``health_interval`` seconds (the client starts
+    the checks in the background as requests come in); a down replica
+    rejoins once a check passes.  If every replica is down, reads still
+    try them rather than failing without a request.
+
+    Pass an instance as ``WAIaaSClient(balancer=...)``; requests then go
+    to the balancer's endpoints rather than the client's ``base_url``.
+    """
+
+    endpoints: Sequence[str]
+    strategy: Strategy = "peak_ewma"
+    health_interval: float = 10.0  # seconds
+    health_timeout: float = 2.0  # seconds
+    decay: float = 10.0  # seconds
+    clock: Callable[[], float] = time.monotonic
+    stats: BalancerStats = field(default_factory=BalancerStats)
+
+    def __post_init__(self) -> None:
+        if not self.endpoints:
+            raise ValueError("LoadBalancer needs at least one endpoint")
+        if self.strategy not in STRATEGIES:
+            raise ValueError(
+                f"Unknown strategy {self.strategy!r}; expected one of {STRATEGIES}"
+            )
+        for url in self.endpoints:
+            if url.startswith(UNIX_SCHEME):
+                raise ValueError(f"LoadBalancer endpoints must be http(s) URLs, got {url!r}")
+        self._states = [EndpointState(url.rstrip("/")) for url in self.endpoints]
+        self._by_url = {state.url: state for state in self._states}
+        self._next = 0
+
+    @property
+    def primary(self) -> str:
+        """Base URL that receives every write."""
+        return self._states[0].url
+
+    @property
+    def states(self) -> list[EndpointState]:
+        """Per-replica state, primary first."""
+        return list(self._states)
+
+    def state(self, url: str) -> EndpointState:
+        """State of the replica at ``url``."""
+        return self._by_url[url]
+
+    def pick(self, method: str, exclude: Sequence[str] = ()) -> Optional[str]:
+        """Choose the replica for a request.
+
+        Args:
+            method: HTTP method; anything but GET goes to the primary.
+            exclude: Replicas already tried for this request.
+
+        Returns:
+            A base URL, or None if every replica is excluded.
+        """
+        if method != "GET":
+            return None if self.primary in exclude else self.primary
+        candidates = [s for s in self._states if s.url not in exclude]
+        healthy = [s for s in candidates if s.healthy]
+        candidates = healthy or candidates
+        if not candidates:
+            return None
+        # Rotate the starting point so ties are broken round-robin.
+        start = self._next % len(candidates)
+        self._next += 1
+        ordered = candidates[start:] + candidates[:start]
+        return min(ordered, key=self._cost).url
+
+    def _cost(self, state: EndpointState) -> float:
+        if self.strategy == "least_outstanding":
+            return float(state.outstanding)
+        if state.latency is None:
+            # Unmeasured: one request at a time until it answers.
+            return 0.0 if state.outstanding == 0 else math.inf
+        return state.latency * (state.outstanding + 1)
+
+    def begin(self, url: str) -> float:
+        """Count a request sent to ``url``.
+
+        Returns:
+            The start time to pass back to ``finish``.
+        """
+        state = self._by_url[url]
+        state.outstanding += 1
+        state.requests += 1
+        self.stats.requests += 1
+        return self.clock()
+
+    def finish(self, url: str, started: float, outcome: Outcome) -> None:
+        """Record how a request to ``url`` ended.
+
+        Args:
+            url: Replica the request went to.
+            started: Value returned by ``begin``.
+            outcome: ``"success"`` adds a latency sample, ``"dropped"``
+                counts a failure, ``"ignored"`` (e.g. cancellation) neither.
+        """
+        state = self._by_url[url]
+        state.outstanding -= 1
+        if outcome == "dropped":
+            state.failures += 1
+            return
+        if outcome != "success":
+            return
+        now = self.clock()
+        latency = now - started
+        if state.latency is None or latency > state.latency:
+            state.latency = latency
+        else:
+            weight = math.exp(-(now - state.sampled_at) / self.decay)
+            state.latency = state.latency * weight + latency * (1.0 - weight)
+        state.sampled_at = now
+
+    def mark_down(self, url: str) -> None:
+        """Take ``url`` out of rotation until a health check passes."""
+        state = self._by_url[url]
+        if state.healthy:
+            state.healthy = False
+            self.stats.marked_down += 1
+
+    def mark_health(self, url: str, healthy: bool) -> None:
+        """Record a health check result for ``url``."""
+        state = self._by_url[url]
+        self.stats.health_checks += 1
+        if not healthy:
+            self.mark_down(url)
+        elif not state.healthy:
+            state.healthy = True
+            state.latency = None  # stale; relearn from fresh answers
+
+    def due_checks(self) -> list[str]:
+        """Replicas whose health check is due, marking them as being checked."""
+        now = self.clock()
+        due = [s for s in self._states if now - s.checked_at >= self.health_interval]
+        for state in due:
+            state.checked_at = now
+        return [state.url for state in due]
@@ -0,0 +1,131 @@
+"""TTL + stale-while-revalidate response cache for wallet read endpoints."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Optional
+
+import httpx
+
+
+@dataclass
+class CachePolicy:
+    """Freshness rules for one endpoint.
+
+    A cached response is served as-is for ``ttl`` seconds.  For a further
+    ``stale_ttl`` seconds it is still served, but a background request
+    refreshes it; after that the next call waits for the daemon.
+    """
+
+    ttl: float  # seconds
+    stale_ttl: float = 0.0  # seconds
+
+
+# Path prefix -> policy.  Addresses and network lists change only through
+# admin actions; balances and assets tolerate a few seconds of staleness.
+DEFAULT_CACHE_POLICIES: dict[str, CachePolicy] = {
+    "/v1/wallet/address": CachePolicy(ttl=300.0),
+    "/v1/wallets/": CachePolicy(ttl=300.0),
+    "/v1/connect-info": CachePolicy(ttl=60.0, stale_ttl=240.0),
+    "/v1/wallet/balance": CachePolicy(ttl=5.0, stale_ttl=25.0),
+    "/v1/wallet/assets": CachePolicy(ttl=5.0, stale_ttl=25.0),
+}
+
+# Successful POSTs to these prefixes move funds, so cached balances and
+# assets are dropped.
+MUTATING_PATH_PREFIXES = (
+    "/v1/transactions/send",
+    "/v1/transactions/sign",
+    "/v1/actions/",
+)
+INVALIDATED_BY_MUTATIONS = ("/v1/wallet/balance", "/v1/wallet/assets")
+
+CacheKey = tuple[str, tuple[tuple[str, Any], ...], str]
+
+
+@dataclass
+class CacheEntry:
+    """A cached response and when it was stored."""
+
+    response: httpx.Response
+    stored_at: float
+
+
+@dataclass
+class CacheStats:
+    """Counters for a ResponseCache."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class ResponseCache:
+    """In-memory LRU cache of GET responses keyed by path, params and token.
+
+    Pass an instance as ``WAIaaSClient(cache=...)``.  Override ``policies``
+    to change per-endpoint TTLs; endpoints without a policy are never
+    cached.  Subclasses can swap the storage by overriding ``get``, ``set``
+    and ``invalidate``.
+    """
+
+    max_entries: int = 1024
+    policies: dict[str, CachePolicy] = field(
+        default_factory=lambda: dict(DEFAULT_CACHE_POLICIES)
+    )
+    clock: Callable[[], float] = time.monotonic
+    stats: CacheStats = field(default_factory=CacheStats)
+
+    def __post_init__(self) -> None:
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        # Bumped on every invalidation so refreshes started before it
+        # cannot store pre-mutation data afterwards.
+        self.generation = 0
+
+    def policy_for(self, path: str) -> Optional[CachePolicy]:
+        """Return the policy of the longest matching path prefix."""
+        best: Optional[str] = None
+        for prefix in self.policies:
+            if path.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return self.policies[best] if best is not None else None
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        """Return the entry for ``key`` (marking it recently used), if any."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        key: CacheKey,
+        response: httpx.Response,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store ``response`` unless an invalidation happened since ``generation``."""
+        if generation is not None and generation != self.generation:
+            return
+        self._entries[key] = CacheEntry(response, self.clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, *path_prefixes: str) -> None:
+        """Drop entries whose path starts with any prefix (all if none given)."""
+        self.generation += 1
+        self.stats.invalidations += 1
+        if not path_prefixes:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0].startswith(path_prefixes)]:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
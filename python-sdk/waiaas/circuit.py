@@ -0,0 +1,160 @@
+"""Per-network circuit breaker for calls that hit a chain RPC."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Literal, Optional
+
+from waiaas.errors import WAIaaSError
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+# (endpoint path, network); network is None when the call names none.
+CircuitKey = tuple[str, Optional[str]]
+
+# Endpoints whose failures are usually one network's RPC being down.
+DEFAULT_CIRCUIT_PATHS = ("/v1/wallet/balance", "/v1/wallet/assets")
+
+
+@dataclass
+class CircuitBreakerStats:
+    """Counters for a CircuitBreaker."""
+
+    opened: int = 0  # closed/half-open -> open transitions
+    rejected: int = 0  # calls failed fast with CIRCUIT_OPEN
+    probes: int = 0  # half-open trial calls let through
+
+
+@dataclass
+class _Circuit:
+    state: CircuitState = "closed"
+    failures: int = 0  # consecutive
+    opened_at: float = 0.0
+    probes_in_flight: int = 0
+
+
+@dataclass
+class CircuitBreaker:
+    """Fail fast on networks whose RPC keeps failing.
+
+    Each (endpoint, network) pair has its own circuit.  After
+    ``failure_threshold`` consecutive failures -- 5xx responses, transport
+    errors, or an ``error`` entry for the network in a ``network=all``
+    response -- the circuit opens and calls raise ``WAIaaSError`` with
+    code ``CIRCUIT_OPEN`` without touching the daemon.  After
+    ``reset_timeout`` seconds up to ``half_open_probes`` calls go through
+    as probes: a success closes the circuit, a failure reopens it.
+
+    Pass an instance as ``WAIaaSClient(circuit_breaker=...)``.  Only GETs
+    to ``paths`` are guarded; 4xx responses count as neither success nor
+    failure.
+    """
+
+    failure_threshold: int = 3
+    reset_timeout: float = 30.0  # seconds
+    half_open_probes: int = 1
+    paths: tuple[str, ...] = DEFAULT_CIRCUIT_PATHS
+    clock: Callable[[], float] = time.monotonic
+    stats: CircuitBreakerStats = field(default_factory=CircuitBreakerStats)
+
+    def __post_init__(self) -> None:
+        self._circuits: dict[CircuitKey, _Circuit] = {}
+
+    def key_for(
+        self, method: str, path: str, params: Optional[dict[str, Any]]
+    ) -> Optional[CircuitKey]:
+        """Circuit guarding a request, or None if it is not guarded."""
+        if method != "GET" or path not in self.paths:
+            return None
+        network = (params or {}).get("network")
+        return (path, None if network is None else str(network))
+
+    def state(self, key: CircuitKey) -> CircuitState:
+        """State of ``key``'s circuit; an open one past its timeout reads half_open."""
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            return "closed"
+        if circuit.state == "open" and self.clock() - circuit.opened_at >= self.reset_timeout:
+            return "half_open"
+        return circuit.state
+
+    def before_call(self, key: CircuitKey) -> None:
+        """Admit a call or raise CIRCUIT_OPEN.
+
+        Every admitted call must be followed by ``record_success``,
+        ``record_failure`` or ``record_ignored`` for the same key.
+
+        Raises:
+            WAIaaSError: ``CIRCUIT_OPEN`` while the circuit is open or its
+                probe slots are taken; ``retry_after`` is the time left
+                until the next probe.
+        """
+        circuit = self._circuits.get(key)
+        if circuit is None or circuit.state == "closed":
+            return
+        now = self.clock()
+        if circuit.state == "open" and now - circuit.opened_at >= self.reset_timeout:
+            circuit.state = "half_open"
+        if circuit.state == "half_open" and circuit.probes_in_flight < self.half_open_probes:
+            circuit.probes_in_flight += 1
+            self.stats.probes += 1
+            return
+        self.stats.rejected += 1
+        path, network = key
+        raise WAIaaSError(
+            code="CIRCUIT_OPEN",
+            message=f"Circuit open for {path} on network {network or 'default'}",
+            retry_after=max(0.0, circuit.opened_at + self.reset_timeout - now),
+            details={"path": path, "network": network, "failures": circuit.failures},
+        )
+
+    def record_success(self, key: CircuitKey) -> None:
+        """Close ``key``'s circuit."""
+        self._circuits.pop(key, None)
+
+    def record_failure(self, key: CircuitKey) -> None:
+        """Count a failure, opening the circuit at the threshold or after a failed probe."""
+        circuit = self._circuits.setdefault(key, _Circuit())
+        circuit.failures += 1
+        if circuit.state == "half_open":
+            circuit.probes_in_flight = max(0, circuit.probes_in_flight - 1)
+        if circuit.state == "half_open" or circuit.failures >= self.failure_threshold:
+            if circuit.state != "open":
+                self.stats.opened += 1
+            circuit.state = "open"
+            circuit.opened_at = self.clock()
+
+    def record_status(self, key: CircuitKey, status_code: int) -> None:
+        """Record a response by its status code.
+
+        Every status >= 500 is a failure, every 4xx (429 and 408 included)
+        is ignored like ``record_ignored``, and anything below 400 (304
+        included) is a success.
+        """
+        if status_code >= 500:
+            self.record_failure(key)
+        elif status_code >= 400:
+            self.record_ignored(key)
+        else:
+            self.record_success(key)
+
+    def record_ignored(self, key: CircuitKey) -> None:
+        """Release a probe slot for a call whose outcome says nothing about the network."""
+        circuit = self._circuits.get(key)
+        if circuit is not None and circuit.state == "half_open":
+            circuit.probes_in_flight = max(0, circuit.probes_in_flight - 1)
+
+    def record_networks(self, path: str, results: dict[str, Optional[str]]) -> None:
+        """Learn from a ``network=all`` response.
+
+        Args:
+            path: Endpoint of the response (balance or assets).
+            results: Network -> its ``error`` field (None if it succeeded).
+        """
+        for network, error in results.items():
+            key = (path, network)
+            if error is None:
+                self.record_success(key)
+            else:
+                self.record_failure(key)
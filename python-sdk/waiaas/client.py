@@ -2,11 +2,32 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import asyncio
+import contextlib
+import time
+import uuid
+import weakref
+from typing import Any, AsyncIterator, Coroutine, Iterable, Optional, TypeVar
 
 import httpx
-
+from pydantic import BaseModel
+
+from waiaas.balancer import FAILOVER_ERRORS, HEALTH_PATH, LoadBalancer
+from waiaas.cache import (
+    INVALIDATED_BY_MUTATIONS,
+    MUTATING_PATH_PREFIXES,
+    CacheKey,
+    CachePolicy,
+    ResponseCache,
+)
+from waiaas.circuit import CircuitBreaker
+from waiaas.concurrency import OVERLOAD_STATUS_CODES, AdaptiveConcurrency
+from waiaas.conditional import ValidatorCache, conditional_headers
+from waiaas.deadline import current_deadline, deadline_scope, resolve_deadline
+from waiaas.decoding import VALIDATION_MODES, ValidationMode, decode, loads
 from waiaas.errors import WAIaaSError
+from waiaas.hedging import RequestHedger
+from waiaas.inflight import DrainReport, InFlightRegistry, InFlightRequest
 from waiaas.models import (
     ActionResponse,
     ConnectInfo,
@@ -15,7 +36,9 @@ from waiaas.models import (
     GasCondition,
     IncomingTransactionList,
     IncomingTransactionSummary,
+    MultiNetworkAssets,
     MultiNetworkAssetsResponse,
+    MultiNetworkBalance,
     MultiNetworkBalanceResponse,
     PendingTransactionList,
     SendTokenRequest,
@@ -34,12 +57,64 @@ from waiaas.models import (
     WcDisconnectResponse,
     WcPairingResponse,
     WcSessionInfo,
+    Webhook,
+    WebhookCreated,
+    WebhookList,
+    WebhookLog,
+    WebhookLogList,
     X402FetchRequest,
     X402FetchResponse,
     DeFiPositionsResponse,
     HealthFactorResponse,
+    IncomingTransactionItem,
+)
+from waiaas.pagination import paginate, paginate_shards, time_shards
+from waiaas.ratelimit import RateLimiter
+from waiaas.retry import IDEMPOTENCY_KEY_HEADER, RetryPolicy, with_retry
+from waiaas.session import SessionRenewer, token_claims
+from waiaas.singleflight import SingleFlight, SingleFlightStats
+from waiaas.transport import PoolLimits, build_http_client, resolve_base_url
+from waiaas import waiter
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+# Header authenticating admin routes such as /v1/webhooks.
+MASTER_PASSWORD_HEADER = "X-Master-Password"
+
+# Session routes authenticate with the token they renew.
+SESSION_PATH_PREFIX = "/v1/sessions/"
+
+# Headers that authenticate a request with something other than the session
+# token; a 401 on such a request says nothing about the session.
+_EXTRA_AUTH_HEADERS = frozenset({MASTER_PASSWORD_HEADER.lower(), "authorization"})
+
+# 401 codes for a stale or expired session token, which a renewal can fix.
+_SESSION_TOKEN_ERRORS = frozenset(
+    {"INVALID_TOKEN", "TOKEN_EXPIRED", "SESSION_EXPIRED", "SESSION_REVOKED"}
 )
-from waiaas.retry import RetryPolicy, with_retry
+
+
+def _is_session_token_error(response: httpx.Response) -> bool:
+    try:
+        body = loads(response.content)
+    except Exception:
+        return False
+    return isinstance(body, dict) and body.get("code") in _SESSION_TOKEN_ERRORS
+
+
+def _client_closed(method: str, path: str) -> WAIaaSError:
+    return WAIaaSError(
+        code="CLIENT_CLOSED",
+        message=f"{method} {path} was called on a closed client",
+    )
+
+
+def _deadline_exceeded(method: str, path: str) -> WAIaaSError:
+    return WAIaaSError(
+        code="DEADLINE_EXCEEDED",
+        message=f"{method} {path} did not finish before its deadline",
+    )
 
 
 class WAIaaSClient:
@@ -49,6 +124,97 @@ class WAIaaSClient:
         async with WAIaaSClient("http://localhost:3100", "wai_sess_xxx") as client:
             balance = await client.get_balance()
             print(balance.balance, balance.symbol)
+
+    Pass ``http2=True`` (requires ``waiaas[http2]``) to multiplex concurrent
+    calls over a shared connection, and ``pool_limits`` to bound the pool:
+
+        client = WAIaaSClient(
+            "https://daemon.example", "wai_sess_xxx",
+            http2=True,
+            pool_limits=PoolLimits(max_connections=1, max_streams=100),
+        )
+
+    HTTP/2 is negotiated over TLS, so a plain ``http://`` daemon is still
+    spoken to with HTTP/1.1.  ``http2_prior_knowledge=True`` forces
+    cleartext HTTP/2 (h2c) for servers known to accept it, such as a proxy
+    in front of the daemon; the daemon itself only serves HTTP/1.1.
+
+    A daemon on the same host can be reached over its Unix domain socket,
+    skipping the TCP loopback stack:
+
+        client = WAIaaSClient("unix:///run/waiaas/daemon.sock", "wai_sess_xxx")
+
+    ``http2``, ``http2_prior_knowledge``, ``pool_limits`` and ``uds`` are
+    ignored when ``http_client`` is given.
+
+    With ``coalesce_reads=True``, concurrent identical GETs (same path,
+    params and session token) share a single round trip; see
+    ``coalesce_stats`` for how many calls were collapsed.
+
+    Pass ``cache=ResponseCache()`` to serve wallet reads (address, wallet
+    info, connect-info, balance, assets) from memory within per-endpoint
+    TTLs, refreshing stale entries in the background.  Cached balances and
+    assets are dropped after ``send_token``, ``execute_action`` or
+    ``sign_transaction`` succeeds.
+
+    Pass ``validator_cache=ValidatorCache()`` to revalidate GETs with
+    ``If-None-Match`` / ``If-Modified-Since``; on ``304 Not Modified`` the
+    previously parsed model is returned again without re-downloading or
+    re-parsing.  Models served from either cache are shared between calls
+    and should be treated as read-only.
+
+    ``validation`` selects how responses become models: ``"strict"``
+    (default, pydantic strict mode: values of the wrong type raise),
+    ``"lazy"`` (as strict, but the items of paginated lists are validated
+    when first read), ``"lenient"`` (coerce values and ignore unknown
+    fields) or ``"construct"`` (never raise; unvalidated
+    ``model_construct`` for what fails, for trusted daemons).  Every method accepts a
+    ``validation=`` keyword to override it for one call.
+
+    Pass ``rate_limiter=RateLimiter()`` to pace requests under the
+    daemon's IP, session and transaction rate limits: calls that would
+    exceed them wait locally instead of coming back as 429s.
+
+    Pass ``circuit_breaker=CircuitBreaker()`` to fail fast with
+    ``CIRCUIT_OPEN`` on networks whose RPC keeps failing, instead of
+    waiting out ``timeout`` and retries on every balance or assets call.
+
+    Pass ``concurrency=AdaptiveConcurrency()`` to cap in-flight requests
+    at a limit that grows while latency stays flat and shrinks on latency
+    spikes, timeouts and 429/503; calls over it wait in a queue.
+
+    Pass ``hedger=RequestHedger()`` to send a second attempt for balance,
+    health-factor and transaction reads that have not answered by their
+    recent p95 latency, within a budget; see ``hedger.stats``.
+
+    Pass ``balancer=LoadBalancer([...])`` to spread reads over several
+    daemon replicas (health-checked, with failover on connection errors)
+    while writes stay on the first, primary endpoint:
+
+        client = WAIaaSClient(
+            "http://daemon-a:3100", "wai_sess_xxx",
+            balancer=LoadBalancer(["http://daemon-a:3100", "http://daemon-b:3100"]),
+        )
+
+    Pass ``renewer=SessionRenewer()`` to renew the session token in the
+    background before it expires, and to renew and resend on an
+    unexpected 401 instead of failing the call.
+
+    ``in_flight`` lists the calls currently running with their start
+    times, to spot stuck ones.  ``close(drain_timeout=...)`` stops
+    accepting calls and lets those in flight finish before closing.
+
+    POSTs are never retried after a 5xx or a timeout, since the daemon
+    may already have acted on them; only a 429 is retried.  Every POST
+    carries an ``Idempotency-Key`` header that stays the same across its
+    retries, for a deduplicating proxy in front of the daemon; with one,
+    ``RetryPolicy(retry_with_idempotency_key=True)`` opts keyed POSTs
+    into 5xx retries.  Pass ``idempotency_keys=False`` to send no keys.
+
+    Every request method also accepts ``timeout=`` (seconds) and
+    ``deadline=`` (a ``time.monotonic()`` value) bounding that call,
+    retries included; ``deadline_scope`` sets one deadline for every call
+    in a block.  Past it, calls raise ``DEADLINE_EXCEEDED``.
     """
 
     def __init__(
@@ -59,17 +225,73 @@ class WAIaaSClient:
         retry_policy: Optional[RetryPolicy] = None,
         timeout: float = 30.0,
         http_client: Optional[httpx.AsyncClient] = None,
+        http2: bool = False,
+        http2_prior_knowledge: bool = False,
+        pool_limits: Optional[PoolLimits] = None,
+        uds: Optional[str] = None,
+        coalesce_reads: bool = False,
+        cache: Optional[ResponseCache] = None,
+        validator_cache: Optional[ValidatorCache] = None,
+        validation: ValidationMode = "strict",
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        hedger: Optional[RequestHedger] = None,
+        balancer: Optional[LoadBalancer] = None,
+        idempotency_keys: bool = True,
+        renewer: Optional[SessionRenewer] = None,
     ) -> None:
-        self._base_url = base_url.rstrip("/")
+        if validation not in VALIDATION_MODES:
+            raise ValueError(
+                f"Unknown validation mode {validation!r}; "
+                f"expected one of {VALIDATION_MODES}"
+            )
+        self._base_url, uds = resolve_base_url(base_url, uds)
         self._session_token = session_token
         self._retry_policy = retry_policy or RetryPolicy()
         self._timeout = timeout
         self._owns_client = http_client is None
-        self._client = http_client or httpx.AsyncClient(
-            base_url=self._base_url,
+        self._client = http_client or build_http_client(
+            self._base_url,
             timeout=timeout,
             headers=self._build_headers(),
+            http2=http2,
+            http2_prior_knowledge=http2_prior_knowledge,
+            pool_limits=pool_limits,
+            uds=uds,
+        )
+        max_in_flight = pool_limits.max_in_flight if pool_limits else None
+        self._stream_slots: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(max_in_flight) if max_in_flight else None
         )
+        self._singleflight: Optional[SingleFlight[httpx.Response]] = (
+            SingleFlight() if coalesce_reads else None
+        )
+        self._cache = cache
+        self._revalidating: set[CacheKey] = set()
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        self._validator_cache = validator_cache
+        self._validation: ValidationMode = validation
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._concurrency = concurrency
+        self._hedger = hedger
+        self._balancer = balancer
+        self._idempotency_keys = idempotency_keys
+        self._renewer = renewer
+        self._renewal_task: Optional[asyncio.Task[None]] = None
+        self._refresh_task: Optional[asyncio.Future[str]] = None
+        self._inflight = InFlightRegistry()
+        self._closed = False
+        # Call tasks cancelled by ``close``; their callers get CLIENT_CLOSED.
+        self._cut_off: weakref.WeakSet[asyncio.Task[Any]] = weakref.WeakSet()
+        # Last network=all response per endpoint, for per-network fan-out.
+        self._all_networks: dict[str, BaseModel] = {}
+        # Parsed models per response, so a response reused from a cache
+        # (or a 304) is not validated again.
+        self._parsed: weakref.WeakKeyDictionary[
+            httpx.Response, dict[tuple[type, str], BaseModel]
+        ] = weakref.WeakKeyDictionary()
 
     def _build_headers(self) -> dict[str, str]:
         return {
@@ -81,21 +303,83 @@ class WAIaaSClient:
     def session_token(self) -> str:
         return self._session_token
 
+    @property
+    def coalesce_stats(self) -> Optional[SingleFlightStats]:
+        """Read coalescing counters, or None if ``coalesce_reads`` is off."""
+        if self._singleflight is None:
+            return None
+        return self._singleflight.stats
+
     def set_session_token(self, token: str) -> None:
         """Update the session token for subsequent requests."""
         self._session_token = token
         self._client.headers["Authorization"] = f"Bearer {token}"
 
     async def __aenter__(self) -> "WAIaaSClient":
+        self._start_renewal()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
         await self.close()
 
-    async def close(self) -> None:
-        """Close the underlying HTTP client."""
+    @property
+    def in_flight(self) -> list[InFlightRequest]:
+        """Calls that have not returned yet, oldest first."""
+        return self._inflight.requests
+
+    async def close(self, drain_timeout: float = 0.0) -> DrainReport:
+        """Stop accepting calls and close the underlying HTTP client.
+
+        Calls made after this raise ``CLIENT_CLOSED``.  Calls already in
+        flight and background refreshes (cache revalidation, session
+        renewal) get ``drain_timeout`` seconds to finish.  Calls still
+        running are then cut off and raise ``CLIENT_CLOSED`` in their
+        callers; only the client's own tasks are cancelled, never the
+        callers'.
+
+        Args:
+            drain_timeout: Seconds to wait before cancelling.
+
+        Returns:
+            A DrainReport listing the calls that were cancelled.
+        """
+        self._closed = True
+        started = time.monotonic()
+        draining = len(self._inflight)
+        if self._renewal_task is not None:
+            self._renewal_task.cancel()  # idle between renewals; nothing to drain
+        if drain_timeout > 0:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._drained(), drain_timeout)
+        report = DrainReport(cancelled=self._inflight.requests)
+        report.completed = draining - len(report.cancelled)
+        for task in {r.task for r in report.cancelled if r.task is not None}:
+            self._cut_off.add(task)
+            task.cancel()
+        for task in list(self._background_tasks):
+            if task is not self._renewal_task and not task.done():
+                report.cancelled_tasks += 1
+            task.cancel()
+        if self._refresh_task is not None:
+            report.cancelled_tasks += 1
+            self._refresh_task.cancel()
         if self._owns_client:
             await self._client.aclose()
+        report.duration = time.monotonic() - started
+        return report
+
+    async def _drained(self) -> None:
+        """Wait for calls in flight and background work to finish."""
+        while True:
+            await self._inflight.wait_idle()
+            tasks: set[asyncio.Future[Any]] = {
+                t for t in self._background_tasks if t is not self._renewal_task
+            }
+            if self._refresh_task is not None:
+                tasks.add(self._refresh_task)
+            if not tasks:
+                return
+            await asyncio.wait(tasks)
 
     # -----------------------------------------------------------------
     # Internal HTTP helpers
@@ -108,76 +392,657 @@ class WAIaaSClient:
         *,
         json_body: Optional[dict[str, Any]] = None,
         params: Optional[dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> httpx.Response:
+        """Make an HTTP request through the cache, coalescing and retry layers.
+
+        ``timeout``/``deadline`` and any enclosing ``deadline_scope`` bound
+        the whole call, queueing and retries included; when the earliest
+        of them passes, the call raises ``DEADLINE_EXCEEDED``.  Requests
+        with extra ``headers`` (e.g. master auth) bypass the shared read
+        paths: cache, coalescing and conditional requests.
+        """
+        if self._closed:
+            raise _client_closed(method, path)
+        self._start_renewal()
+        deadline = resolve_deadline(timeout, deadline)
+        # The call runs in its own task so that ``close`` can cut it off
+        # without cancelling the caller's task.
+        call = asyncio.ensure_future(
+            self._call(method, path, json_body, params, headers, deadline)
+        )
+        with self._inflight.track(method, path, call):
+            try:
+                return await call
+            except asyncio.CancelledError:
+                if call in self._cut_off:
+                    raise _client_closed(method, path) from None
+                raise
+
+    async def _call(
+        self,
+        method: str,
+        path: str,
+        json_body: Optional[dict[str, Any]],
+        params: Optional[dict[str, Any]],
+        headers: Optional[dict[str, str]],
+        deadline: Optional[float],
+    ) -> httpx.Response:
+        """Route one call within ``deadline``."""
+        if deadline is None:
+            return await self._route(method, path, json_body, params, headers)
+        left = deadline - time.monotonic()
+        if left <= 0:
+            raise _deadline_exceeded(method, path)
+        with deadline_scope(deadline=deadline):
+            try:
+                return await asyncio.wait_for(
+                    self._route(method, path, json_body, params, headers), left
+                )
+            except asyncio.TimeoutError:
+                raise _deadline_exceeded(method, path) from None
+
+    async def _route(
+        self,
+        method: str,
+        path: str,
+        json_body: Optional[dict[str, Any]],
+        params: Optional[dict[str, Any]],
+        headers: Optional[dict[str, str]] = None,
+    ) -> httpx.Response:
+        if headers:
+            return await self._fetch(method, path, json_body, params, headers=headers)
+        if method != "GET":
+            response = await self._fetch(method, path, json_body, params)
+            if self._cache is not None and path.startswith(MUTATING_PATH_PREFIXES):
+                self._cache.invalidate(*INVALIDATED_BY_MUTATIONS)
+            return response
+
+        key: CacheKey = (
+            path,
+            tuple(sorted((params or {}).items())),
+            self._session_token,
+        )
+        policy = self._cache.policy_for(path) if self._cache is not None else None
+        if policy is not None:
+            return await self._cached_read(key, policy, path, params)
+        return await self._read(key, path, params)
+
+    async def _read(
+        self,
+        key: CacheKey,
+        path: str,
+        params: Optional[dict[str, Any]],
     ) -> httpx.Response:
-        """Make an HTTP request with retry logic."""
+        if self._singleflight is not None:
+            return await self._singleflight.do(
+                key, lambda: self._conditional_read(key, path, params)
+            )
+        return await self._conditional_read(key, path, params)
+
+    async def _conditional_read(
+        self,
+        key: CacheKey,
+        path: str,
+        params: Optional[dict[str, Any]],
+    ) -> httpx.Response:
+        validators = self._validator_cache
+        if validators is None:
+            return await self._fetch("GET", path, None, params)
+        previous = validators.get(key)
+        if previous is None:
+            response = await self._fetch("GET", path, None, params)
+        else:
+            validators.stats.conditional_requests += 1
+            response = await self._fetch(
+                "GET", path, None, params, headers=conditional_headers(previous)
+            )
+            if response.status_code == 304:
+                validators.stats.not_modified += 1
+                validators.stats.bytes_saved += len(previous.content)
+                return previous
+        validators.store(key, response)
+        return response
+
+    async def _cached_read(
+        self,
+        key: CacheKey,
+        policy: CachePolicy,
+        path: str,
+        params: Optional[dict[str, Any]],
+    ) -> httpx.Response:
+        cache = self._cache
+        assert cache is not None
+        entry = cache.get(key)
+        if entry is not None:
+            age = cache.clock() - entry.stored_at
+            if age < policy.ttl:
+                cache.stats.hits += 1
+                return entry.response
+            if age < policy.ttl + policy.stale_ttl:
+                cache.stats.stale_hits += 1
+                self._revalidate(key, path, params)
+                return entry.response
+        cache.stats.misses += 1
+        generation = cache.generation
+        response = await self._read(key, path, params)
+        cache.set(key, response, generation)
+        return response
+
+    def _revalidate(
+        self,
+        key: CacheKey,
+        path: str,
+        params: Optional[dict[str, Any]],
+    ) -> None:
+        """Refresh a stale cache entry in the background (once per key)."""
+        cache = self._cache
+        assert cache is not None
+        if key in self._revalidating:
+            return
+        self._revalidating.add(key)
+        generation = cache.generation
+
+        async def _refresh() -> None:
+            try:
+                response = await self._read(key, path, params)
+                cache.set(key, response, generation)
+            except Exception:
+                # Keep serving the stale entry; the next call after it
+                # expires fetches in the foreground and surfaces the error.
+                pass
+            finally:
+                self._revalidating.discard(key)
+
+        self._spawn(_refresh())
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        """Run ``coro`` as a background task owned by this client."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        json_body: Optional[dict[str, Any]],
+        params: Optional[dict[str, Any]],
+        *,
+        headers: Optional[dict[str, str]] = None,
+    ) -> httpx.Response:
+        """Send one logical request with retries, raising WAIaaSError on >= 400."""
+
+        policy = self._retry_policy
+        session_auth = not any(name.lower() in _EXTRA_AUTH_HEADERS for name in headers or {})
+        keyed = self._idempotency_keys and method not in policy.idempotent_methods
+        if keyed:
+            # One key per logical request, resent unchanged on every retry.
+            headers = {**(headers or {}), IDEMPOTENCY_KEY_HEADER: uuid.uuid4().hex}
+        idempotent = policy.is_idempotent(method, keyed)
+        breaker = self._circuit_breaker
+        circuit = breaker.key_for(method, path, params) if breaker is not None else None
+
+        async def _send_slotted() -> httpx.Response:
+            if self._stream_slots is not None:
+                async with self._stream_slots:
+                    return await self._send(method, path, json_body, params, headers)
+            return await self._send(method, path, json_body, params, headers)
+
+        async def _attempt(token: str) -> httpx.Response:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(method, path, token)
+            concurrency = self._concurrency
+            if concurrency is None:
+                return await _send_slotted()
+            started = await concurrency.acquire()
+            try:
+                response = await _send_slotted()
+            except httpx.TimeoutException:
+                concurrency.release(started, "dropped")
+                raise
+            except BaseException:
+                concurrency.release(started, "ignored")
+                raise
+            overloaded = response.status_code in OVERLOAD_STATUS_CODES
+            concurrency.release(started, "dropped" if overloaded else "success")
+            return response
+
+        hedger = self._hedger
+        hedge_key = hedger.key_for(method, path) if hedger is not None else None
+
+        async def _send_once(token: str) -> httpx.Response:
+            if hedge_key is None:
+                return await _attempt(token)
+            assert hedger is not None
+            return await hedger.run(hedge_key, lambda: _attempt(token))
+
+        async def _send_checked(token: str) -> httpx.Response:
+            if circuit is None:
+                return await _send_once(token)
+            assert breaker is not None
+            breaker.before_call(circuit)
+            try:
+                response = await _send_once(token)
+            except httpx.TransportError:
+                breaker.record_failure(circuit)
+                raise
+            except BaseException:
+                breaker.record_ignored(circuit)
+                raise
+            breaker.record_status(circuit, response.status_code)
+            return response
+
+        renewer = self._renewer
+        # Session routes are how the token gets renewed; they must not
+        # wait for, or start, a renewal themselves.  Requests authenticated
+        # some other way (the master password) have no session to renew.
+        reauth = (
+            renewer is not None
+            and session_auth
+            and not path.startswith(SESSION_PATH_PREFIX)
+        )
 
         async def _do_request() -> httpx.Response:
-            response = await self._client.request(
+            if reauth:
+                await self._session_refreshed()
+            token = self._session_token
+            response = await _send_checked(token)
+            if response.status_code == 401 and reauth and _is_session_token_error(response):
+                assert renewer is not None
+                try:
+                    await self._refresh_session(token)
+                except Exception:
+                    pass  # raise the 401 below as usual
+                else:
+                    renewer.stats.replays += 1
+                    response = await _send_checked(self._session_token)
+            if response.status_code >= 400:
+                try:
+                    body = loads(response.content)
+                except Exception:
+                    body = {"code": "UNKNOWN_ERROR", "message": response.text}
+                error = WAIaaSError.from_response(
+                    response.status_code, body, response.headers
+                )
+                if response.status_code == 429 and self._rate_limiter is not None:
+                    self._rate_limiter.on_rate_limited(
+                        method, path, token, error.retry_after, error.message
+                    )
+                raise error
+            return response
+
+        return await with_retry(
+            _do_request, policy, current_deadline(), idempotent=idempotent
+        )
+
+    def _start_renewal(self) -> None:
+        """Start the background renewal task, once a loop is running."""
+        if self._renewer is None or self._renewal_task is not None:
+            return
+        self._renewal_task = self._spawn(self._renew_loop())
+
+    async def _renew_loop(self) -> None:
+        renewer = self._renewer
+        assert renewer is not None
+        while True:
+            token = self._session_token
+            delay = renewer.delay(token)
+            if delay is None:
+                return
+            if delay > 0:
+                # Wake up at the renewal time, or re-plan if the token
+                # was replaced meanwhile.
+                await renewer.sleep(delay)
+                continue
+            try:
+                await self._refresh_session(token)
+            except Exception:
+                await renewer.sleep(renewer.retry_delay)
+
+    async def _session_refreshed(self) -> None:
+        """Wait for a renewal in progress, so no request uses the old token."""
+        task = self._refresh_task
+        if task is not None:
+            with contextlib.suppress(Exception):
+                await asyncio.shield(task)
+
+    async def _refresh_session(self, stale: str) -> str:
+        """Replace the ``stale`` token, once for all concurrent callers.
+
+        Returns:
+            The new session token.
+        """
+        if self._session_token != stale:
+            return self._session_token  # someone else already did
+        task = self._refresh_task
+        if task is None:
+            task = self._refresh_task = asyncio.ensure_future(self._renew_token(stale))
+
+            def _settle(t: asyncio.Future[str]) -> None:
+                if self._refresh_task is t:
+                    self._refresh_task = None
+                if not t.cancelled():
+                    t.exception()  # mark retrieved
+
+            task.add_done_callback(_settle)
+        return await asyncio.shield(task)
+
+    async def _renew_token(self, stale: str) -> str:
+        renewer = self._renewer
+        assert renewer is not None
+        claims = token_claims(stale)
+        error: Optional[Exception] = None
+        token: Optional[str] = None
+        if claims is not None and claims.expires_at is not None:
+            try:
+                response = await self._fetch(
+                    "PUT", f"{SESSION_PATH_PREFIX}{claims.session_id}/renew", None, None
+                )
+                token = self._parse(response, SessionRenewResponse).token
+                renewer.stats.renewals += 1
+            except Exception as e:
+                renewer.stats.failures += 1
+                error = e
+        if token is None:
+            if renewer.refresh is None:
+                raise error or WAIaaSError(
+                    code="SESSION_NOT_RENEWABLE",
+                    message="Session token cannot be renewed and no refresh is configured",
+                )
+            try:
+                token = await renewer.refresh()
+            except Exception:
+                renewer.stats.failures += 1
+                raise
+            renewer.stats.refreshes += 1
+        self.set_session_token(token)
+        return token
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        json_body: Optional[dict[str, Any]],
+        params: Optional[dict[str, Any]],
+        headers: Optional[dict[str, str]] = None,
+    ) -> httpx.Response:
+        # The token travels with each request so that clients sharing one
+        # httpx.AsyncClient (see WAIaaSClientPool) never mix credentials.
+        request_headers = {"Authorization": f"Bearer {self._session_token}"}
+        if headers:
+            request_headers.update(headers)
+        balancer = self._balancer
+        if balancer is None:
+            return await self._client.request(
                 method,
                 path,
                 json=json_body,
                 params=params,
+                headers=request_headers,
             )
-            if response.status_code >= 400:
-                try:
-                    body = response.json()
-                except Exception:
-                    body = {"code": "UNKNOWN_ERROR", "message": response.text}
-                raise WAIaaSError.from_response(response.status_code, body)
+        for url in balancer.due_checks():
+            self._spawn(self._probe(url))
+        tried: list[str] = []
+        while True:
+            endpoint = balancer.pick(method, tried)
+            assert endpoint is not None
+            started = balancer.begin(endpoint)
+            try:
+                response = await self._client.request(
+                    method,
+                    endpoint + path,
+                    json=json_body,
+                    params=params,
+                    headers=request_headers,
+                )
+            except FAILOVER_ERRORS:
+                balancer.finish(endpoint, started, "dropped")
+                balancer.mark_down(endpoint)
+                tried.append(endpoint)
+                if balancer.pick(method, tried) is None:
+                    raise
+                balancer.stats.failovers += 1
+                continue
+            except httpx.TransportError:
+                balancer.finish(endpoint, started, "dropped")
+                raise
+            except BaseException:
+                balancer.finish(endpoint, started, "ignored")
+                raise
+            failed = response.status_code >= 500
+            balancer.finish(endpoint, started, "dropped" if failed else "success")
             return response
 
-        return await with_retry(_do_request, self._retry_policy)
+    async def _probe(self, url: str) -> bool:
+        """Health-check one balancer endpoint and record the result."""
+        balancer = self._balancer
+        assert balancer is not None
+        try:
+            response = await self._client.get(
+                url + HEALTH_PATH, timeout=balancer.health_timeout
+            )
+            healthy = response.status_code == 200
+        except httpx.HTTPError:
+            healthy = False
+        balancer.mark_health(url, healthy)
+        return healthy
+
+    async def check_health(
+        self,
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> dict[str, bool]:
+        """Health-check every balancer endpoint now.
+
+        Args:
+            timeout: Seconds the checks may take in total.
+            deadline: ``time.monotonic()`` value the checks must finish by.
+
+        Returns:
+            Whether each endpoint answered ``GET /health`` with 200.
+
+        Raises:
+            ValueError: If the client has no ``balancer``.
+            WAIaaSError: ``DEADLINE_EXCEEDED`` if the checks did not finish
+                in time; endpoints still being checked keep their state.
+        """
+        balancer = self._balancer
+        if balancer is None:
+            raise ValueError("check_health needs a client created with balancer=")
+        deadline = resolve_deadline(timeout, deadline)
+        urls = [state.url for state in balancer.states]
+        probes = asyncio.gather(*(self._probe(url) for url in urls))
+        if deadline is None:
+            results = await probes
+        else:
+            try:
+                results = await asyncio.wait_for(probes, deadline - time.monotonic())
+            except asyncio.TimeoutError:
+                raise _deadline_exceeded("GET", HEALTH_PATH) from None
+        return dict(zip(urls, results))
+
+    def _parse(
+        self,
+        response: httpx.Response,
+        model: type[ModelT],
+        validation: Optional[ValidationMode] = None,
+    ) -> ModelT:
+        """Decode ``response`` into ``model``, reusing an earlier parse."""
+        mode = validation or self._validation
+        parsed = self._parsed.setdefault(response, {})
+        result = parsed.get((model, mode))
+        if result is None:
+            result = decode(response.content, model, mode)
+            parsed[(model, mode)] = result
+        return result  # type: ignore[return-value]
 
     # -----------------------------------------------------------------
     # Wallet API
     # -----------------------------------------------------------------
 
-    async def get_address(self) -> WalletAddress:
+    async def get_address(
+        self,
+        *,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> WalletAddress:
         """GET /v1/wallet/address -- Get wallet address."""
-        resp = await self._request("GET", "/v1/wallet/address")
-        return WalletAddress.model_validate(resp.json())
+        resp = await self._request("GET", "/v1/wallet/address", timeout=timeout, deadline=deadline)
+        return self._parse(resp, WalletAddress, validation)
 
-    async def get_balance(self, *, network: Optional[str] = None) -> WalletBalance:
+    async def get_balance(
+        self,
+        *,
+        network: Optional[str] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> WalletBalance:
         """GET /v1/wallet/balance -- Get wallet balance.
 
         Args:
             network: Query balance for a specific network (e.g., 'polygon-mainnet').
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
         """
         params: dict[str, Any] = {}
         if network is not None:
             params["network"] = network
-        resp = await self._request("GET", "/v1/wallet/balance", params=params or None)
-        return WalletBalance.model_validate(resp.json())
+        resp = await self._request(
+            "GET", "/v1/wallet/balance", params=params or None, timeout=timeout, deadline=deadline
+        )
+        return self._parse(resp, WalletBalance, validation)
 
-    async def get_assets(self, *, network: Optional[str] = None) -> WalletAssets:
+    async def get_assets(
+        self,
+        *,
+        network: Optional[str] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> WalletAssets:
         """GET /v1/wallet/assets -- Get all assets held by wallet.
 
         Args:
             network: Query assets for a specific network (e.g., 'polygon-mainnet').
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
         """
         params: dict[str, Any] = {}
         if network is not None:
             params["network"] = network
-        resp = await self._request("GET", "/v1/wallet/assets", params=params or None)
-        return WalletAssets.model_validate(resp.json())
+        resp = await self._request(
+            "GET", "/v1/wallet/assets", params=params or None, timeout=timeout, deadline=deadline
+        )
+        return self._parse(resp, WalletAssets, validation)
 
-    async def get_all_balances(self) -> MultiNetworkBalanceResponse:
+    async def get_all_balances(
+        self,
+        *,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> MultiNetworkBalanceResponse:
         """GET /v1/wallet/balance?network=all -- Get balances for all networks.
 
         Returns native balances for every network in the wallet's environment.
         Networks that fail (e.g., RPC timeout) are included with an error field.
+        With a ``circuit_breaker``, while any network's circuit is open the
+        networks are queried one by one instead, so the open ones come back
+        as errors at once rather than stalling the whole response.
         """
-        resp = await self._request("GET", "/v1/wallet/balance", params={"network": "all"})
-        return MultiNetworkBalanceResponse.model_validate(resp.json())
+        path = "/v1/wallet/balance"
+        last = self._degraded_networks(path)
+        if isinstance(last, MultiNetworkBalanceResponse):
 
-    async def get_all_assets(self) -> MultiNetworkAssetsResponse:
+            async def _one(network: str) -> MultiNetworkBalance:
+                try:
+                    b = await self.get_balance(
+                        network=network, validation=validation, timeout=timeout, deadline=deadline
+                    )
+                except (WAIaaSError, httpx.HTTPError) as e:
+                    return MultiNetworkBalance(network=network, error=str(e))
+                return MultiNetworkBalance(
+                    network=network, balance=b.balance, decimals=b.decimals, symbol=b.symbol
+                )
+
+            balances = await asyncio.gather(*(_one(b.network) for b in last.balances))
+            return last.model_copy(update={"balances": list(balances)})
+        resp = await self._request(
+            "GET", path, params={"network": "all"}, timeout=timeout, deadline=deadline
+        )
+        result = self._parse(resp, MultiNetworkBalanceResponse, validation)
+        self._learn_networks(path, result, {b.network: b.error for b in result.balances})
+        return result
+
+    async def get_all_assets(
+        self,
+        *,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> MultiNetworkAssetsResponse:
         """GET /v1/wallet/assets?network=all -- Get assets for all networks.
 
         Returns token assets for every network in the wallet's environment.
-        Networks that fail are included with an error field.
+        Networks that fail are included with an error field.  Falls back to
+        per-network calls while a circuit is open, like ``get_all_balances``.
         """
-        resp = await self._request("GET", "/v1/wallet/assets", params={"network": "all"})
-        return MultiNetworkAssetsResponse.model_validate(resp.json())
+        path = "/v1/wallet/assets"
+        last = self._degraded_networks(path)
+        if isinstance(last, MultiNetworkAssetsResponse):
+
+            async def _one(network: str) -> MultiNetworkAssets:
+                try:
+                    a = await self.get_assets(
+                        network=network, validation=validation, timeout=timeout, deadline=deadline
+                    )
+                except (WAIaaSError, httpx.HTTPError) as e:
+                    return MultiNetworkAssets(network=network, error=str(e))
+                return MultiNetworkAssets(network=network, assets=list(a.assets))
+
+            entries = await asyncio.gather(*(_one(n.network) for n in last.network_assets))
+            return last.model_copy(update={"network_assets": list(entries)})
+        resp = await self._request(
+            "GET", path, params={"network": "all"}, timeout=timeout, deadline=deadline
+        )
+        result = self._parse(resp, MultiNetworkAssetsResponse, validation)
+        self._learn_networks(
+            path, result, {n.network: n.error for n in result.network_assets}
+        )
+        return result
+
+    def _learn_networks(
+        self, path: str, result: BaseModel, errors: dict[str, Optional[str]]
+    ) -> None:
+        """Feed a network=all response's per-network errors to the circuit breaker."""
+        if self._circuit_breaker is None:
+            return
+        self._all_networks[path] = result
+        self._circuit_breaker.record_networks(path, errors)
+
+    def _degraded_networks(self, path: str) -> Optional[BaseModel]:
+        """The last network=all response for ``path`` if one of its networks' circuits is not closed."""
+        breaker = self._circuit_breaker
+        last = self._all_networks.get(path)
+        if breaker is None or last is None:
+            return None
+        entries = (
+            last.balances
+            if isinstance(last, MultiNetworkBalanceResponse)
+            else last.network_assets  # type: ignore[attr-defined]
+        )
+        if all(breaker.state((path, e.network)) == "closed" for e in entries):
+            return None
+        return last
 
     # -----------------------------------------------------------------
     # DeFi Queries API
@@ -187,19 +1052,28 @@ class WAIaaSClient:
         self,
         *,
         wallet_id: Optional[str] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> DeFiPositionsResponse:
         """GET /v1/wallet/positions -- Get DeFi lending positions."""
         params: dict[str, Any] = {}
         if wallet_id is not None:
             params["wallet_id"] = wallet_id
-        resp = await self._request("GET", "/v1/wallet/positions", params=params or None)
-        return DeFiPositionsResponse.model_validate(resp.json())
+        resp = await self._request(
+            "GET", "/v1/wallet/positions", params=params or None,
+            timeout=timeout, deadline=deadline,
+        )
+        return self._parse(resp, DeFiPositionsResponse, validation)
 
     async def get_health_factor(
         self,
         *,
         wallet_id: Optional[str] = None,
         network: Optional[str] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> HealthFactorResponse:
         """GET /v1/wallet/health-factor -- Get lending health factor."""
         params: dict[str, Any] = {}
@@ -207,25 +1081,35 @@ class WAIaaSClient:
             params["wallet_id"] = wallet_id
         if network is not None:
             params["network"] = network
-        resp = await self._request("GET", "/v1/wallet/health-factor", params=params or None)
-        return HealthFactorResponse.model_validate(resp.json())
+        resp = await self._request(
+            "GET", "/v1/wallet/health-factor", params=params or None,
+            timeout=timeout, deadline=deadline,
+        )
+        return self._parse(resp, HealthFactorResponse, validation)
 
     # -----------------------------------------------------------------
     # Wallet Management API
     # -----------------------------------------------------------------
 
-    async def get_wallet_info(self) -> WalletInfo:
+    async def get_wallet_info(
+        self,
+        *,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> WalletInfo:
         """GET /v1/wallet/address + GET /v1/wallets/:id/networks combined.
 
         Returns combined wallet info including address, chain, environment,
         and available networks.
         """
-        addr_resp = await self._request("GET", "/v1/wallet/address")
-        addr = WalletAddress.model_validate(addr_resp.json())
+        deadline = resolve_deadline(timeout, deadline)
+        addr_resp = await self._request("GET", "/v1/wallet/address", deadline=deadline)
+        addr = self._parse(addr_resp, WalletAddress, validation)
         net_resp = await self._request(
-            "GET", f"/v1/wallets/{addr.wallet_id}/networks"
+            "GET", f"/v1/wallets/{addr.wallet_id}/networks", deadline=deadline
         )
-        net_data = net_resp.json()
+        net_data = loads(net_resp.content)
         return WalletInfo(
             walletId=addr.wallet_id,
             chain=addr.chain,
@@ -249,6 +1133,9 @@ class WAIaaSClient:
         token: Optional[dict[str, Any]] = None,
         network: Optional[str] = None,
         gas_condition: Optional[dict[str, Any]] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
         **kwargs: Any,
     ) -> TransactionResponse:
         """POST /v1/transactions/send -- Send transaction (5-type support).
@@ -267,6 +1154,9 @@ class WAIaaSClient:
             token: Token info dict with address, decimals, symbol (for TOKEN_TRANSFER/APPROVE).
             network: Target network (e.g., 'polygon-mainnet') for multichain transactions.
             gas_condition: Gas price condition dict with maxGasPrice, maxPriorityFee, timeout.
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
             **kwargs: Additional fields (calldata, spender, instructions, etc.).
 
         Returns:
@@ -279,25 +1169,42 @@ class WAIaaSClient:
             token=token_obj, network=network, gas_condition=gas_obj, **kwargs,
         )
         body = request.model_dump(exclude_none=True, by_alias=True)
-        resp = await self._request("POST", "/v1/transactions/send", json_body=body)
-        return TransactionResponse.model_validate(resp.json())
+        resp = await self._request(
+            "POST", "/v1/transactions/send", json_body=body, timeout=timeout, deadline=deadline
+        )
+        return self._parse(resp, TransactionResponse, validation)
 
-    async def get_transaction(self, tx_id: str) -> TransactionDetail:
+    async def get_transaction(
+        self,
+        tx_id: str,
+        *,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> TransactionDetail:
         """GET /v1/transactions/:id -- Get transaction details."""
-        resp = await self._request("GET", f"/v1/transactions/{tx_id}")
-        return TransactionDetail.model_validate(resp.json())
+        resp = await self._request(
+            "GET", f"/v1/transactions/{tx_id}", timeout=timeout, deadline=deadline
+        )
+        return self._parse(resp, TransactionDetail, validation)
 
     async def list_transactions(
         self,
         *,
         limit: int = 20,
         cursor: Optional[str] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> TransactionList:
         """GET /v1/transactions -- List transactions with cursor pagination.
 
         Args:
             limit: Number of transactions per page (1-100, default 20).
             cursor: Cursor for pagination (UUID of last item).
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
 
         Returns:
             TransactionList with items, cursor, and has_more.
@@ -305,13 +1212,110 @@ class WAIaaSClient:
         params: dict[str, Any] = {"limit": limit}
         if cursor:
             params["cursor"] = cursor
-        resp = await self._request("GET", "/v1/transactions", params=params)
-        return TransactionList.model_validate(resp.json())
+        resp = await self._request(
+            "GET", "/v1/transactions", params=params, timeout=timeout, deadline=deadline
+        )
+        return self._parse(resp, TransactionList, validation)
+
+    def iter_transactions(
+        self,
+        *,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[TransactionDetail]:
+        """Iterate over all transactions, fetching the next page in the background.
+
+        Use ``contextlib.aclosing`` when breaking out early so the
+        in-flight page request is cancelled right away.
+
+        Args:
+            page_size: Transactions per request (1-100).
+            prefetch: Pages to fetch ahead of the one being consumed
+                (0 to fetch each page only when needed).
+            max_items: Stop after this many transactions (None for all).
+            validation: Override the client validation mode for this call.
+            timeout: Seconds every page request together may take, from now.
+            deadline: ``time.monotonic()`` value the last page must arrive by.
+
+        Returns:
+            Async iterator of TransactionDetail, newest first.
+        """
+        deadline = resolve_deadline(timeout, deadline)
+
+        async def fetch(cursor: Optional[str]) -> tuple[Any, Optional[str]]:
+            page = await self.list_transactions(
+                limit=page_size, cursor=cursor, validation=validation, deadline=deadline
+            )
+            return page.items, page.cursor if page.has_more else None
 
-    async def list_pending_transactions(self) -> PendingTransactionList:
+        return paginate(fetch, prefetch=prefetch, max_items=max_items)
+
+    async def list_pending_transactions(
+        self,
+        *,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> PendingTransactionList:
         """GET /v1/transactions/pending -- List pending transactions."""
-        resp = await self._request("GET", "/v1/transactions/pending")
-        return PendingTransactionList.model_validate(resp.json())
+        resp = await self._request(
+            "GET", "/v1/transactions/pending", timeout=timeout, deadline=deadline
+        )
+        return self._parse(resp, PendingTransactionList, validation)
+
+    def wait_for_transactions(
+        self,
+        tx_ids: Iterable[str],
+        *,
+        terminal_statuses: Iterable[str] = waiter.TERMINAL_STATUSES,
+        timeout: Optional[float] = None,
+        poll_interval: float = 1.0,
+        max_interval: float = 10.0,
+        validation: Optional[ValidationMode] = None,
+    ) -> AsyncIterator[TransactionDetail]:
+        """Wait for many transactions at once, yielding each as it settles.
+
+        One polling loop covers every id: each round asks
+        ``list_pending_transactions`` and the newest ``list_transactions``
+        pages about all of them, falling back to ``get_transaction`` only
+        for ids those do not return.  Polling backs off from
+        ``poll_interval`` to ``max_interval`` while nothing changes.
+
+        Args:
+            tx_ids: Transaction IDs to wait for.
+            terminal_statuses: Statuses that end the wait for an id
+                (default: CONFIRMED, FAILED, CANCELLED, EXPIRED,
+                PARTIAL_FAILURE, SIGNED).
+            timeout: Give up after this many seconds, even mid-round
+                (None waits until the enclosing ``deadline_scope``, if
+                any, ends).
+            poll_interval: Initial seconds between polling rounds.
+            max_interval: Upper bound for the backed-off interval.
+            validation: Override the client validation mode for this call.
+
+        Returns:
+            Async iterator of TransactionDetail in completion order.
+
+        Raises:
+            WAIaaSError: ``WAIT_TIMEOUT`` if ids are still outstanding at
+                ``timeout`` or the enclosing deadline; ``details["pending"]``
+                lists them.
+                ``TX_NOT_FOUND`` after the other ids settle if some were
+                not found; ``details["not_found"]`` lists them.
+        """
+        return waiter.wait_for_transactions(
+            self,
+            tx_ids,
+            terminal_statuses=terminal_statuses,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_interval=max_interval,
+            validation=validation,
+        )
 
     # -----------------------------------------------------------------
     # Incoming Transaction API
@@ -330,6 +1334,9 @@ class WAIaaSClient:
         since: Optional[int] = None,
         until: Optional[int] = None,
         wallet_id: Optional[str] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> IncomingTransactionList:
         """GET /v1/wallet/incoming -- List incoming transactions.
 
@@ -344,6 +1351,9 @@ class WAIaaSClient:
             since: Filter transactions detected after this epoch (seconds).
             until: Filter transactions detected before this epoch (seconds).
             wallet_id: Target wallet ID (multi-wallet sessions).
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
         """
         params: dict[str, Any] = {"limit": limit}
         if cursor is not None:
@@ -364,8 +1374,154 @@ class WAIaaSClient:
             params["until"] = until
         if wallet_id is not None:
             params["wallet_id"] = wallet_id
-        resp = await self._request("GET", "/v1/wallet/incoming", params=params)
-        return IncomingTransactionList.model_validate(resp.json())
+        resp = await self._request(
+            "GET", "/v1/wallet/incoming", params=params, timeout=timeout, deadline=deadline
+        )
+        return self._parse(resp, IncomingTransactionList, validation)
+
+    def iter_incoming_transactions(
+        self,
+        *,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        chain: Optional[str] = None,
+        network: Optional[str] = None,
+        status: Optional[str] = None,
+        token: Optional[str] = None,
+        from_address: Optional[str] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        wallet_id: Optional[str] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[IncomingTransactionItem]:
+        """Iterate over incoming transactions, fetching the next page in the background.
+
+        Filters are the same as ``list_incoming_transactions``.  Use
+        ``contextlib.aclosing`` when breaking out early so the in-flight
+        page request is cancelled right away.
+
+        Args:
+            page_size: Transactions per request (1-100).
+            prefetch: Pages to fetch ahead of the one being consumed
+                (0 to fetch each page only when needed).
+            max_items: Stop after this many transactions (None for all).
+            chain: Filter by chain ('solana' or 'ethereum').
+            network: Filter by network.
+            status: Filter by status ('DETECTED' or 'CONFIRMED').
+            token: Filter by token address.
+            from_address: Filter by sender address.
+            since: Filter transactions detected after this epoch (seconds).
+            until: Filter transactions detected before this epoch (seconds).
+            wallet_id: Target wallet ID (multi-wallet sessions).
+            validation: Override the client validation mode for this call.
+            timeout: Seconds every page request together may take, from now.
+            deadline: ``time.monotonic()`` value the last page must arrive by.
+        """
+        deadline = resolve_deadline(timeout, deadline)
+
+        async def fetch(cursor: Optional[str]) -> tuple[Any, Optional[str]]:
+            page = await self.list_incoming_transactions(
+                limit=page_size,
+                cursor=cursor,
+                chain=chain,
+                network=network,
+                status=status,
+                token=token,
+                from_address=from_address,
+                since=since,
+                until=until,
+                wallet_id=wallet_id,
+                validation=validation,
+                deadline=deadline,
+            )
+            return page.data, page.next_cursor if page.has_more else None
+
+        return paginate(fetch, prefetch=prefetch, max_items=max_items)
+
+    async def backfill_incoming(
+        self,
+        since: int,
+        until: Optional[int] = None,
+        *,
+        shards: int = 4,
+        concurrency: Optional[int] = None,
+        page_size: int = 100,
+        chain: Optional[str] = None,
+        network: Optional[str] = None,
+        status: Optional[str] = None,
+        token: Optional[str] = None,
+        from_address: Optional[str] = None,
+        wallet_id: Optional[str] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[IncomingTransactionItem]:
+        """Fetch all incoming transactions in a time range using parallel shards.
+
+        The range is split into ``shards`` consecutive time windows, each
+        paged through its own cursor chain, with up to ``concurrency``
+        windows in flight at once.  Results are yielded newest first, like
+        ``list_incoming_transactions``, and de-duplicated by ``id`` and
+        ``(wallet_id, tx_hash)``.
+
+        Args:
+            since: Start of the range, epoch seconds (inclusive).
+            until: End of the range, epoch seconds (inclusive; default now).
+            shards: Number of time windows to page concurrently.
+            concurrency: Windows paged at once (default: ``shards``).
+            page_size: Transactions per request (1-100).
+            chain: Filter by chain ('solana' or 'ethereum').
+            network: Filter by network.
+            status: Filter by status ('DETECTED' or 'CONFIRMED').
+            token: Filter by token address.
+            from_address: Filter by sender address.
+            wallet_id: Target wallet ID (multi-wallet sessions).
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
+        """
+        if until is None:
+            until = int(time.time())
+        deadline = resolve_deadline(timeout, deadline)
+
+        def shard(lo: int, hi: int) -> Any:
+            async def fetch(cursor: Optional[str]) -> tuple[Any, Optional[str]]:
+                page = await self.list_incoming_transactions(
+                    limit=page_size,
+                    cursor=cursor,
+                    chain=chain,
+                    network=network,
+                    status=status,
+                    token=token,
+                    from_address=from_address,
+                    since=lo,
+                    until=hi,
+                    wallet_id=wallet_id,
+                    validation=validation,
+                    deadline=deadline,
+                )
+                return page.data, page.next_cursor if page.has_more else None
+
+            return fetch
+
+        fetchers = [shard(lo, hi) for lo, hi in time_shards(since, until, shards)]
+        pages = paginate_shards(fetchers, concurrency=concurrency or len(fetchers))
+        seen_ids: set[str] = set()
+        seen_hashes: set[tuple[str, str]] = set()
+        try:
+            async for items in pages:
+                for item in items:
+                    key = (item.wallet_id, item.tx_hash)
+                    if item.id in seen_ids or key in seen_hashes:
+                        continue
+                    seen_ids.add(item.id)
+                    seen_hashes.add(key)
+                    yield item
+        finally:
+            await pages.aclose()
 
     async def get_incoming_transaction_summary(
         self,
@@ -376,6 +1532,9 @@ class WAIaaSClient:
         since: Optional[int] = None,
         until: Optional[int] = None,
         wallet_id: Optional[str] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> IncomingTransactionSummary:
         """GET /v1/wallet/incoming/summary -- Get incoming transaction summary.
 
@@ -386,6 +1545,9 @@ class WAIaaSClient:
             since: Filter start epoch (seconds).
             until: Filter end epoch (seconds).
             wallet_id: Target wallet ID (multi-wallet sessions).
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
         """
         params: dict[str, Any] = {"period": period}
         if chain is not None:
@@ -399,27 +1561,39 @@ class WAIaaSClient:
         if wallet_id is not None:
             params["wallet_id"] = wallet_id
         resp = await self._request(
-            "GET", "/v1/wallet/incoming/summary", params=params
+            "GET", "/v1/wallet/incoming/summary", params=params, timeout=timeout, deadline=deadline
         )
-        return IncomingTransactionSummary.model_validate(resp.json())
+        return self._parse(resp, IncomingTransactionSummary, validation)
 
     # -----------------------------------------------------------------
     # Session API
     # -----------------------------------------------------------------
 
-    async def renew_session(self, session_id: str) -> SessionRenewResponse:
+    async def renew_session(
+        self,
+        session_id: str,
+        *,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> SessionRenewResponse:
         """PUT /v1/sessions/:id/renew -- Renew session token.
 
         After renewal, the client automatically updates its session token.
 
         Args:
             session_id: Session ID to renew.
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
 
         Returns:
             SessionRenewResponse with new token, expiry, and renewal count.
         """
-        resp = await self._request("PUT", f"/v1/sessions/{session_id}/renew")
-        result = SessionRenewResponse.model_validate(resp.json())
+        resp = await self._request(
+            "PUT", f"/v1/sessions/{session_id}/renew", timeout=timeout, deadline=deadline
+        )
+        result = self._parse(resp, SessionRenewResponse, validation)
         # Auto-update session token
         self.set_session_token(result.token)
         return result
@@ -428,14 +1602,20 @@ class WAIaaSClient:
     # Discovery API
     # -----------------------------------------------------------------
 
-    async def get_connect_info(self) -> ConnectInfo:
+    async def get_connect_info(
+        self,
+        *,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> ConnectInfo:
         """GET /v1/connect-info -- Get self-discovery info for this session.
 
         Returns wallets, policies, capabilities, and AI-ready prompt.
         Requires only session token (no master password).
         """
-        resp = await self._request("GET", "/v1/connect-info")
-        return ConnectInfo.model_validate(resp.json())
+        resp = await self._request("GET", "/v1/connect-info", timeout=timeout, deadline=deadline)
+        return self._parse(resp, ConnectInfo, validation)
 
     # -----------------------------------------------------------------
     # Utils API
@@ -446,6 +1626,10 @@ class WAIaaSClient:
         abi: list[dict[str, Any]],
         function_name: str,
         args: Optional[list[Any]] = None,
+        *,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> EncodeCalldataResponse:
         """POST /v1/utils/encode-calldata -- Encode EVM function call into calldata hex.
 
@@ -453,6 +1637,9 @@ class WAIaaSClient:
             abi: ABI fragment array (JSON objects).
             function_name: Function name to encode (e.g., "transfer").
             args: Function arguments (defaults to empty list for zero-arg functions).
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
 
         Returns:
             EncodeCalldataResponse with calldata hex, selector, and functionName.
@@ -461,8 +1648,10 @@ class WAIaaSClient:
             abi=abi, function_name=function_name, args=args or []
         )
         body = request.model_dump(exclude_none=True, by_alias=True)
-        resp = await self._request("POST", "/v1/utils/encode-calldata", json_body=body)
-        return EncodeCalldataResponse.model_validate(resp.json())
+        resp = await self._request(
+            "POST", "/v1/utils/encode-calldata", json_body=body, timeout=timeout, deadline=deadline
+        )
+        return self._parse(resp, EncodeCalldataResponse, validation)
 
     async def sign_transaction(
         self,
@@ -470,6 +1659,9 @@ class WAIaaSClient:
         *,
         chain: Optional[str] = None,
         network: Optional[str] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> SignTransactionResponse:
         """POST /v1/transactions/sign -- Sign an unsigned transaction without broadcasting.
 
@@ -477,6 +1669,9 @@ class WAIaaSClient:
             transaction: Raw unsigned transaction (base64 for Solana, hex for EVM).
             chain: Chain hint (optional, usually auto-detected from wallet).
             network: Target network (e.g., 'polygon-mainnet').
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
 
         Returns:
             SignTransactionResponse with signed transaction, operations, and policy result.
@@ -485,8 +1680,10 @@ class WAIaaSClient:
             transaction=transaction, chain=chain, network=network
         )
         body = request.model_dump(exclude_none=True, by_alias=True)
-        resp = await self._request("POST", "/v1/transactions/sign", json_body=body)
-        return SignTransactionResponse.model_validate(resp.json())
+        resp = await self._request(
+            "POST", "/v1/transactions/sign", json_body=body, timeout=timeout, deadline=deadline
+        )
+        return self._parse(resp, SignTransactionResponse, validation)
 
     # -----------------------------------------------------------------
     # x402 API
@@ -499,6 +1696,9 @@ class WAIaaSClient:
         method: Optional[str] = None,
         headers: Optional[dict[str, str]] = None,
         body: Optional[str] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> X402FetchResponse:
         """POST /v1/x402/fetch -- Fetch URL with x402 auto-payment.
 
@@ -511,20 +1711,31 @@ class WAIaaSClient:
             method: HTTP method (GET, POST, PUT, DELETE, PATCH). Defaults to GET.
             headers: Additional HTTP headers to include.
             body: Request body string.
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
 
         Returns:
             X402FetchResponse with status, headers, body, and optional payment info.
         """
         request = X402FetchRequest(url=url, method=method, headers=headers, body=body)
         body_dict = request.model_dump(exclude_none=True, by_alias=True)
-        resp = await self._request("POST", "/v1/x402/fetch", json_body=body_dict)
-        return X402FetchResponse.model_validate(resp.json())
+        resp = await self._request(
+            "POST", "/v1/x402/fetch", json_body=body_dict, timeout=timeout, deadline=deadline
+        )
+        return self._parse(resp, X402FetchResponse, validation)
 
     # -----------------------------------------------------------------
     # WalletConnect API
     # -----------------------------------------------------------------
 
-    async def wc_connect(self) -> WcPairingResponse:
+    async def wc_connect(
+        self,
+        *,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> WcPairingResponse:
         """POST /v1/wallet/wc/pair -- Start WalletConnect pairing.
 
         Returns a WC URI and QR code that the wallet owner can use
@@ -533,10 +1744,18 @@ class WAIaaSClient:
         Returns:
             WcPairingResponse with uri, qr_code, and expires_at.
         """
-        resp = await self._request("POST", "/v1/wallet/wc/pair")
-        return WcPairingResponse.model_validate(resp.json())
+        resp = await self._request(
+            "POST", "/v1/wallet/wc/pair", timeout=timeout, deadline=deadline
+        )
+        return self._parse(resp, WcPairingResponse, validation)
 
-    async def wc_status(self) -> WcSessionInfo:
+    async def wc_status(
+        self,
+        *,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> WcSessionInfo:
         """GET /v1/wallet/wc/session -- Get WalletConnect session status.
 
         Returns session info (peer wallet, chain, expiry) or raises
@@ -545,10 +1764,18 @@ class WAIaaSClient:
         Returns:
             WcSessionInfo with wallet_id, topic, peer info, chain_id, expiry.
         """
-        resp = await self._request("GET", "/v1/wallet/wc/session")
-        return WcSessionInfo.model_validate(resp.json())
+        resp = await self._request(
+            "GET", "/v1/wallet/wc/session", timeout=timeout, deadline=deadline
+        )
+        return self._parse(resp, WcSessionInfo, validation)
 
-    async def wc_disconnect(self) -> WcDisconnectResponse:
+    async def wc_disconnect(
+        self,
+        *,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> WcDisconnectResponse:
         """DELETE /v1/wallet/wc/session -- Disconnect WalletConnect session.
 
         After disconnecting, a new pairing must be initiated to reconnect.
@@ -556,8 +1783,117 @@ class WAIaaSClient:
         Returns:
             WcDisconnectResponse with disconnected=True on success.
         """
-        resp = await self._request("DELETE", "/v1/wallet/wc/session")
-        return WcDisconnectResponse.model_validate(resp.json())
+        resp = await self._request(
+            "DELETE", "/v1/wallet/wc/session", timeout=timeout, deadline=deadline
+        )
+        return self._parse(resp, WcDisconnectResponse, validation)
+
+    # -----------------------------------------------------------------
+    # Webhook API (master auth)
+    # -----------------------------------------------------------------
+
+    async def create_webhook(
+        self,
+        url: str,
+        *,
+        master_password: str,
+        events: Optional[Iterable[str]] = None,
+        description: Optional[str] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> WebhookCreated:
+        """POST /v1/webhooks -- Subscribe ``url`` to daemon events.
+
+        Args:
+            url: Where the daemon POSTs signed events.
+            master_password: Daemon master password (sent as X-Master-Password).
+            events: Event types to deliver (e.g. TX_CONFIRMED); all if omitted.
+            description: Optional label.
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
+
+        Returns:
+            WebhookCreated, whose ``secret`` signs every delivery and is
+            never returned again.
+        """
+        body: dict[str, Any] = {"url": url, "events": list(events or [])}
+        if description is not None:
+            body["description"] = description
+        resp = await self._request(
+            "POST", "/v1/webhooks", json_body=body,
+            timeout=timeout, deadline=deadline,
+            headers={MASTER_PASSWORD_HEADER: master_password},
+        )
+        return self._parse(resp, WebhookCreated, validation)
+
+    async def list_webhooks(
+        self,
+        *,
+        master_password: str,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> list[Webhook]:
+        """GET /v1/webhooks -- List webhook subscriptions (without secrets)."""
+        resp = await self._request(
+            "GET", "/v1/webhooks", timeout=timeout, deadline=deadline,
+            headers={MASTER_PASSWORD_HEADER: master_password},
+        )
+        return list(self._parse(resp, WebhookList, validation).data)
+
+    async def delete_webhook(
+        self,
+        webhook_id: str,
+        *,
+        master_password: str,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """DELETE /v1/webhooks/:id -- Remove a subscription and its delivery logs."""
+        await self._request(
+            "DELETE", f"/v1/webhooks/{webhook_id}", timeout=timeout, deadline=deadline,
+            headers={MASTER_PASSWORD_HEADER: master_password},
+        )
+
+    async def list_webhook_logs(
+        self,
+        webhook_id: str,
+        *,
+        master_password: str,
+        status: Optional[str] = None,
+        event_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> list[WebhookLog]:
+        """GET /v1/webhooks/:id/logs -- Delivery attempts, newest first.
+
+        Args:
+            webhook_id: Webhook ID.
+            master_password: Daemon master password.
+            status: Only 'success' or 'failed' attempts.
+            event_type: Only attempts for this event type.
+            limit: Max entries (1-100, daemon default 20).
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
+        """
+        params: dict[str, Any] = {}
+        if status is not None:
+            params["status"] = status
+        if event_type is not None:
+            params["event_type"] = event_type
+        if limit is not None:
+            params["limit"] = limit
+        resp = await self._request(
+            "GET", f"/v1/webhooks/{webhook_id}/logs", params=params or None,
+            timeout=timeout, deadline=deadline,
+            headers={MASTER_PASSWORD_HEADER: master_password},
+        )
+        return list(self._parse(resp, WebhookLogList, validation).data)
 
     # -----------------------------------------------------------------
     # Actions API
@@ -572,6 +1908,9 @@ class WAIaaSClient:
         network: Optional[str] = None,
         wallet_id: Optional[str] = None,
         gas_condition: Optional[dict[str, Any]] = None,
+        validation: Optional[ValidationMode] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> ActionResponse:
         """POST /v1/actions/:provider/:action -- Execute an action via provider.
 
@@ -585,6 +1924,9 @@ class WAIaaSClient:
             network: Target network. Defaults to wallet default network.
             wallet_id: Target wallet ID for multi-wallet sessions.
             gas_condition: Gas price condition dict with maxGasPrice, maxPriorityFee, timeout.
+            validation: Override the client validation mode for this call.
+            timeout: Seconds the call may take, retries included.
+            deadline: ``time.monotonic()`` value the call must finish by.
 
         Returns:
             ActionResponse with id, status, and optional pipeline for multi-step.
@@ -600,6 +1942,7 @@ class WAIaaSClient:
             gas_obj = GasCondition(**gas_condition) if isinstance(gas_condition, dict) else gas_condition
             body["gasCondition"] = gas_obj.model_dump(exclude_none=True, by_alias=True)
         resp = await self._request(
-            "POST", f"/v1/actions/{provider}/{action}", json_body=body
+            "POST", f"/v1/actions/{provider}/{action}", json_body=body,
+            timeout=timeout, deadline=deadline,
         )
-        return ActionResponse.model_validate(resp.json())
+        return self._parse(resp, ActionResponse, validation)
@@ -0,0 +1,162 @@
+"""Adaptive (AIMD) limit on concurrent requests to one daemon."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Literal, Optional
+
+# How a request ended, as far as the limit is concerned: "success" feeds
+# a latency sample, "dropped" (timeout, 429, 503) signals overload, and
+# "ignored" (cancellation, other errors) says nothing either way.
+Outcome = Literal["success", "dropped", "ignored"]
+
+# Responses meaning the daemon is past its capacity.
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
+
+@dataclass
+class ConcurrencyStats:
+    """Counters for an AdaptiveConcurrency limiter."""
+
+    acquired: int = 0  # requests let through
+    queued: int = 0  # requests that waited for a slot
+    total_wait: float = 0.0  # seconds spent waiting, summed
+    increases: int = 0  # additive limit increases
+    decreases: int = 0  # multiplicative limit cuts
+
+
+@dataclass
+class AdaptiveConcurrency:
+    """Cap in-flight requests with an additive-increase/multiplicative-decrease limit.
+
+    The limit grows by up to one per round of successful requests while
+    latency stays within ``latency_tolerance`` times the baseline (the
+    lowest recent latency), and is multiplied by ``backoff`` on a latency
+    spike, a timeout, or a 429/503 -- at most once per round trip, so a
+    burst of failures from one overload cuts it once.  Calls over the
+    limit wait in FIFO order.
+
+    Pass an instance as ``WAIaaSClient(concurrency=...)``.  The limit
+    describes one daemon's capacity: use one instance per daemon (a
+    ``WAIaaSClientPool`` shares its instance across sessions).
+    """
+
+    initial_limit: int = 10
+    min_limit: int = 1
+    max_limit: int = 200
+    backoff: float = 0.7
+    latency_tolerance: float = 2.0
+    # Fraction of the gap to a slower sample the baseline moves each
+    # success, so it follows a lasting change in the daemon's latency.
+    baseline_drift: float = 0.01
+    clock: Callable[[], float] = time.monotonic
+    stats: ConcurrencyStats = field(default_factory=ConcurrencyStats)
+
+    def __post_init__(self) -> None:
+        self._limit = float(self.initial_limit)
+        self._in_flight = 0
+        self._waiters: collections.deque[asyncio.Future[None]] = collections.deque()
+        self._baseline: Optional[float] = None
+        self._last_decrease = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        """Current in-flight limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a slot."""
+        return len(self._waiters)
+
+    @property
+    def mean_wait(self) -> float:
+        """Average seconds a request waited for a slot."""
+        if not self.stats.acquired:
+            return 0.0
+        return self.stats.total_wait / self.stats.acquired
+
+    @property
+    def baseline_latency(self) -> Optional[float]:
+        """Latency considered unloaded, in seconds (None before the first sample)."""
+        return self._baseline
+
+    async def acquire(self) -> float:
+        """Wait for a slot.
+
+        Returns:
+            The start time to pass back to ``release``.
+        """
+        queued_at = self.clock()
+        if self._in_flight >= self.limit or self._waiters:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            self.stats.queued += 1
+            try:
+                await waiter
+            except BaseException:
+                if waiter.done() and not waiter.cancelled():
+                    # Woken and cancelled at once: pass the slot on.
+                    self._in_flight -= 1
+                    self._wake()
+                elif waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                raise
+        else:
+            self._in_flight += 1
+        started = self.clock()
+        self.stats.acquired += 1
+        self.stats.total_wait += started - queued_at
+        return started
+
+    def release(self, started: float, outcome: Outcome) -> None:
+        """Free a slot and adjust the limit.
+
+        Args:
+            started: Value returned by ``acquire``.
+            outcome: How the request ended.
+        """
+        now = self.clock()
+        # Only grow when the limit is what held traffic back.
+        saturated = self._in_flight * 2 >= self.limit
+        self._in_flight -= 1
+        if outcome == "dropped":
+            self._decrease(started, now)
+        elif outcome == "success":
+            latency = now - started
+            baseline = self._baseline
+            if baseline is None or latency < baseline:
+                self._baseline = latency
+            else:
+                self._baseline = baseline + (latency - baseline) * self.baseline_drift
+            if baseline is not None and latency > baseline * self.latency_tolerance:
+                self._decrease(started, now)
+            elif saturated and self._limit < self.max_limit:
+                # About +1 per round of ``limit`` successes.
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+                self.stats.increases += 1
+        self._wake()
+
+    def _decrease(self, started: float, now: float) -> None:
+        # Requests sent before the last cut saw the old limit; counting
+        # them again would collapse the limit on a single overload.
+        if started < self._last_decrease:
+            return
+        self._limit = max(float(self.min_limit), self._limit * self.backoff)
+        self._last_decrease = now
+        self.stats.decreases += 1
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
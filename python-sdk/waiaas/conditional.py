@@ -0,0 +1,74 @@
+"""ETag / Last-Modified validator cache for conditional GET requests."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Hashable, Optional
+
+import httpx
+
+
+@dataclass
+class ValidatorStats:
+    """Counters for a ValidatorCache."""
+
+    conditional_requests: int = 0  # GETs sent with If-None-Match/If-Modified-Since
+    not_modified: int = 0  # 304 answers served from the stored response
+    bytes_saved: int = 0  # body bytes not re-downloaded thanks to 304s
+
+
+@dataclass
+class ValidatorCache:
+    """Remembers validators and bodies of GET responses.
+
+    Pass an instance as ``WAIaaSClient(validator_cache=...)``.  Responses
+    carrying an ``ETag`` or ``Last-Modified`` header are stored; the next
+    GET for the same path, params and token sends ``If-None-Match`` /
+    ``If-Modified-Since``, and a ``304 Not Modified`` answer is replaced
+    by the stored response -- together with the model already parsed from
+    it, so neither the body nor the model is rebuilt.
+    """
+
+    max_entries: int = 256
+    stats: ValidatorStats = field(default_factory=ValidatorStats)
+
+    def __post_init__(self) -> None:
+        self._entries: OrderedDict[Hashable, httpx.Response] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[httpx.Response]:
+        """Return the stored response for ``key``, if any."""
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+        return response
+
+    def store(self, key: Hashable, response: httpx.Response) -> None:
+        """Store ``response`` if it carries validators."""
+        if not has_validators(response):
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def has_validators(response: httpx.Response) -> bool:
+    """Whether ``response`` can be revalidated with a conditional request."""
+    return "etag" in response.headers or "last-modified" in response.headers
+
+
+def conditional_headers(response: httpx.Response) -> dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from ``response``."""
+    headers: dict[str, str] = {}
+    etag = response.headers.get("etag")
+    if etag is not None:
+        headers["If-None-Match"] = etag
+    last_modified = response.headers.get("last-modified")
+    if last_modified is not None:
+        headers["If-Modified-Since"] = last_modified
+    return headers
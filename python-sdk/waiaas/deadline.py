@@ -0,0 +1,77 @@
+"""Per-call and context-scoped deadlines."""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import time
+from typing import Iterator, Optional
+
+# Absolute time.monotonic() value calls in the current context must finish by.
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "waiaas_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[float]:
+    """The deadline set by the innermost ``deadline_scope``, if any."""
+    return _deadline.get()
+
+
+def remaining(deadline: Optional[float] = None) -> Optional[float]:
+    """Seconds left until ``deadline`` (default: the context's), or None."""
+    if deadline is None:
+        deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def resolve_deadline(
+    timeout: Optional[float] = None, deadline: Optional[float] = None
+) -> Optional[float]:
+    """Combine a relative ``timeout``, an absolute ``deadline`` and the context's.
+
+    The earliest of them wins, so a call can tighten but never extend
+    the deadline of the scope it runs in.
+
+    Args:
+        timeout: Seconds from now.
+        deadline: Absolute ``time.monotonic()`` value.
+
+    Returns:
+        The effective deadline, or None if there is none.
+    """
+    candidates = [d for d in (deadline, _deadline.get()) if d is not None]
+    if timeout is not None:
+        candidates.append(time.monotonic() + timeout)
+    return min(candidates) if candidates else None
+
+
+@contextlib.contextmanager
+def deadline_scope(
+    timeout: Optional[float] = None, *, deadline: Optional[float] = None
+) -> Iterator[Optional[float]]:
+    """Bound every client call made inside the block by one deadline.
+
+    Usage:
+        with deadline_scope(20.0):
+            balance = await client.get_balance()
+            tx = await client.send_token(to, amount)
+
+    Nested scopes and per-call ``timeout=``/``deadline=`` can only make
+    the deadline earlier.  Tasks created inside the block inherit it.
+
+    Args:
+        timeout: Seconds from now.
+        deadline: Absolute ``time.monotonic()`` value.
+
+    Yields:
+        The effective deadline.
+    """
+    effective = resolve_deadline(timeout, deadline)
+    token = _deadline.set(effective)
+    try:
+        yield effective
+    finally:
+        _deadline.reset(token)
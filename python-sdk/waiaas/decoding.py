@@ -0,0 +1,193 @@
+"""JSON decoding and response validation helpers.
+
+Responses are validated straight from the raw bytes with pydantic-core's
+JSON parser instead of ``json.loads`` followed by ``model_validate``,
+which would build and then walk an intermediate dict.  ``loads`` uses
+orjson when it is installed (``pip install 'waiaas[orjson]'``) for callers
+that want plain dicts.
+
+``decode`` supports four validation modes:
+
+- ``strict``: pydantic strict mode; a value of the wrong JSON type
+  (``"1"`` for an int, say) raises instead of being coerced.
+- ``lazy``: like ``strict``, but the items of list fields marked with
+  ``waiaas.lazy.LazyItems`` are validated the first time they are read
+  (see ``waiaas.lazy.LazyList``), so a malformed item raises then.
+- ``lenient``: pydantic's lax mode: values are coerced where pydantic can
+  and unknown fields are ignored; anything else still raises.  Costs the
+  same as ``strict``.
+- ``construct``: never raises -- payloads are validated as in
+  ``lenient`` and, if that fails, built unvalidated with
+  ``model_construct`` instead.  Only for daemons you operate yourself.
+
+The mode travels in the pydantic validation context (``{"validation":
+mode}``), which is how ``LazyItems`` fields know to stay lazy.
+
+pydantic-core validates JSON in Rust, so ``construct`` takes the same
+path as ``lenient`` whenever it can (see ``benchmarks/bench_validation.py``);
+``construct`` is for never rejecting a trusted daemon's payloads, not for
+speed.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import types
+import typing
+from typing import (
+    Any,
+    Callable,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without the extra
+    orjson = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+ValidationMode = Literal["strict", "lazy", "lenient", "construct"]
+VALIDATION_MODES: tuple[str, ...] = get_args(ValidationMode)
+
+# Validation contexts, read by ``LazyItems`` fields.
+_LAZY = {"validation": "lazy"}
+_LENIENT = {"validation": "lenient"}
+_CONSTRUCT = {"validation": "construct"}
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON into plain Python objects, using orjson if available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter[Any]:
+    """Return a cached ``TypeAdapter`` for ``tp``."""
+    return TypeAdapter(tp)
+
+
+def validate_json(
+    data: Union[bytes, str],
+    tp: type[T],
+    context: Optional[dict[str, Any]] = None,
+    strict: Optional[bool] = None,
+) -> T:
+    """Validate raw JSON ``data`` directly into ``tp``.
+
+    Models with ``LazyItems`` fields decoded in ``lazy`` mode are the
+    exception: their items are kept as plain dicts anyway, which ``loads``
+    (orjson) builds faster than pydantic-core's JSON parser, so they are
+    decoded first and validated from Python.
+    """
+    adapter = type_adapter(tp)
+    if (context or {}).get("validation") == "lazy" and _has_lazy_fields(tp):
+        return adapter.validate_python(loads(data), strict=strict, context=context)  # type: ignore[no-any-return]
+    return adapter.validate_json(data, strict=strict, context=context)  # type: ignore[no-any-return]
+
+
+@functools.lru_cache(maxsize=None)
+def _has_lazy_fields(tp: Any) -> bool:
+    from waiaas.lazy import LazyItems  # circular at import time
+
+    if not (isinstance(tp, type) and issubclass(tp, BaseModel)):
+        return False
+    return any(
+        isinstance(m, LazyItems) for f in tp.model_fields.values() for m in f.metadata
+    )
+
+
+def decode(
+    data: Union[bytes, str], tp: type[T], mode: ValidationMode = "strict"
+) -> T:
+    """Decode raw JSON ``data`` into ``tp`` using the given validation mode."""
+    if mode == "strict":
+        return validate_json(data, tp, strict=True)
+    if mode == "lazy":
+        return validate_json(data, tp, _LAZY, strict=True)
+    if mode == "lenient":
+        return validate_json(data, tp, _LENIENT, strict=False)
+    if mode == "construct":
+        try:
+            return validate_json(data, tp, _CONSTRUCT, strict=False)
+        except ValidationError:
+            return construct(tp, loads(data))  # type: ignore[no-any-return]
+    raise ValueError(f"Unknown validation mode {mode!r}; expected one of {VALIDATION_MODES}")
+
+
+# ---------------------------------------------------------------------------
+# Construct (no validation)
+# ---------------------------------------------------------------------------
+
+
+def construct(tp: Any, value: Any) -> Any:
+    """Build ``tp`` from decoded JSON without validation."""
+    return _builder(tp)(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _builder(tp: Any) -> Callable[[Any], Any]:
+    """Return a function converting decoded JSON into ``tp`` (unvalidated)."""
+    origin = get_origin(tp)
+    if origin is typing.Union or origin is types.UnionType:
+        members = [a for a in get_args(tp) if a is not type(None)]
+        if len(members) == 1:
+            inner = _builder(members[0])
+            return lambda v: None if v is None else inner(v)
+        return _identity
+    if origin in (list, typing.List):
+        (item_tp,) = get_args(tp) or (Any,)
+        item = _builder(item_tp)
+        if item is _identity:
+            return _identity
+        return lambda v: [item(x) for x in v] if isinstance(v, list) else v
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        return _model_builder(tp)
+    return _identity
+
+
+def _model_builder(model: type[BaseModel]) -> Callable[[Any], Any]:
+    """Build ``model`` instances with ``model_construct``, nested models included.
+
+    ``model_construct`` leaves nested dicts as they are, so the builders
+    for nested fields -- resolved once per model class -- run first.
+    """
+    # (name, alias, nested builder or None), resolved on first use since
+    # models may refer to each other.
+    plan: list[tuple[str, str, Optional[Callable[[Any], Any]]]] = []
+
+    def build(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        if not plan:
+            for name, info in model.model_fields.items():
+                nested = _builder(info.annotation)
+                plan.append(
+                    (name, info.alias or name, None if nested is _identity else nested)
+                )
+        values = {}
+        for name, alias, nested in plan:
+            if alias in value:
+                raw = value[alias]
+            elif name in value:
+                raw = value[name]
+            else:
+                continue
+            values[name] = raw if nested is None else nested(raw)
+        return model.model_construct(**values)
+
+    return build
+
+
+def _identity(value: Any) -> Any:
+    return value
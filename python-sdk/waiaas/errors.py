@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
+
+from waiaas.retry import parse_retry_after
 
 
 class WAIaaSError(Exception):
@@ -17,6 +19,7 @@ class WAIaaSError(Exception):
         details: Optional[dict[str, Any]] = None,
         request_id: Optional[str] = None,
         hint: Optional[str] = None,
+        retry_after: Optional[float] = None,
     ) -> None:
         super().__init__(message)
         self.code = code
@@ -26,10 +29,16 @@ class WAIaaSError(Exception):
         self.details = details
         self.request_id = request_id
         self.hint = hint
+        self.retry_after = retry_after  # seconds, from Retry-After / rate-limit headers
 
     @classmethod
-    def from_response(cls, status_code: int, body: dict[str, Any]) -> "WAIaaSError":
-        """Create WAIaaSError from API error response JSON."""
+    def from_response(
+        cls,
+        status_code: int,
+        body: dict[str, Any],
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> "WAIaaSError":
+        """Create WAIaaSError from API error response JSON and headers."""
         return cls(
             code=body.get("code", "UNKNOWN_ERROR"),
             message=body.get("message", "Unknown error"),
@@ -38,6 +47,7 @@ class WAIaaSError(Exception):
             details=body.get("details"),
             request_id=body.get("requestId"),
             hint=body.get("hint"),
+            retry_after=parse_retry_after(headers) if headers is not None else None,
         )
 
     def __repr__(self) -> str:
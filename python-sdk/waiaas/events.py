@@ -0,0 +1,405 @@
+"""Receive signed daemon webhooks instead of polling for state changes."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import hashlib
+import hmac
+import json
+import time
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+    Optional,
+)
+
+import httpx
+from pydantic import ValidationError
+
+from waiaas.errors import WAIaaSError
+from waiaas.models import WebhookCreated, WebhookEvent
+from waiaas.reconcile import HighWaterMark, ReconcileReport, event_key, reconcile
+
+if TYPE_CHECKING:
+    from waiaas.client import WAIaaSClient
+
+SIGNATURE_HEADER = "x-waiaas-signature"
+
+# Events that end a transaction's life, as delivered by the daemon.
+TX_TERMINAL_EVENTS = frozenset({"TX_CONFIRMED", "TX_FAILED"})
+
+EventHandler = Callable[[WebhookEvent], Awaitable[None]]
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    413: "Payload Too Large",
+}
+
+
+def sign(secret: str, body: bytes) -> str:
+    """The ``X-WAIaaS-Signature`` value the daemon sends for ``body``."""
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(secrets: Iterable[str], body: bytes, signature: str) -> bool:
+    """Check ``signature`` against each secret in constant time."""
+    valid = False
+    for secret in secrets:
+        # No early exit, so timing does not reveal which secret matched.
+        valid |= hmac.compare_digest(sign(secret, body), signature)
+    return valid
+
+
+@dataclass
+class EventReceiverStats:
+    """Counters for an EventReceiver."""
+
+    received: int = 0  # deliveries accepted
+    duplicates: int = 0  # redeliveries of an event already handled
+    rejected: int = 0  # bad signature, malformed or stale deliveries
+    handler_errors: int = 0  # subscriber calls that raised
+
+
+class EventReceiver:
+    """Small asyncio HTTP endpoint for the daemon's webhook deliveries.
+
+    Usage:
+        async with EventReceiver(port=8700, public_url="http://agent:8700") as events:
+            await events.register(client, master_password="...", events=["TX_CONFIRMED", "TX_FAILED"])
+            tx = await client.send_token(to, amount)
+            event = await events.wait_for_transaction(tx.id, timeout=120)
+
+    Every delivery's HMAC signature is checked in constant time against
+    the secrets of the webhooks registered through it (or passed in),
+    deliveries older than ``max_age`` seconds are refused, and
+    redeliveries of an event already handled (same event id) are
+    acknowledged without dispatching it again.  Accepted events go to
+    the subscribers of their type and resolve matching ``wait_for``
+    calls.  The endpoint answers before subscribers finish, so a slow
+    subscriber never makes the daemon retry.
+
+    ``handle`` accepts a delivery from any other web server instead.
+
+    Every event handled advances ``high_water_mark``; give it a file
+    path, keep the webhook across restarts (``delete_on_close=False``)
+    and call ``reconcile`` on startup to replay what was missed while
+    the receiver was down.
+    """
+
+    def __init__(
+        self,
+        secrets: Iterable[str] = (),
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = "/waiaas/events",
+        public_url: Optional[str] = None,
+        max_age: float = 300.0,
+        dedupe_size: int = 10_000,
+        max_body: int = 1 << 20,
+        clock: Callable[[], float] = time.time,
+        high_water_mark: Optional[HighWaterMark] = None,
+    ) -> None:
+        self._secrets = list(secrets)
+        self.host = host
+        self.port = port
+        self.path = path
+        self._public_url = public_url
+        self.max_age = max_age
+        self.max_body = max_body
+        self.clock = clock
+        self.stats = EventReceiverStats()
+        self.high_water_mark = high_water_mark or HighWaterMark()
+        self._seen: collections.OrderedDict[str, None] = collections.OrderedDict()
+        self._dedupe_size = dedupe_size
+        self._recent: collections.deque[WebhookEvent] = collections.deque(maxlen=dedupe_size)
+        self._handlers: dict[Optional[str], list[EventHandler]] = {}
+        self._waiters: list[tuple[Callable[[WebhookEvent], bool], asyncio.Future[WebhookEvent]]] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._server: Optional[asyncio.Server] = None
+        self._webhooks: list[tuple[WAIaaSClient, str, str]] = []
+
+    @property
+    def url(self) -> str:
+        """URL the daemon should deliver to."""
+        if self._public_url is not None:
+            return self._public_url.rstrip("/") + self.path
+        return f"http://{self.host}:{self.port}{self.path}"
+
+    def add_secret(self, secret: str) -> None:
+        """Accept deliveries signed with ``secret``."""
+        if secret not in self._secrets:
+            self._secrets.append(secret)
+
+    # -----------------------------------------------------------------
+    # Lifecycle
+    # -----------------------------------------------------------------
+
+    async def __aenter__(self) -> "EventReceiver":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Start listening; with ``port=0`` a free port is picked."""
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stop listening, save the mark, delete registered webhooks and fail waits."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.high_water_mark.close()
+        for client, webhook_id, master_password in self._webhooks:
+            try:
+                await client.delete_webhook(webhook_id, master_password=master_password)
+            except (WAIaaSError, httpx.HTTPError):
+                pass  # best effort; the daemon gives up on an unreachable URL
+        self._webhooks.clear()
+        for task in list(self._tasks):
+            task.cancel()
+        for _, future in self._waiters:
+            if not future.done():
+                future.cancel()
+        self._waiters.clear()
+
+    async def register(
+        self,
+        client: WAIaaSClient,
+        *,
+        master_password: str,
+        events: Optional[Iterable[str]] = None,
+        description: Optional[str] = "waiaas-python event receiver",
+        delete_on_close: bool = True,
+    ) -> WebhookCreated:
+        """Subscribe this receiver's ``url`` and trust the returned secret.
+
+        Args:
+            client: Client to register through.
+            master_password: Daemon master password.
+            events: Event types to receive; all if omitted.
+            description: Label shown in the daemon's webhook list.
+            delete_on_close: Delete the webhook again on ``close``.  Keep
+                it (and its secret) to ``reconcile`` after a restart.
+        """
+        created = await client.create_webhook(
+            self.url, master_password=master_password, events=events, description=description
+        )
+        self.add_secret(created.secret)
+        if delete_on_close:
+            self._webhooks.append((client, created.id, master_password))
+        return created
+
+    async def reconcile(
+        self,
+        client: WAIaaSClient,
+        *,
+        webhook_id: str,
+        master_password: str,
+        lookback: int = 3600,
+    ) -> ReconcileReport:
+        """Replay events missed since ``high_water_mark`` to the subscribers.
+
+        Reads the webhook's failed deliveries newer than the mark to
+        learn which event types were missed, then rebuilds those events
+        from the transaction lists (TX_SUBMITTED from both the outgoing
+        and the incoming one), fetching only transactions created
+        since the mark (less ``lookback`` seconds, for transactions that
+        took a while to finish).  Events the receiver already handled
+        are skipped, so running it after a clean shutdown is cheap and
+        harmless.  Does nothing before the first event was ever handled.
+
+        Args:
+            client: Client whose session sees the webhook's transactions.
+            webhook_id: The webhook this receiver was registered as.
+            master_password: Daemon master password.
+            lookback: Seconds before the mark to look for transactions.
+
+        Returns:
+            What was missed and what was replayed.
+        """
+        return await reconcile(
+            self,
+            client,
+            webhook_id=webhook_id,
+            master_password=master_password,
+            lookback=lookback,
+        )
+
+    # -----------------------------------------------------------------
+    # Subscribers
+    # -----------------------------------------------------------------
+
+    def subscribe(
+        self, event_type: Optional[str], handler: EventHandler
+    ) -> Callable[[], None]:
+        """Call ``handler`` for every event of ``event_type`` (None: all events).
+
+        Returns:
+            A function that unsubscribes ``handler``.
+        """
+        handlers = self._handlers.setdefault(event_type, [])
+        handlers.append(handler)
+        return lambda: handlers.remove(handler) if handler in handlers else None
+
+    async def wait_for(
+        self,
+        event_type: Optional[str] = None,
+        *,
+        predicate: Optional[Callable[[WebhookEvent], bool]] = None,
+        timeout: Optional[float] = None,
+        include_recent: bool = False,
+    ) -> WebhookEvent:
+        """Wait for the next event of ``event_type`` matching ``predicate``.
+
+        Args:
+            event_type: Event type, or None for any.
+            predicate: Further condition on the event.
+            timeout: Seconds to wait.
+            include_recent: Also match events received before the call.
+
+        Raises:
+            WAIaaSError: ``WAIT_TIMEOUT`` if ``timeout`` passes first.
+        """
+
+        def matches(event: WebhookEvent) -> bool:
+            if event_type is not None and event.event != event_type:
+                return False
+            return predicate is None or predicate(event)
+
+        if include_recent:
+            for event in reversed(self._recent):
+                if matches(event):
+                    return event
+        future: asyncio.Future[WebhookEvent] = asyncio.get_running_loop().create_future()
+        waiter = (matches, future)
+        self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise WAIaaSError(
+                code="WAIT_TIMEOUT",
+                message=f"No {event_type or 'matching'} event within {timeout}s",
+            ) from None
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    async def wait_for_transaction(
+        self, tx_id: str, *, timeout: Optional[float] = None
+    ) -> WebhookEvent:
+        """Wait for TX_CONFIRMED or TX_FAILED of ``tx_id``, even if it already arrived."""
+        return await self.wait_for(
+            predicate=lambda e: e.event in TX_TERMINAL_EVENTS and e.tx_id == tx_id,
+            timeout=timeout,
+            include_recent=True,
+        )
+
+    # -----------------------------------------------------------------
+    # Deliveries
+    # -----------------------------------------------------------------
+
+    async def handle(self, body: bytes, headers: Mapping[str, str]) -> int:
+        """Process one delivery.
+
+        Args:
+            body: Raw request body, exactly as received.
+            headers: Request headers (names lower-cased, or an
+                ``httpx.Headers``-like case-insensitive mapping).
+
+        Returns:
+            The HTTP status to answer with: 200 when accepted (duplicates
+            included), 401 for a bad signature, 400 for anything malformed
+            or stale.  The daemon does not retry 4xx answers.
+        """
+        signature = headers.get(SIGNATURE_HEADER)
+        if not signature or not verify_signature(self._secrets, body, signature):
+            self.stats.rejected += 1
+            return 401
+        try:
+            event = WebhookEvent.model_validate(json.loads(body))
+        except (ValueError, ValidationError):
+            self.stats.rejected += 1
+            return 400
+        if self.clock() - event.timestamp > self.max_age:
+            self.stats.rejected += 1
+            return 400
+        if not self.dispatch(event):
+            self.stats.duplicates += 1
+            return 200
+        self.stats.received += 1
+        return 200
+
+    def dispatch(self, event: WebhookEvent) -> bool:
+        """Hand ``event`` to the subscribers and waiters, unless already handled.
+
+        Returns:
+            False if this event (by id, or by what it reports) was
+            handled before.
+        """
+        if event.id in self._seen or self.high_water_mark.seen(event_key(event)):
+            return False
+        self._seen[event.id] = None
+        if len(self._seen) > self._dedupe_size:
+            self._seen.popitem(last=False)
+        self.high_water_mark.advance(event)
+        self._recent.append(event)
+        for matches, future in list(self._waiters):
+            if not future.done() and matches(event):
+                future.set_result(event)
+        for handler in self._handlers.get(event.event, []) + self._handlers.get(None, []):
+            task = asyncio.ensure_future(self._call(handler, event))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _call(self, handler: EventHandler, event: WebhookEvent) -> None:
+        try:
+            await handler(event)
+        except Exception:
+            self.stats.handler_errors += 1
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        status = 400
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 10.0)
+            lines = head.decode("latin-1").split("\r\n")
+            method, target, _ = lines[0].split(" ", 2)
+            headers: dict[str, str] = {}
+            for line in lines[1:]:
+                name, sep, value = line.partition(":")
+                if sep:
+                    headers[name.strip().lower()] = value.strip()
+            length = int(headers.get("content-length", "0"))
+            if method != "POST" or target.split("?", 1)[0] != self.path:
+                status = 404
+            elif length > self.max_body:
+                status = 413
+            else:
+                body = await asyncio.wait_for(reader.readexactly(length), 10.0)
+                status = await self.handle(body, headers)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ValueError):
+            status = 400
+        try:
+            writer.write(
+                f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                "Content-Length: 0\r\nConnection: close\r\n\r\n".encode()
+            )
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
@@ -0,0 +1,153 @@
+"""Hedged requests: a second attempt for reads that are slower than usual."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from waiaas.retry import RetryBudget
+
+T = TypeVar("T")
+
+# Path prefixes of idempotent reads that usually wait on a chain RPC.
+# Each prefix keeps its own latency distribution.
+DEFAULT_HEDGED_PATHS = (
+    "/v1/wallet/balance",
+    "/v1/wallet/health-factor",
+    "/v1/transactions/",
+)
+
+
+@dataclass
+class HedgeStats:
+    """Counters for a RequestHedger."""
+
+    requests: int = 0  # hedgeable requests seen
+    hedged: int = 0  # second attempts sent
+    hedge_wins: int = 0  # second attempts that answered first
+    budget_denied: int = 0  # hedges skipped because the budget was empty
+
+    @property
+    def extra_load(self) -> float:
+        """Second attempts as a fraction of requests."""
+        return self.hedged / self.requests if self.requests else 0.0
+
+
+def _default_budget() -> RetryBudget:
+    return RetryBudget(ratio=0.1, min_per_second=0.0, max_tokens=10.0)
+
+
+@dataclass
+class RequestHedger:
+    """Send a backup request when a read is slower than its recent ``percentile``.
+
+    Latencies are tracked per path prefix over the last ``window``
+    answers; until ``min_samples`` have been seen, a prefix is not hedged.
+    When the first attempt has not answered by the percentile latency
+    (at least ``min_delay``), an identical second attempt is sent, the
+    first answer wins and the other attempt is cancelled.  An attempt
+    that raises (e.g. a transport error) leaves the other one running.
+
+    ``budget`` caps the extra load: each request adds ``budget.ratio``
+    tokens and each hedge spends one, so by default at most about 10% of
+    requests are hedged however slow the daemon gets.
+
+    Pass an instance as ``WAIaaSClient(hedger=...)``.  Only GETs under
+    ``paths`` are hedged.
+    """
+
+    percentile: float = 0.95
+    min_delay: float = 0.005  # seconds
+    window: int = 200
+    min_samples: int = 20
+    paths: tuple[str, ...] = DEFAULT_HEDGED_PATHS
+    budget: RetryBudget = field(default_factory=_default_budget)
+    clock: Callable[[], float] = time.monotonic
+    stats: HedgeStats = field(default_factory=HedgeStats)
+
+    def __post_init__(self) -> None:
+        self._latencies: dict[str, collections.deque[float]] = {}
+        self._thresholds: dict[str, Optional[float]] = {}
+
+    def key_for(self, method: str, path: str) -> Optional[str]:
+        """Latency bucket of a request, or None if it is not hedged."""
+        if method != "GET":
+            return None
+        for prefix in self.paths:
+            if path.startswith(prefix):
+                return prefix
+        return None
+
+    def threshold(self, key: str) -> Optional[float]:
+        """Seconds to wait before hedging ``key``, or None while still learning."""
+        if key not in self._thresholds:
+            samples = self._latencies.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                self._thresholds[key] = None
+            else:
+                ordered = sorted(samples)
+                rank = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+                self._thresholds[key] = max(self.min_delay, ordered[rank])
+        return self._thresholds[key]
+
+    def record(self, key: str, latency: float) -> None:
+        """Add one answered attempt's latency to ``key``'s window."""
+        samples = self._latencies.get(key)
+        if samples is None:
+            samples = self._latencies[key] = collections.deque(maxlen=self.window)
+        samples.append(latency)
+        self._thresholds.pop(key, None)
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Call ``fn``, hedging with a second call if the first is slow.
+
+        Args:
+            key: Latency bucket from ``key_for``.
+            fn: Sends one attempt; called at most twice.
+
+        Returns:
+            The first attempt's result to arrive.
+        """
+        self.stats.requests += 1
+        self.budget.record_request()
+        delay = self.threshold(key)
+        started = self.clock()
+        primary = asyncio.ensure_future(fn())
+        tasks = [primary]
+        try:
+            if delay is None:
+                result = await primary
+                self.record(key, self.clock() - started)
+                return result
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            hedge_started = self.clock()
+            if not done and not self.budget.try_spend():
+                self.stats.budget_denied += 1
+            elif not done:
+                self.stats.hedged += 1
+                tasks.append(asyncio.ensure_future(fn()))
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                answered = [t for t in tasks if t in done and t.exception() is None]
+                if answered:
+                    winner = answered[0]
+                    if winner is primary:
+                        self.record(key, self.clock() - started)
+                    else:
+                        self.stats.hedge_wins += 1
+                        self.record(key, self.clock() - hedge_started)
+                    return winner.result()
+                if not pending:
+                    # Every attempt failed; surface the first one's error.
+                    return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # mark retrieved
@@ -0,0 +1,96 @@
+"""Registry of in-flight client calls, for spotting stuck calls and draining."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+
+@dataclass(frozen=True)
+class InFlightRequest:
+    """One client call that has not returned yet."""
+
+    id: int
+    method: str
+    path: str
+    started_at: float  # ``clock()`` value when the call started
+    task: Optional[asyncio.Task[Any]] = field(default=None, compare=False, repr=False)
+
+    def age(self, now: Optional[float] = None) -> float:
+        """Seconds since the call started (``now`` defaults to ``time.monotonic()``)."""
+        return (time.monotonic() if now is None else now) - self.started_at
+
+
+@dataclass
+class DrainReport:
+    """What ``close(drain_timeout=...)`` had to do."""
+
+    completed: int = 0  # calls that finished while draining
+    cancelled: list[InFlightRequest] = field(default_factory=list)  # calls cut off
+    cancelled_tasks: int = 0  # background tasks (refreshes, renewals) cut off
+    duration: float = 0.0  # seconds spent draining
+
+    @property
+    def clean(self) -> bool:
+        """Whether nothing had to be cancelled."""
+        return not self.cancelled and not self.cancelled_tasks
+
+
+class InFlightRegistry:
+    """Track client calls from start to finish.
+
+    Each call is registered with the task running it, so that a drain
+    can cancel calls still running when its timeout passes.  That task
+    must belong to the call alone, not to its caller.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self._requests: dict[int, InFlightRequest] = {}
+        self._ids = itertools.count(1)
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    @property
+    def requests(self) -> list[InFlightRequest]:
+        """Calls in flight, oldest first."""
+        return sorted(self._requests.values(), key=lambda r: r.started_at)
+
+    @contextlib.contextmanager
+    def track(
+        self, method: str, path: str, task: Optional[asyncio.Task[Any]] = None
+    ) -> Iterator[InFlightRequest]:
+        """Register a call for the duration of the block.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+            task: Task running the call and nothing else; None for a
+                call that cannot be cancelled on its own.
+        """
+        request = InFlightRequest(
+            id=next(self._ids),
+            method=method,
+            path=path,
+            started_at=self.clock(),
+            task=task,
+        )
+        self._requests[request.id] = request
+        self._idle.clear()
+        try:
+            yield request
+        finally:
+            del self._requests[request.id]
+            if not self._requests:
+                self._idle.set()
+
+    async def wait_idle(self) -> None:
+        """Wait until no call is in flight."""
+        await self._idle.wait()
@@ -0,0 +1,169 @@
+"""Lazily validated list fields for paginated response models.
+
+List fields marked ``Annotated[list[T], LazyItems()]`` are plain eagerly
+validated ``list[T]`` fields in every validation mode but ``lazy``.  In
+``lazy`` mode (``waiaas.decoding.decode``) they become a ``LazyList[T]``
+instead: a ``list`` that keeps the decoded JSON items and validates each
+one into ``T`` the first time it is read.  Callers that only look at
+``has_more``/``cursor`` or the first item of a page skip building every
+model on it.
+
+A malformed item raises ``ValidationError`` when it is read rather than
+when the response is decoded, which is why laziness is opt-in.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    SupportsIndex,
+    TypeVar,
+    Union,
+    get_args,
+    overload,
+)
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+
+from waiaas.decoding import type_adapter
+
+T = TypeVar("T")
+
+
+class LazyList(list, Generic[T]):  # type: ignore[type-arg]
+    """``list`` whose items are validated the first time they are read.
+
+    Indexing, slicing (returning a plain list), iteration and ``len()``
+    validate only the items they touch; every other list operation --
+    mutation, comparison, ``in``, ``repr`` -- validates the remaining
+    items first, after which this is an ordinary list.  Validated items
+    are kept, so each one is built at most once.
+    """
+
+    __slots__ = ("_convert", "_done")
+
+    def __init__(self, raw: Iterable[Any], convert: Callable[[Any], T]) -> None:
+        super().__init__(raw)
+        self._convert = convert
+        # Whether each item is validated yet; None once all of them are.
+        self._done: Optional[list[bool]] = [False] * len(self) if len(self) else None
+
+    @property
+    def materialized(self) -> int:
+        """Number of items validated so far."""
+        return len(self) if self._done is None else sum(self._done)
+
+    def _item(self, index: int) -> T:
+        item = list.__getitem__(self, index)
+        done = self._done
+        if done is not None and not done[index]:
+            item = self._convert(item)
+            list.__setitem__(self, index, item)
+            done[index] = True
+        return item  # type: ignore[no-any-return]
+
+    def _materialize(self) -> None:
+        if self._done is not None:
+            for i in range(len(self)):
+                self._item(i)
+            self._done = None
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: Union[SupportsIndex, slice]) -> Union[T, list[T]]:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self)))]
+        if self._done is None:
+            return list.__getitem__(self, index)  # type: ignore[no-any-return]
+        i = index.__index__()
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("list index out of range")
+        return self._item(i)
+
+    def __iter__(self) -> Iterator[T]:
+        if self._done is None:
+            return list.__iter__(self)
+        return self._iter()
+
+    def _iter(self) -> Iterator[T]:
+        i = 0
+        while i < len(self):
+            yield self[i]
+            i += 1
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (list, (list(self),))
+
+
+def _materializing(name: str) -> Callable[..., Any]:
+    method = getattr(list, name)
+
+    def wrapper(self: LazyList[Any], *args: Any, **kwargs: Any) -> Any:
+        self._materialize()
+        for arg in args:
+            if isinstance(arg, LazyList):
+                arg._materialize()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in (
+    "__contains__", "__repr__", "__eq__", "__ne__", "__lt__", "__le__", "__gt__",
+    "__ge__", "__add__", "__mul__", "__rmul__", "__iadd__", "__imul__",
+    "__setitem__", "__delitem__", "__reversed__", "append", "extend", "insert",
+    "pop", "remove", "index", "count", "sort", "reverse", "copy", "clear",
+):  # fmt: skip
+    setattr(LazyList, _name, _materializing(_name))
+
+
+class LazyItems:
+    """Field marker: validate a ``list[T]`` field lazily in ``lazy`` mode.
+
+    Usage:
+        items: Annotated[list[TransactionDetail], LazyItems()]
+    """
+
+    def __get_pydantic_core_schema__(
+        self, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        schema = handler(source)
+        (item_tp,) = get_args(source) or (Any,)
+        validate_item = type_adapter(item_tp).validate_python
+
+        def validate(
+            value: Any,
+            validator: core_schema.ValidatorFunctionWrapHandler,
+            info: core_schema.ValidationInfo,
+        ) -> Any:
+            if isinstance(value, list) and (info.context or {}).get("validation") == "lazy":
+                return LazyList(value, functools.partial(validate_item, strict=True))
+            return validator(value)
+
+        def serialize(value: Any, serializer: core_schema.SerializerFunctionWrapHandler) -> Any:
+            if isinstance(value, LazyList):
+                value._materialize()
+            return serializer(value)
+
+        # ``decode`` validates lazy-mode payloads from Python objects, so the
+        # JSON path keeps pydantic-core's plain list validator.
+        return core_schema.json_or_python_schema(
+            json_schema=schema,
+            python_schema=core_schema.with_info_wrap_validator_function(validate, schema),
+            serialization=core_schema.wrap_serializer_function_ser_schema(serialize, schema=schema),
+        )
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
 from pydantic import BaseModel, Field
 
+from waiaas.lazy import LazyItems
+
 
 # ---------------------------------------------------------------------------
 # Wallet models
@@ -197,6 +199,7 @@ class TransactionDetail(BaseModel):
     status: str
     tier: Optional[str] = None
     chain: str
+    network: Optional[str] = None
     to_address: Optional[str] = Field(default=None, alias="toAddress")
     amount: Optional[str] = None
     tx_hash: Optional[str] = Field(default=None, alias="txHash")
@@ -209,7 +212,7 @@ class TransactionDetail(BaseModel):
 class TransactionList(BaseModel):
     """Response from GET /v1/transactions."""
 
-    items: list[TransactionDetail]
+    items: Annotated[list[TransactionDetail], LazyItems()]
     cursor: Optional[str] = None
     has_more: bool = Field(alias="hasMore")
 
@@ -456,7 +459,7 @@ class IncomingTransactionItem(BaseModel):
 class IncomingTransactionList(BaseModel):
     """Paginated list of incoming transactions."""
 
-    data: list[IncomingTransactionItem]
+    data: Annotated[list[IncomingTransactionItem], LazyItems()]
     next_cursor: Optional[str] = Field(default=None, alias="nextCursor")
     has_more: bool = Field(alias="hasMore")
 
@@ -556,7 +559,7 @@ class DeFiPositionsResponse(BaseModel):
     """GET /v1/wallet/positions response."""
 
     wallet_id: str = Field(alias="walletId")
-    positions: list[DeFiPosition]
+    positions: Annotated[list[DeFiPosition], LazyItems()]
     total_value_usd: Optional[float] = Field(None, alias="totalValueUsd")
 
     model_config = {"populate_by_name": True}
@@ -573,3 +576,75 @@ class HealthFactorResponse(BaseModel):
     status: str  # 'safe' | 'warning' | 'danger' | 'critical'
 
     model_config = {"populate_by_name": True}
+
+
+# ---------------------------------------------------------------------------
+# Webhook models
+# ---------------------------------------------------------------------------
+
+
+class Webhook(BaseModel):
+    """Item of GET /v1/webhooks."""
+
+    id: str
+    url: str
+    events: list[str]
+    description: Optional[str] = None
+    enabled: bool
+    created_at: int = Field(alias="createdAt")
+    updated_at: int = Field(alias="updatedAt")
+
+    model_config = {"populate_by_name": True}
+
+
+class WebhookCreated(Webhook):
+    """Response from POST /v1/webhooks (201); ``secret`` is shown only once."""
+
+    secret: str
+
+
+class WebhookList(BaseModel):
+    """Response from GET /v1/webhooks."""
+
+    data: Annotated[list[Webhook], LazyItems()]
+
+
+class WebhookLog(BaseModel):
+    """One delivery attempt, from GET /v1/webhooks/:id/logs."""
+
+    id: str
+    webhook_id: str = Field(alias="webhookId")
+    event_type: str = Field(alias="eventType")
+    status: str  # 'success' | 'failed'
+    http_status: Optional[int] = Field(None, alias="httpStatus")
+    attempt: int
+    error: Optional[str] = None
+    request_duration: Optional[int] = Field(None, alias="requestDuration")
+    created_at: int = Field(alias="createdAt")
+
+    model_config = {"populate_by_name": True}
+
+
+class WebhookLogList(BaseModel):
+    """Response from GET /v1/webhooks/:id/logs (newest first)."""
+
+    data: Annotated[list[WebhookLog], LazyItems()]
+
+
+class WebhookEvent(BaseModel):
+    """Body of a webhook delivery; ``id`` is the same on every redelivery."""
+
+    id: str
+    event: str
+    timestamp: int
+    data: dict[str, Any] = Field(default_factory=dict)
+
+    @property
+    def tx_id(self) -> Optional[str]:
+        """Transaction id for TX_* events, if the event carries one."""
+        return self.data.get("txId")
+
+    @property
+    def wallet_id(self) -> Optional[str]:
+        """Wallet the event concerns, if any."""
+        return self.data.get("walletId")
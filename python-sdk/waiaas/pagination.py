@@ -0,0 +1,171 @@
+"""Async iteration over cursor-paginated endpoints with next-page prefetch."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import AsyncGenerator, Awaitable, Callable, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Fetches the page at ``cursor`` (None for the first page) and returns its
+# items together with the cursor of the next page (None on the last page).
+PageFetcher = Callable[[Optional[str]], Awaitable[tuple[Sequence[T], Optional[str]]]]
+
+_DONE = object()
+
+
+async def paginate(
+    fetch: PageFetcher[T],
+    *,
+    prefetch: int = 1,
+    max_items: Optional[int] = None,
+) -> AsyncGenerator[T, None]:
+    """Yield the items of every page, fetching ahead of the consumer.
+
+    Pages are requested by a background task that stays up to
+    ``prefetch`` pages ahead of the page being consumed, so the next round
+    trip overlaps with the caller's processing.  ``prefetch=0`` fetches
+    each page only once the previous one is exhausted.
+
+    Closing the generator (``break`` inside ``contextlib.aclosing``, or
+    ``aclose()``) or cancelling the consumer cancels the in-flight fetch.
+    An error fetching a page is raised after the items of the pages
+    before it have been yielded.
+
+    Args:
+        fetch: Coroutine function returning ``(items, next_cursor)``.
+        prefetch: Pages to fetch ahead of the consumer.
+        max_items: Stop after yielding this many items (None for all).
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must be >= 0")
+    if max_items is not None and max_items <= 0:
+        return
+    if prefetch == 0:
+        pages = _serial_pages(fetch, max_items)
+    else:
+        pages = _prefetched_pages(fetch, prefetch, max_items)
+    remaining = max_items
+    try:
+        async for items in pages:
+            for item in items:
+                yield item
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining == 0:
+                        return
+    finally:
+        await pages.aclose()
+
+
+async def _serial_pages(
+    fetch: PageFetcher[T], max_items: Optional[int]
+) -> AsyncGenerator[Sequence[T], None]:
+    cursor: Optional[str] = None
+    fetched = 0
+    while True:
+        items, cursor = await fetch(cursor)
+        fetched += len(items)
+        yield items
+        if cursor is None or not items:
+            return
+        if max_items is not None and fetched >= max_items:
+            return
+
+
+async def _prefetched_pages(
+    fetch: PageFetcher[T], prefetch: int, max_items: Optional[int]
+) -> AsyncGenerator[Sequence[T], None]:
+    # A slot is taken per page fetched and given back once the consumer
+    # moves on to that page, bounding how far the producer runs ahead.
+    slots = asyncio.Semaphore(prefetch)
+    queue: asyncio.Queue[object] = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            async for items in _serial_pages(fetch, max_items):
+                await queue.put(items)
+                await slots.acquire()
+        except Exception as exc:  # delivered to the consumer in order
+            await queue.put(exc)
+        else:
+            await queue.put(_DONE)
+
+    await slots.acquire()  # the page about to be consumed
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page = await queue.get()
+            if page is _DONE:
+                return
+            if isinstance(page, Exception):
+                raise page
+            slots.release()
+            yield page  # type: ignore[misc]
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
+
+async def paginate_shards(
+    fetchers: Sequence[PageFetcher[T]], *, concurrency: int
+) -> AsyncGenerator[Sequence[T], None]:
+    """Page several independent cursor chains concurrently.
+
+    Up to ``concurrency`` shards are paged at once, started in order.
+    Pages are yielded shard by shard, in ``fetchers`` order: the first
+    shard streams as its pages arrive while later shards buffer theirs
+    until it is done.
+
+    Args:
+        fetchers: One page fetcher per shard.
+        concurrency: Shards paged at the same time.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    slots = asyncio.Semaphore(concurrency)
+    queues: list[asyncio.Queue[object]] = [asyncio.Queue() for _ in fetchers]
+
+    async def run(fetch: PageFetcher[T], queue: asyncio.Queue[object]) -> None:
+        async with slots:
+            try:
+                async for items in _serial_pages(fetch, None):
+                    queue.put_nowait(items)
+            except Exception as exc:  # delivered to the consumer in order
+                queue.put_nowait(exc)
+                return
+        queue.put_nowait(_DONE)
+
+    tasks = [asyncio.ensure_future(run(f, q)) for f, q in zip(fetchers, queues)]
+    try:
+        for queue in queues:
+            while True:
+                page = await queue.get()
+                if page is _DONE:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                yield page  # type: ignore[misc]
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def time_shards(since: int, until: int, shards: int) -> list[tuple[int, int]]:
+    """Split the inclusive epoch-second range ``[since, until]`` into shards.
+
+    Returns non-overlapping inclusive ``(since, until)`` pairs, newest
+    first to match the daemon's ``detectedAt DESC`` ordering.  Fewer
+    shards are returned when the range has fewer seconds than ``shards``.
+    """
+    if until < since:
+        raise ValueError("until must not be before since")
+    if shards < 1:
+        raise ValueError("shards must be >= 1")
+    span = until - since + 1
+    shards = min(shards, span)
+    bounds = [since + span * k // shards for k in range(shards + 1)]
+    return [(bounds[k], bounds[k + 1] - 1) for k in reversed(range(shards))]
@@ -0,0 +1,175 @@
+"""Shared connection pool for many per-session WAIaaS clients."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from typing import Any, Optional
+
+import httpx
+
+from waiaas.balancer import LoadBalancer
+from waiaas.cache import ResponseCache
+from waiaas.circuit import CircuitBreaker
+from waiaas.client import WAIaaSClient
+from waiaas.concurrency import AdaptiveConcurrency
+from waiaas.conditional import ValidatorCache
+from waiaas.decoding import ValidationMode
+from waiaas.hedging import RequestHedger
+from waiaas.inflight import DrainReport
+from waiaas.ratelimit import RateLimiter
+from waiaas.retry import RetryPolicy
+from waiaas.session import SessionRenewer
+from waiaas.singleflight import SingleFlight
+from waiaas.transport import PoolLimits, build_http_client, resolve_base_url
+
+
+class _PooledClient(WAIaaSClient):
+    """WAIaaSClient bound to a pool's shared HTTP client.
+
+    The session token is only ever sent per request, so updating it must
+    not touch the shared client's default headers.
+    """
+
+    def set_session_token(self, token: str) -> None:
+        """Update the session token for subsequent requests."""
+        self._session_token = token
+
+
+class WAIaaSClientPool:
+    """One connection pool shared by many session-scoped clients.
+
+    Each agent keeps its own session token while all of them reuse the
+    same sockets (and TLS sessions) to the daemon.
+
+    Usage:
+        async with WAIaaSClientPool("http://localhost:3100", http2=True) as pool:
+            alice = pool.client("wai_sess_alice")
+            bob = pool.client("wai_sess_bob")
+            await asyncio.gather(alice.get_balance(), bob.get_balance())
+
+    Clients handed out by the pool do not own the connection pool: closing
+    one stops that client only, and ``pool.close()`` shuts down all of
+    them (draining each, given ``drain_timeout``).  With
+    ``coalesce_reads=True`` all pooled clients share one coalescing group
+    (keyed by token, so sessions never see each other's responses); the
+    same holds for a shared ``cache`` or ``validator_cache``.  A
+    ``rate_limiter`` is shared too: it keeps per-session windows and one
+    IP window for all pooled clients, as the daemon does.  So is a
+    ``circuit_breaker``, since a network's RPC is down for every session,
+    and a ``concurrency`` limiter or ``hedger``, which track the one
+    daemon behind the pool.  A ``balancer`` is shared so that every
+    session sees the same replica load and health.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: float = 30.0,
+        http_client: Optional[httpx.AsyncClient] = None,
+        http2: bool = False,
+        pool_limits: Optional[PoolLimits] = None,
+        uds: Optional[str] = None,
+        coalesce_reads: bool = False,
+        cache: Optional[ResponseCache] = None,
+        validator_cache: Optional[ValidatorCache] = None,
+        validation: ValidationMode = "strict",
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        hedger: Optional[RequestHedger] = None,
+        balancer: Optional[LoadBalancer] = None,
+        idempotency_keys: bool = True,
+    ) -> None:
+        self._base_url, uds = resolve_base_url(base_url, uds)
+        self._retry_policy = retry_policy
+        self._timeout = timeout
+        self._owns_client = http_client is None
+        self._client = http_client or build_http_client(
+            self._base_url,
+            timeout=timeout,
+            headers={"Content-Type": "application/json"},
+            http2=http2,
+            pool_limits=pool_limits,
+            uds=uds,
+        )
+        max_in_flight = pool_limits.max_in_flight if pool_limits else None
+        self._stream_slots: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        )
+        self._singleflight: Optional[SingleFlight[httpx.Response]] = (
+            SingleFlight() if coalesce_reads else None
+        )
+        self._cache = cache
+        self._validator_cache = validator_cache
+        self._validation: ValidationMode = validation
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._concurrency = concurrency
+        self._hedger = hedger
+        self._balancer = balancer
+        self._idempotency_keys = idempotency_keys
+        self._clients: weakref.WeakSet[WAIaaSClient] = weakref.WeakSet()
+
+    def client(
+        self, session_token: str, *, renewer: Optional[SessionRenewer] = None
+    ) -> WAIaaSClient:
+        """Create a client for ``session_token`` over the shared pool.
+
+        Args:
+            session_token: The session's token.
+            renewer: Keeps this session's token renewed; one per session.
+        """
+        client = _PooledClient(
+            self._base_url,
+            session_token,
+            retry_policy=self._retry_policy,
+            timeout=self._timeout,
+            http_client=self._client,
+            cache=self._cache,
+            validator_cache=self._validator_cache,
+            validation=self._validation,
+            rate_limiter=self._rate_limiter,
+            circuit_breaker=self._circuit_breaker,
+            concurrency=self._concurrency,
+            hedger=self._hedger,
+            balancer=self._balancer,
+            idempotency_keys=self._idempotency_keys,
+            renewer=renewer,
+        )
+        client._stream_slots = self._stream_slots
+        client._singleflight = self._singleflight
+        self._clients.add(client)
+        return client
+
+    async def __aenter__(self) -> "WAIaaSClientPool":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def close(self, drain_timeout: float = 0.0) -> DrainReport:
+        """Close every pooled client, then the shared HTTP client.
+
+        Args:
+            drain_timeout: Seconds each client's calls in flight get to
+                finish before they are cancelled.
+
+        Returns:
+            The pooled clients' drain reports, combined.
+        """
+        started = time.monotonic()
+        reports = await asyncio.gather(
+            *(client.close(drain_timeout) for client in list(self._clients))
+        )
+        if self._owns_client:
+            await self._client.aclose()
+        combined = DrainReport(duration=time.monotonic() - started)
+        for report in reports:
+            combined.completed += report.completed
+            combined.cancelled.extend(report.cancelled)
+            combined.cancelled_tasks += report.cancelled_tasks
+        return combined
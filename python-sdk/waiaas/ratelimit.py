@@ -0,0 +1,232 @@
+"""Client-side pacing that mirrors the daemon's rate-limit tiers."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+from waiaas.session import token_claims
+
+# Paths the daemon's session limiter covers (``/v1/wallet/*`` etc.).
+SESSION_PATH_PREFIXES = (
+    "/v1/wallet/",
+    "/v1/transactions",
+    "/v1/actions/",
+    "/v1/x402/",
+    "/v1/rpc-evm/",
+    "/v1/erc8004/",
+    "/v1/erc8128/",
+)
+# POSTs that submit a transaction (``send_token``, ``execute_action``)
+# and count against the much smaller transaction limit.
+TX_PATH_PREFIXES = ("/v1/transactions/send", "/v1/actions/")
+
+# 429 messages of the daemon's limiters, to tell which tier rejected a call.
+_TIER_MESSAGES = {
+    "IP rate limit": "ip",
+    "Session rate limit": "session",
+    "Transaction rate limit": "tx",
+}
+# Quiet windows (no 429) before a shrunken limit grows by a tenth again.
+_RECOVERY_WINDOWS = 2
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters for a RateLimiter."""
+
+    acquired: int = 0  # requests let through
+    delayed: int = 0  # requests that had to wait for a slot
+    total_delay: float = 0.0  # seconds spent waiting, summed
+    rate_limited: int = 0  # 429s reported back by the client
+
+
+class _Window:
+    """Sliding window admitting ``limit`` requests per ``window`` seconds.
+
+    ``effective`` starts at ``limit`` and drops to what the daemon
+    actually allowed when a 429 shows the window is shared with other
+    traffic; it climbs back by a tenth of ``limit`` every
+    ``_RECOVERY_WINDOWS`` windows without another 429.
+    """
+
+    def __init__(self, limit: int, window: float, now: float) -> None:
+        self.limit = limit
+        self.window = window
+        self.effective = float(limit)
+        self.stamps: collections.deque[float] = collections.deque()
+        self.blocked_until = 0.0
+        self.adjusted_at = now
+        self.lock = asyncio.Lock()
+        self.users = 0  # acquires holding on to this window
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one more request fits (0 if it fits now)."""
+        while self.stamps and self.stamps[0] <= now - self.window:
+            self.stamps.popleft()
+        if (
+            self.effective < self.limit
+            and now - self.adjusted_at >= self.window * _RECOVERY_WINDOWS
+        ):
+            self.effective = min(float(self.limit), self.effective + max(1.0, self.limit / 10))
+            self.adjusted_at = now
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        allowed = max(1, int(self.effective))
+        if len(self.stamps) < allowed:
+            return 0.0
+        return self.stamps[len(self.stamps) - allowed] + self.window - now
+
+    def idle(self, now: float) -> bool:
+        """Whether nothing would be lost by dropping this window."""
+        self.wait_time(now)  # prune and recover
+        return (
+            not self.users
+            and not self.stamps
+            and now >= self.blocked_until
+            and self.effective >= self.limit  # a shrunken share is kept
+        )
+
+    def penalize(self, now: float, retry_after: Optional[float]) -> None:
+        """Shrink to the share the daemon granted and pause for ``retry_after``."""
+        self.wait_time(now)  # prune
+        # The rejected request is already stamped; everything before it
+        # was admitted, which is all the room this client really had.
+        self.effective = max(1.0, min(self.effective, float(len(self.stamps) - 1)))
+        if retry_after is not None:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+        self.adjusted_at = max(now, self.blocked_until)
+
+
+@dataclass
+class RateLimiter:
+    """Queue requests locally instead of sending them into a 429.
+
+    Mirrors the daemon's three sliding-window limiters: ``ip_rpm`` for
+    every request from this host, ``session_rpm`` per session on
+    session-authed paths, and ``tx_rpm`` per session for ``send_token``
+    and ``execute_action``.  Sessions are told apart by the session id in
+    their token, as the daemon does, so a renewed token keeps its
+    session's windows; windows left idle for a whole ``window`` are
+    dropped.  Defaults match the daemon's
+    ``security.rate_limit_*`` settings; set them to the daemon's values
+    if those were changed.  A call waits (FIFO per tier) until every tier
+    it counts against has room, so transactions paced at ``tx_rpm`` do
+    not hold up reads.
+
+    When the daemon still answers 429 -- other clients share the IP or
+    session -- the rejecting tier shrinks to the rate actually granted
+    and pauses until ``Retry-After``, then recovers gradually.
+
+    Pass an instance as ``WAIaaSClient(rate_limiter=...)``; share one
+    across clients on the same host (``WAIaaSClientPool`` does) so the
+    IP tier sees all of their traffic.
+    """
+
+    ip_rpm: int = 1000
+    session_rpm: int = 300
+    tx_rpm: int = 10
+    window: float = 60.0  # seconds
+    clock: Callable[[], float] = time.monotonic
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    stats: RateLimiterStats = field(default_factory=RateLimiterStats)
+
+    def __post_init__(self) -> None:
+        self._ip = _Window(self.ip_rpm, self.window, self.clock())
+        self._sessions: dict[str, _Window] = {}
+        self._tx: dict[str, _Window] = {}
+        self._swept_at = self.clock()
+
+    def _tiers(self, method: str, path: str, session: str) -> dict[str, _Window]:
+        """Windows a request counts against, narrowest first."""
+        now = self.clock()
+        if now - self._swept_at >= self.window:
+            self._sweep(now)
+        claims = token_claims(session)
+        if claims is not None:
+            session = claims.session_id
+        tiers: dict[str, _Window] = {}
+        if method == "POST" and path.startswith(TX_PATH_PREFIXES):
+            tiers["tx"] = self._window(self._tx, session, self.tx_rpm)
+        if path.startswith(SESSION_PATH_PREFIXES):
+            tiers["session"] = self._window(self._sessions, session, self.session_rpm)
+        tiers["ip"] = self._ip
+        return tiers
+
+    def _sweep(self, now: float) -> None:
+        """Drop idle per-session windows, so they do not pile up."""
+        for windows in (self._sessions, self._tx):
+            for session in [s for s, w in windows.items() if w.idle(now)]:
+                del windows[session]
+        self._swept_at = now
+
+    def _window(self, windows: dict[str, _Window], session: str, limit: int) -> _Window:
+        window = windows.get(session)
+        if window is None:
+            window = windows[session] = _Window(limit, self.window, self.clock())
+        return window
+
+    async def acquire(self, method: str, path: str, session: str) -> float:
+        """Wait until the request may be sent and claim its slots.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+            session: Session token the request is sent with.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        waited = 0.0
+        windows = list(self._tiers(method, path, session).values())
+        for window in windows:
+            window.users += 1  # not idle while this call waits on another tier
+        try:
+            # Tiers are always taken in the same order, so waiters never deadlock.
+            for window in windows:
+                async with window.lock:
+                    while True:
+                        delay = window.wait_time(self.clock())
+                        if delay <= 0:
+                            break
+                        waited += delay
+                        await self.sleep(delay)
+                    window.stamps.append(self.clock())
+        finally:
+            for window in windows:
+                window.users -= 1
+        self.stats.acquired += 1
+        if waited:
+            self.stats.delayed += 1
+            self.stats.total_delay += waited
+        return waited
+
+    def on_rate_limited(
+        self,
+        method: str,
+        path: str,
+        session: str,
+        retry_after: Optional[float] = None,
+        message: str = "",
+    ) -> None:
+        """Adapt to a 429 the daemon returned for this request.
+
+        The tier is taken from the daemon's error message when it names
+        one, otherwise the narrowest tier the request counts against.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+            session: Session token the request was sent with.
+            retry_after: Seconds from the ``Retry-After`` header, if any.
+            message: Error message of the 429 response.
+        """
+        self.stats.rate_limited += 1
+        tiers = self._tiers(method, path, session)
+        name = next((t for m, t in _TIER_MESSAGES.items() if m in message), None)
+        if name is None or name not in tiers:
+            name = next(iter(tiers))
+        tiers[name].penalize(self.clock(), retry_after)
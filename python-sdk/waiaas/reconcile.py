@@ -0,0 +1,244 @@
+"""Catch up on webhook events missed while an EventReceiver was down."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+from waiaas.models import (
+    IncomingTransactionItem,
+    TransactionDetail,
+    WebhookEvent,
+)
+
+if TYPE_CHECKING:
+    from waiaas.client import WAIaaSClient
+    from waiaas.events import EventReceiver
+
+# Transaction statuses the daemon announces as TX_CONFIRMED / TX_FAILED.
+_TERMINAL_EVENT_BY_STATUS = {"CONFIRMED": "TX_CONFIRMED", "FAILED": "TX_FAILED"}
+# Statuses of outgoing transactions the daemon announced as TX_SUBMITTED
+# (besides any that carry a transaction hash).
+_SUBMITTED_STATUSES = frozenset({"SUBMITTED", "CONFIRMED", "SIGNED"})
+# Event types rebuilt from the wallet's own (outgoing) transactions.
+_OUTGOING_EVENTS = frozenset({"TX_CONFIRMED", "TX_FAILED", "TX_SUBMITTED"})
+# Event types that can be rebuilt from the transaction list APIs.
+RECOVERABLE_EVENTS = frozenset({"TX_CONFIRMED", "TX_FAILED", "TX_SUBMITTED"})
+# Most delivery logs the daemon returns per request.
+_LOG_LIMIT = 100
+
+
+def event_key(event: WebhookEvent) -> str:
+    """Identity of what an event reports, the same for live and rebuilt events."""
+    subject = event.tx_id or event.data.get("txHash") or event.id
+    return f"{event.event}:{subject}"
+
+
+class HighWaterMark:
+    """Newest event handled, and the keys of recent ones, kept across restarts.
+
+    With a ``path`` the mark is written to that JSON file (atomically,
+    in a worker thread) once ``flush_every`` events have been handled or
+    ``flush_interval`` seconds after the first unsaved one, whichever
+    comes first, and on ``close``; without one it lives in memory only.
+    Events handled since the last write are replayed by the next
+    ``reconcile`` after a crash, so a late write costs a re-delivery,
+    never a lost event.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        max_keys: int = 10_000,
+        flush_every: int = 100,
+        flush_interval: float = 5.0,
+    ) -> None:
+        self.path = path
+        self.max_keys = max_keys
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.timestamp: Optional[int] = None
+        self._keys: collections.OrderedDict[str, None] = collections.OrderedDict()
+        self._unsaved = 0  # events handled since the last write
+        self._flush_now = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task[None]] = None
+        if path is not None and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+            self.timestamp = state.get("timestamp")
+            self._keys.update(dict.fromkeys(state.get("keys", [])))
+
+    def seen(self, key: str) -> bool:
+        """Whether an event with ``key`` was already handled."""
+        return key in self._keys
+
+    def advance(self, event: WebhookEvent) -> None:
+        """Record ``event`` as handled; the write to ``path`` is batched."""
+        if self.timestamp is None or event.timestamp > self.timestamp:
+            self.timestamp = event.timestamp
+        self._keys[event_key(event)] = None
+        while len(self._keys) > self.max_keys:
+            self._keys.popitem(last=False)
+        if self.path is None:
+            return
+        self._unsaved += 1
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.save()  # no event loop to write in the background
+            return
+        if self._unsaved >= self.flush_every:
+            self._flush_now.set()
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.ensure_future(self._flush_soon())
+
+    async def _flush_soon(self) -> None:
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._flush_now.wait(), self.flush_interval)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write unsaved changes to ``path`` without blocking the event loop."""
+        async with self._write_lock:
+            if self.path is None or not self._unsaved:
+                return
+            unsaved, state = self._unsaved, self._state()
+            self._flush_now.clear()
+            await asyncio.to_thread(self._write, self.path, state)
+            self._unsaved -= unsaved
+
+    async def close(self) -> None:
+        """Write what is unsaved and stop the background writer."""
+        if self._flusher is not None and not self._flusher.done():
+            self._flush_now.set()  # rather than cancel a write in progress
+            await self._flusher
+        await self.flush()
+
+    def save(self) -> None:
+        """Write the mark to ``path`` now, if any (blocking)."""
+        if self.path is None:
+            return
+        self._write(self.path, self._state())
+        self._unsaved = 0
+
+    def _state(self) -> dict[str, Any]:
+        return {"timestamp": self.timestamp, "keys": list(self._keys)}
+
+    @staticmethod
+    def _write(path: str, state: dict[str, Any]) -> None:
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+
+
+@dataclass
+class ReconcileReport:
+    """What ``EventReceiver.reconcile`` found and replayed."""
+
+    since: Optional[int] = None  # high-water mark reconciled from
+    failed_deliveries: dict[str, int] = field(default_factory=dict)  # per event type
+    replayed: list[WebhookEvent] = field(default_factory=list)
+    already_handled: int = 0  # rebuilt events the receiver had seen
+    unrecoverable: dict[str, int] = field(default_factory=dict)  # failed types not rebuilt
+
+
+def _transaction_event(tx: TransactionDetail, event_type: str) -> WebhookEvent:
+    data = {"txId": tx.id, "walletId": tx.wallet_id, "type": tx.type}
+    if tx.tx_hash is not None:
+        data["txHash"] = tx.tx_hash
+    if tx.amount is not None:
+        data["amount"] = tx.amount
+    if tx.error is not None:
+        data["error"] = tx.error
+    return WebhookEvent(
+        id=f"reconciled:{event_type}:{tx.id}",
+        event=event_type,
+        timestamp=tx.created_at or 0,
+        data=data,
+    )
+
+
+def _incoming_event(item: IncomingTransactionItem) -> WebhookEvent:
+    return WebhookEvent(
+        id=f"reconciled:TX_SUBMITTED:{item.tx_hash}",
+        event="TX_SUBMITTED",
+        timestamp=item.detected_at,
+        data={
+            "txHash": item.tx_hash,
+            "fromAddress": item.from_address,
+            "amount": item.amount,
+            "walletId": item.wallet_id,
+            "network": item.network,
+            "status": item.status,
+        },
+    )
+
+
+async def reconcile(
+    receiver: EventReceiver,
+    client: WAIaaSClient,
+    *,
+    webhook_id: str,
+    master_password: str,
+    lookback: int = 3600,
+) -> ReconcileReport:
+    """See ``EventReceiver.reconcile``."""
+    mark = receiver.high_water_mark
+    report = ReconcileReport(since=mark.timestamp)
+    if mark.timestamp is None:
+        return report  # first run: nothing was missed yet
+    since = mark.timestamp
+    logs = await client.list_webhook_logs(
+        webhook_id, master_password=master_password, status="failed", limit=_LOG_LIMIT
+    )
+    recent = [log for log in logs if log.created_at >= since]
+    for log in recent:
+        report.failed_deliveries[log.event_type] = (
+            report.failed_deliveries.get(log.event_type, 0) + 1
+        )
+    missed = set(report.failed_deliveries)
+    if len(recent) == _LOG_LIMIT:
+        # More failures than one page shows: older ones may be of any type.
+        missed |= RECOVERABLE_EVENTS
+    for event_type in missed - RECOVERABLE_EVENTS:
+        report.unrecoverable[event_type] = report.failed_deliveries[event_type]
+
+    # Transactions can finish long after they are created, so look
+    # ``lookback`` seconds further back; events already handled are
+    # recognised by their key and skipped.
+    cutoff = since - lookback
+    rebuilt: list[WebhookEvent] = []
+    if missed & _OUTGOING_EVENTS:
+        async with contextlib.aclosing(client.iter_transactions(prefetch=0)) as txs:
+            async for tx in txs:
+                if tx.created_at is not None and tx.created_at < cutoff:
+                    break
+                if "TX_SUBMITTED" in missed and (
+                    tx.tx_hash is not None or tx.status in _SUBMITTED_STATUSES
+                ):
+                    rebuilt.append(_transaction_event(tx, "TX_SUBMITTED"))
+                event_type = _TERMINAL_EVENT_BY_STATUS.get(tx.status)
+                if event_type in missed:
+                    rebuilt.append(_transaction_event(tx, event_type))
+    # TX_SUBMITTED is also sent for incoming transfers.
+    if "TX_SUBMITTED" in missed:
+        async with contextlib.aclosing(
+            client.iter_incoming_transactions(prefetch=0, since=cutoff)
+        ) as items:
+            async for item in items:
+                rebuilt.append(_incoming_event(item))
+
+    for event in sorted(rebuilt, key=lambda e: e.timestamp):
+        if receiver.dispatch(event):
+            report.replayed.append(event)
+        else:
+            report.already_handled += 1
+    return report
@@ -3,15 +3,107 @@
 from __future__ import annotations
 
 import asyncio
+import email.utils
+import random
+import time
 from dataclasses import dataclass, field
-from typing import Awaitable, Callable, TypeVar
+from typing import Awaitable, Callable, Literal, Mapping, Optional, TypeVar
 
 T = TypeVar("T")
 
+JitterMode = Literal["none", "full", "decorrelated"]
+
+# Header carrying the key that lets a server recognise a resent request.
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+# Methods that can be repeated without changing the result (RFC 9110).
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Responses sent before the request was acted on, so any method can be
+# retried after them.
+UNPROCESSED_STATUS_CODES = frozenset({429})
+
+
+@dataclass
+class RetryBudgetStats:
+    """Counters for a RetryBudget."""
+
+    requests: int = 0  # first attempts recorded
+    retries: int = 0  # retries the budget allowed
+    rejected: int = 0  # retries refused because the budget was empty
+
+
+@dataclass
+class RetryBudget:
+    """Token bucket capping retries at a fraction of request traffic.
+
+    Every request adds ``ratio`` tokens and every retry spends one, so in
+    steady state retries stay below ``ratio`` times the number of
+    requests.  ``min_per_second`` tokens trickle in regardless, letting a
+    quiet client still retry; the bucket holds at most ``max_tokens``.
+    Share one budget across a client (it lives on the ``RetryPolicy``).
+    """
+
+    ratio: float = 0.1
+    min_per_second: float = 1.0
+    max_tokens: float = 10.0
+    clock: Callable[[], float] = time.monotonic
+    stats: RetryBudgetStats = field(default_factory=RetryBudgetStats)
+
+    def __post_init__(self) -> None:
+        self._tokens = self.max_tokens
+        self._updated = self.clock()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def record_request(self) -> None:
+        """Credit the budget for one first attempt."""
+        self.stats.requests += 1
+        self._refill()
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take one token for a retry; False if the budget is exhausted."""
+        self._refill()
+        if self._tokens < 1.0 - 1e-9:  # tolerate float drift from ratio credits
+            self.stats.rejected += 1
+            return False
+        self._tokens = max(0.0, self._tokens - 1.0)
+        self.stats.retries += 1
+        return True
+
+    def _refill(self) -> None:
+        now = self.clock()
+        elapsed = now - self._updated
+        self._updated = now
+        if elapsed > 0:
+            self._tokens = min(self.max_tokens, self._tokens + elapsed * self.min_per_second)
+
 
 @dataclass
 class RetryPolicy:
-    """Configuration for exponential backoff retry."""
+    """Configuration for exponential backoff retry.
+
+    ``jitter`` spreads retries of many clients over time: ``"full"``
+    sleeps a random time up to the exponential delay, ``"decorrelated"``
+    a random time between ``base_delay`` and three times the previous
+    sleep.  When the error carries a server-provided ``retry_after``
+    (from ``Retry-After`` or rate-limit reset headers) the retry never
+    happens before it -- with jitter, it lands at a random point up to
+    one more ``retry_after`` later -- and waits above
+    ``max_retry_after`` are not retried at all.
+
+    Requests with a method outside ``idempotent_methods`` (POST, PATCH)
+    may have taken effect before a 5xx or a timeout, so by default they
+    are only retried after a 429, which the server sends before acting
+    on the request.  Set ``retry_with_idempotency_key`` to also retry
+    those carrying an idempotency key -- only safe against a server
+    that deduplicates on it, which the WAIaaS daemon does not.
+    """
 
     max_retries: int = 3
     base_delay: float = 1.0  # seconds
@@ -19,38 +111,80 @@ class RetryPolicy:
     retryable_status_codes: set[int] = field(
         default_factory=lambda: {429, 500, 502, 503, 504}
     )
+    jitter: JitterMode = "none"
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0  # seconds
+    budget: Optional[RetryBudget] = None
+    idempotent_methods: frozenset[str] = IDEMPOTENT_METHODS
+    retry_with_idempotency_key: bool = False
+
+    def get_delay(self, attempt: int, previous: Optional[float] = None) -> float:
+        """Calculate delay for the given attempt (0-indexed).
 
-    def get_delay(self, attempt: int) -> float:
-        """Calculate delay for the given attempt (0-indexed)."""
-        delay = self.base_delay * (2**attempt)
-        return min(delay, self.max_delay)
+        Args:
+            attempt: Retry attempt number, starting at 0.
+            previous: The previous backoff delay (decorrelated jitter only).
+        """
+        if self.jitter == "decorrelated":
+            upper = max(self.base_delay, (previous or self.base_delay) * 3)
+            return min(self.max_delay, random.uniform(self.base_delay, upper))
+        delay = min(self.base_delay * (2**attempt), self.max_delay)
+        if self.jitter == "full":
+            return random.uniform(0.0, delay)
+        return delay
 
     def is_retryable_status(self, status_code: int) -> bool:
         """Check if the given HTTP status code is retryable."""
         return status_code in self.retryable_status_codes
 
+    def is_idempotent(self, method: str, idempotency_key: bool = False) -> bool:
+        """Whether a request may be resent after the server may have acted on it.
+
+        Args:
+            method: HTTP method.
+            idempotency_key: Whether the request carries an idempotency key.
+        """
+        if method.upper() in self.idempotent_methods:
+            return True
+        return idempotency_key and self.retry_with_idempotency_key
+
 
 async def with_retry(
     fn: Callable[[], Awaitable[T]],
     policy: RetryPolicy,
+    deadline: Optional[float] = None,
+    *,
+    idempotent: bool = True,
 ) -> T:
     """Execute an async function with exponential backoff retry.
 
     Retries on exceptions that have a ``status_code`` attribute matching
     the policy's retryable status codes.  The ``retryable`` attribute on
-    the error is also checked -- if False, no retry is attempted.
+    the error is also checked -- if False, no retry is attempted.  A
+    ``retry_after`` attribute (seconds) delays the retry accordingly, and
+    the policy's ``budget``, if any, must grant every retry.  A retry
+    whose wait would end past ``deadline`` is not attempted.  A call that
+    is not ``idempotent`` is only retried after a 429.
 
     Args:
         fn: Async function to execute.
         policy: Retry policy configuration.
+        deadline: ``time.monotonic()`` value to finish by, if any.
+        idempotent: Whether ``fn`` is safe to repeat (see
+            ``RetryPolicy.is_idempotent``).
 
     Returns:
         The result of the function call.
 
     Raises:
-        The last exception if all retries are exhausted.
+        The last exception if all retries are exhausted, or a
+        ``DEADLINE_EXCEEDED`` WAIaaSError (caused by it) if the deadline
+        leaves no time for another attempt.
     """
+    if policy.budget is not None:
+        policy.budget.record_request()
     last_error: Exception | None = None
+    backoff: Optional[float] = None
     for attempt in range(policy.max_retries + 1):
         try:
             return await fn()
@@ -63,13 +197,80 @@ async def with_retry(
             if not retryable or not policy.is_retryable_status(status_code):
                 raise
 
+            # A non-idempotent call may already have taken effect
+            if not idempotent and status_code not in UNPROCESSED_STATUS_CODES:
+                raise
+
             # Don't retry if we've exhausted attempts
             if attempt >= policy.max_retries:
                 raise
 
-            delay = policy.get_delay(attempt)
+            backoff = policy.get_delay(attempt, backoff)
+            delay = backoff
+            retry_after = getattr(e, "retry_after", None) if policy.respect_retry_after else None
+            if retry_after is not None:
+                # Don't retry if the server asks for a longer wait than allowed
+                if retry_after > policy.max_retry_after:
+                    raise
+                if policy.jitter == "none":
+                    delay = max(retry_after, backoff)
+                else:
+                    # Clients told the same reset time would all retry at
+                    # once; spread them over one more interval instead.
+                    delay = retry_after + random.uniform(0.0, retry_after)
+
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                from waiaas.errors import WAIaaSError  # errors imports this module
+
+                raise WAIaaSError(
+                    code="DEADLINE_EXCEEDED",
+                    message=f"No time left to retry after {getattr(e, 'code', type(e).__name__)}",
+                    details={"attempts": attempt + 1},
+                ) from e
+
+            if policy.budget is not None and not policy.budget.try_spend():
+                raise
+
             await asyncio.sleep(delay)
 
     # Should not reach here, but satisfy type checker
     assert last_error is not None
     raise last_error
+
+
+def parse_retry_after(
+    headers: Mapping[str, str], now: Optional[float] = None
+) -> Optional[float]:
+    """Seconds to wait before retrying, from response headers.
+
+    Reads ``Retry-After`` (delay-seconds or HTTP-date), then the
+    ``RateLimit-Reset`` / ``X-RateLimit-Reset`` headers (seconds until
+    reset, or an epoch timestamp).  Header names are matched
+    case-insensitively when ``headers`` is an ``httpx.Headers``.
+
+    Args:
+        headers: Response headers.
+        now: Current epoch time (defaults to ``time.time()``).
+    """
+    now = time.time() if now is None else now
+    value = headers.get("retry-after")
+    if value is not None:
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, when.timestamp() - now)
+    for name in ("ratelimit-reset", "x-ratelimit-reset"):
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            reset = float(value)
+        except ValueError:
+            return None
+        # Large values are absolute epoch seconds rather than a delta.
+        return max(0.0, reset - now) if reset > 1e9 else max(0.0, reset)
+    return None
@@ -0,0 +1,108 @@
+"""Session token renewal ahead of expiry."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+TOKEN_PREFIX = "wai_sess_"
+
+# The daemon rejects renewal before half of a token's lifetime has passed
+# (RENEWAL_TOO_EARLY).
+_EARLIEST_RENEWAL = 0.5
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    """Claims of a ``wai_sess_<JWT>`` session token."""
+
+    session_id: str
+    issued_at: int  # epoch seconds
+    expires_at: Optional[int]  # epoch seconds; None for an unlimited session
+
+
+def token_claims(token: str) -> Optional[TokenClaims]:
+    """Read the claims of a session token without verifying its signature.
+
+    Returns:
+        The claims, or None if ``token`` is not a readable session JWT.
+    """
+    if not token.startswith(TOKEN_PREFIX):
+        return None
+    parts = token[len(TOKEN_PREFIX):].split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1]
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        expires_at = claims.get("exp")
+        return TokenClaims(
+            session_id=str(claims["sub"]),
+            issued_at=int(claims["iat"]),
+            expires_at=int(expires_at) if expires_at is not None else None,
+        )
+    except (binascii.Error, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+@dataclass
+class SessionRenewerStats:
+    """Counters for a SessionRenewer."""
+
+    renewals: int = 0  # tokens renewed via PUT /v1/sessions/:id/renew
+    refreshes: int = 0  # tokens obtained from ``refresh``
+    failures: int = 0  # renewals or refreshes that raised
+    replays: int = 0  # requests resent after a 401 with a new token
+
+
+@dataclass
+class SessionRenewer:
+    """Renew a client's session token before it expires.
+
+    The client reads the token's issue and expiry times from its JWT and
+    renews it once ``renew_at`` of its lifetime has passed (the daemon
+    refuses renewal before half of it has), retrying every
+    ``retry_delay`` seconds if renewal fails.  Tokens without an expiry
+    are left alone.
+
+    When a request comes back 401 anyway, the client renews once for all
+    concurrent callers, holds new requests until that is done, and
+    resends the failed ones with the new token.  If the daemon will not
+    renew (expired token, renewal limit, absolute lifetime), ``refresh``
+    -- e.g. creating a new session out of band -- supplies the token
+    instead; without it the 401 is raised as before.
+
+    Pass an instance as ``WAIaaSClient(renewer=...)``; each client needs
+    its own, as it tracks one session.
+    """
+
+    renew_at: float = 0.75  # fraction of the token lifetime
+    retry_delay: float = 30.0  # seconds
+    refresh: Optional[Callable[[], Awaitable[str]]] = None
+    clock: Callable[[], float] = time.time  # epoch seconds, like the claims
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    stats: SessionRenewerStats = field(default_factory=SessionRenewerStats)
+
+    def __post_init__(self) -> None:
+        if not _EARLIEST_RENEWAL <= self.renew_at < 1.0:
+            raise ValueError(
+                f"renew_at must be in [{_EARLIEST_RENEWAL}, 1), got {self.renew_at}"
+            )
+
+    def delay(self, token: str) -> Optional[float]:
+        """Seconds until ``token`` is due for renewal (0 if overdue).
+
+        Returns:
+            The delay, or None if the token does not expire or cannot be read.
+        """
+        claims = token_claims(token)
+        if claims is None or claims.expires_at is None:
+            return None
+        lifetime = claims.expires_at - claims.issued_at
+        due = claims.issued_at + lifetime * self.renew_at
+        return max(0.0, due - self.clock())
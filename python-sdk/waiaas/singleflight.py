@@ -0,0 +1,59 @@
+"""Single-flight coalescing of identical concurrent calls."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for a SingleFlight group."""
+
+    requests: int = 0  # calls made through the group
+    executed: int = 0  # calls that actually ran (one per flight)
+
+    @property
+    def collapsed(self) -> int:
+        """Calls served by joining a flight already in progress."""
+        return self.requests - self.executed
+
+
+class SingleFlight(Generic[T]):
+    """Share one in-flight call among concurrent callers with the same key.
+
+    The shared call runs in its own task, so a caller that is cancelled
+    does not cancel the result for the others.  That task starts in an
+    empty context: it must not inherit the first caller's context
+    variables, such as its ``deadline_scope``, which would bound every
+    joiner by that caller's budget.  Callers bound their own wait
+    instead.  Once the flight settles
+    the key is released and the next call starts a fresh one -- nothing
+    is cached.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, asyncio.Task[T]] = {}
+        self.stats = SingleFlightStats()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` unless a call with the same ``key`` is in flight."""
+        self.stats.requests += 1
+        task = self._flights.get(key)
+        if task is None:
+            self.stats.executed += 1
+            task = contextvars.Context().run(asyncio.ensure_future, fn())
+            self._flights[key] = task
+            task.add_done_callback(lambda t: self._settle(key, t))
+        return await asyncio.shield(task)
+
+    def _settle(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        # Mark the exception retrieved in case every waiter was cancelled.
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,397 @@
+"""SQLite store of a session's transactions, kept up to date incrementally."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from waiaas.models import IncomingTransactionItem, TransactionDetail
+
+if TYPE_CHECKING:
+    from waiaas.client import WAIaaSClient
+
+# Transaction statuses that never change again.
+TERMINAL_STATUSES = frozenset(
+    {"CONFIRMED", "FAILED", "CANCELLED", "EXPIRED", "PARTIAL_FAILURE", "SIGNED"}
+)
+# The daemon lists one incoming status at a time (CONFIRMED by default).
+INCOMING_STATUSES = ("DETECTED", "CONFIRMED")
+
+_SCHEMA_VERSION = 1
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id TEXT PRIMARY KEY,
+    wallet_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    network TEXT,
+    created_at INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_status ON transactions (status, created_at);
+CREATE INDEX IF NOT EXISTS transactions_network ON transactions (network, created_at);
+CREATE INDEX IF NOT EXISTS transactions_created ON transactions (created_at);
+
+CREATE TABLE IF NOT EXISTS incoming (
+    id TEXT PRIMARY KEY,
+    wallet_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    network TEXT NOT NULL,
+    token_address TEXT,
+    detected_at INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS incoming_status ON incoming (status, detected_at);
+CREATE INDEX IF NOT EXISTS incoming_network ON incoming (network, detected_at);
+CREATE INDEX IF NOT EXISTS incoming_token ON incoming (token_address, detected_at);
+CREATE INDEX IF NOT EXISTS incoming_detected ON incoming (detected_at);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class SyncReport:
+    """What one ``TransactionStore.sync`` fetched and changed."""
+
+    pages: int = 0  # list requests made
+    refreshed: int = 0  # non-terminal transactions fetched one by one
+    transactions_added: int = 0
+    transactions_updated: int = 0
+    incoming_added: int = 0
+    incoming_updated: int = 0
+
+
+class TransactionStore:
+    """Local copy of a session's transactions for repeated queries.
+
+    Usage:
+        with TransactionStore("waiaas.db") as store:
+            await store.sync(client)
+            failed = store.transactions(status="FAILED", since=week_ago)
+
+    ``sync`` fetches only what changed since the last one: outgoing
+    transactions newer than the newest stored (the daemon lists them
+    newest first), incoming transactions from a ``since`` watermark,
+    and the stored transactions not yet in a final status.  Progress
+    is checkpointed after every page, so a sync that is interrupted
+    resumes from its cursor instead of starting over.  Queries are then
+    answered from indexed local tables without asking the daemon.
+
+    The store follows the wallet a client's session resolves to; use
+    one store per session.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def __enter__(self) -> "TransactionStore":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+    # -----------------------------------------------------------------
+    # Sync
+    # -----------------------------------------------------------------
+
+    async def sync(
+        self,
+        client: WAIaaSClient,
+        *,
+        transactions: bool = True,
+        incoming: bool = True,
+        page_size: int = 100,
+        refresh_concurrency: int = 8,
+    ) -> SyncReport:
+        """Bring the store up to date with the daemon.
+
+        Args:
+            client: Client for the session to sync.
+            transactions: Sync outgoing transactions.
+            incoming: Sync incoming transactions.
+            page_size: Items per list request (1-100).
+            refresh_concurrency: Most non-terminal transactions
+                re-fetched at once.
+
+        Returns:
+            What was fetched and changed.
+        """
+        report = SyncReport()
+        if transactions:
+            await self._sync_transactions(client, page_size, refresh_concurrency, report)
+        if incoming:
+            for status in INCOMING_STATUSES:
+                await self._sync_incoming(client, status, page_size, report)
+        return report
+
+    async def _sync_transactions(
+        self,
+        client: WAIaaSClient,
+        page_size: int,
+        refresh_concurrency: int,
+        report: SyncReport,
+    ) -> None:
+        head = self._state("transactions.head")
+        cursor = self._state("transactions.cursor")
+        pass_head = self._state("transactions.pass_head")
+        fetched: set[str] = set()
+        while True:
+            page = await client.list_transactions(limit=page_size, cursor=cursor)
+            report.pages += 1
+            items = list(page.items)
+            if pass_head is None and items:
+                pass_head = items[0].id
+            # Transaction ids are UUIDv7, so the daemon's newest-first
+            # order is descending id order.
+            new = [tx for tx in items if head is None or tx.id > head]
+            fetched.update(tx.id for tx in new)
+            cursor = page.cursor
+            done = len(new) < len(items) or not page.has_more or cursor is None
+            with self._db:
+                self._save_transactions(new, report)
+                if done:
+                    self._set_state("transactions.head", pass_head or head)
+                    self._set_state("transactions.cursor", None)
+                    self._set_state("transactions.pass_head", None)
+                else:
+                    self._set_state("transactions.cursor", cursor)
+                    self._set_state("transactions.pass_head", pass_head)
+            if done:
+                break
+
+        placeholders = ", ".join("?" * len(TERMINAL_STATUSES))
+        pending = [
+            tx_id
+            for (tx_id,) in self._db.execute(
+                f"SELECT id FROM transactions WHERE status NOT IN ({placeholders})",
+                tuple(TERMINAL_STATUSES),
+            )
+            if tx_id not in fetched
+        ]
+        slots = asyncio.Semaphore(refresh_concurrency)
+
+        async def refresh(tx_id: str) -> TransactionDetail:
+            async with slots:
+                return await client.get_transaction(tx_id)
+
+        refreshed = await asyncio.gather(*(refresh(tx_id) for tx_id in pending))
+        report.refreshed += len(refreshed)
+        with self._db:
+            self._save_transactions(refreshed, report)
+
+    async def _sync_incoming(
+        self, client: WAIaaSClient, status: str, page_size: int, report: SyncReport
+    ) -> None:
+        key = f"incoming.{status}"
+        watermark = self._state(f"{key}.since")
+        cursor = self._state(f"{key}.cursor")
+        if cursor is not None:
+            pass_since = self._state(f"{key}.pass_since")
+            since = int(pass_since) if pass_since is not None else None
+            newest = self._state(f"{key}.pass_newest")
+        else:
+            since = int(watermark) if watermark is not None else None
+            if since is not None and status != "DETECTED":
+                # Rows stored while still DETECTED are only listed again
+                # under their new status; reach back to the oldest of them.
+                (oldest_pending,) = self._db.execute(
+                    "SELECT MIN(detected_at) FROM incoming WHERE status = 'DETECTED'"
+                ).fetchone()
+                if oldest_pending is not None:
+                    since = min(since, oldest_pending)
+            newest = None
+        while True:
+            page = await client.list_incoming_transactions(
+                limit=page_size, cursor=cursor, status=status, since=since
+            )
+            report.pages += 1
+            items = list(page.data)
+            if newest is None and items:
+                newest = str(items[0].detected_at)
+            cursor = page.next_cursor
+            done = not page.has_more or cursor is None
+            with self._db:
+                self._save_incoming(items, report)
+                if done:
+                    if newest is not None and (watermark is None or int(newest) > int(watermark)):
+                        self._set_state(f"{key}.since", newest)
+                    for name in ("cursor", "pass_since", "pass_newest"):
+                        self._set_state(f"{key}.{name}", None)
+                else:
+                    self._set_state(f"{key}.cursor", cursor)
+                    self._set_state(f"{key}.pass_since", None if since is None else str(since))
+                    self._set_state(f"{key}.pass_newest", newest)
+            if done:
+                break
+
+    def _save_transactions(
+        self, items: Iterable[TransactionDetail], report: SyncReport
+    ) -> None:
+        for tx in items:
+            change = self._upsert(
+                "transactions",
+                {
+                    "id": tx.id,
+                    "wallet_id": tx.wallet_id,
+                    "status": tx.status,
+                    "network": tx.network,
+                    "created_at": tx.created_at,
+                    "data": tx.model_dump_json(by_alias=True),
+                },
+            )
+            if change == "added":
+                report.transactions_added += 1
+            elif change == "updated":
+                report.transactions_updated += 1
+
+    def _save_incoming(
+        self, items: Iterable[IncomingTransactionItem], report: SyncReport
+    ) -> None:
+        for item in items:
+            change = self._upsert(
+                "incoming",
+                {
+                    "id": item.id,
+                    "wallet_id": item.wallet_id,
+                    "status": item.status,
+                    "network": item.network,
+                    "token_address": item.token_address,
+                    "detected_at": item.detected_at,
+                    "data": item.model_dump_json(by_alias=True),
+                },
+            )
+            if change == "added":
+                report.incoming_added += 1
+            elif change == "updated":
+                report.incoming_updated += 1
+
+    def _upsert(self, table: str, row: dict[str, Any]) -> Optional[str]:
+        """Insert or update ``row``; returns "added", "updated" or None if unchanged."""
+        existing = self._db.execute(
+            f"SELECT data FROM {table} WHERE id = ?", (row["id"],)
+        ).fetchone()
+        if existing is not None and existing[0] == row["data"]:
+            return None
+        columns = ", ".join(row)
+        self._db.execute(
+            f"INSERT OR REPLACE INTO {table} ({columns}) VALUES ({', '.join('?' * len(row))})",
+            tuple(row.values()),
+        )
+        return "added" if existing is None else "updated"
+
+    def _state(self, name: str) -> Optional[str]:
+        row = self._db.execute("SELECT value FROM sync_state WHERE name = ?", (name,)).fetchone()
+        return None if row is None else row[0]
+
+    def _set_state(self, name: str, value: Optional[str]) -> None:
+        if value is None:
+            self._db.execute("DELETE FROM sync_state WHERE name = ?", (name,))
+        else:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sync_state (name, value) VALUES (?, ?)", (name, value)
+            )
+
+    # -----------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------
+
+    def transactions(
+        self,
+        *,
+        status: Optional[str] = None,
+        network: Optional[str] = None,
+        wallet_id: Optional[str] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list[TransactionDetail]:
+        """Stored outgoing transactions, newest first.
+
+        Args:
+            status: Only this status.
+            network: Only this network.
+            wallet_id: Only this wallet.
+            since: Created at or after (epoch seconds).
+            until: Created at or before (epoch seconds).
+            limit: Most transactions to return.
+        """
+        rows = self._select(
+            "transactions",
+            "created_at",
+            {"status": status, "network": network, "wallet_id": wallet_id},
+            since,
+            until,
+            limit,
+        )
+        return [TransactionDetail.model_validate(json.loads(data)) for data in rows]
+
+    def incoming_transactions(
+        self,
+        *,
+        status: Optional[str] = None,
+        network: Optional[str] = None,
+        token: Optional[str] = None,
+        wallet_id: Optional[str] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list[IncomingTransactionItem]:
+        """Stored incoming transactions, newest first.
+
+        Args:
+            status: Only this status (DETECTED or CONFIRMED).
+            network: Only this network.
+            token: Only this token address.
+            wallet_id: Only this wallet.
+            since: Detected at or after (epoch seconds).
+            until: Detected at or before (epoch seconds).
+            limit: Most transactions to return.
+        """
+        rows = self._select(
+            "incoming",
+            "detected_at",
+            {"status": status, "network": network, "token_address": token, "wallet_id": wallet_id},
+            since,
+            until,
+            limit,
+        )
+        return [IncomingTransactionItem.model_validate(json.loads(data)) for data in rows]
+
+    def _select(
+        self,
+        table: str,
+        time_column: str,
+        filters: dict[str, Optional[str]],
+        since: Optional[int],
+        until: Optional[int],
+        limit: Optional[int],
+    ) -> list[str]:
+        conditions = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        params: list[Any] = [value for value in filters.values() if value is not None]
+        if since is not None:
+            conditions.append(f"{time_column} >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append(f"{time_column} <= ?")
+            params.append(until)
+        sql = f"SELECT data FROM {table}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {time_column} DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [data for (data,) in self._db.execute(sql, params)]
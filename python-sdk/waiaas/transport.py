@@ -0,0 +1,124 @@
+"""HTTP transport construction for the WAIaaS client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+UNIX_SCHEME = "unix://"
+# Host used in request URLs when the daemon is reached over a Unix socket.
+UDS_BASE_URL = "http://localhost"
+
+
+@dataclass
+class PoolLimits:
+    """Connection pool limits for the underlying HTTP client.
+
+    ``max_streams`` caps concurrent requests per connection.  With HTTP/2
+    enabled, requests are multiplexed as streams over shared connections,
+    so at most ``max_connections * max_streams`` requests are in flight at
+    once; further calls wait for a free stream instead of opening sockets.
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5.0  # seconds
+    max_streams: Optional[int] = None
+
+    def to_httpx(self) -> httpx.Limits:
+        """Convert to ``httpx.Limits``."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def max_in_flight(self) -> Optional[int]:
+        """Upper bound on concurrent requests, or None if unbounded."""
+        if self.max_streams is None:
+            return None
+        return self.max_connections * self.max_streams
+
+
+def resolve_base_url(
+    base_url: str, uds: Optional[str] = None
+) -> tuple[str, Optional[str]]:
+    """Split a daemon address into an HTTP base URL and a Unix socket path.
+
+    ``unix:///run/waiaas.sock`` resolves to ``("http://localhost",
+    "/run/waiaas.sock")``.  An explicit ``uds`` path keeps the given base
+    URL for the Host header and request paths.
+
+    Raises:
+        ValueError: If both a ``unix://`` base URL and ``uds`` are given,
+            or the ``unix://`` URL has no socket path.
+    """
+    if not base_url.startswith(UNIX_SCHEME):
+        return base_url.rstrip("/"), uds
+    if uds is not None:
+        raise ValueError("Pass either a unix:// base_url or uds=, not both")
+    path = base_url[len(UNIX_SCHEME):]
+    if not path:
+        raise ValueError(f"Missing socket path in {base_url!r}")
+    return UDS_BASE_URL, path
+
+
+def build_http_client(
+    base_url: str,
+    *,
+    timeout: float,
+    headers: dict[str, str],
+    http2: bool = False,
+    http2_prior_knowledge: bool = False,
+    pool_limits: Optional[PoolLimits] = None,
+    uds: Optional[str] = None,
+) -> httpx.AsyncClient:
+    """Create the ``httpx.AsyncClient`` used by ``WAIaaSClient``.
+
+    With ``http2=True`` an ``https://`` daemon negotiates HTTP/2 via ALPN,
+    falling back to HTTP/1.1; a plain ``http://`` daemon keeps speaking
+    HTTP/1.1, since cleartext has no negotiation step.
+
+    ``http2_prior_knowledge=True`` instead speaks only HTTP/2, starting
+    every connection with the HTTP/2 preface.  This is the way to get
+    cleartext HTTP/2 (h2c), but only works when the server behind the URL
+    -- e.g. a TLS-terminating proxy in front of the daemon -- accepts h2c;
+    the daemon itself serves HTTP/1.1 and drops such connections.
+
+    With ``uds`` set, every request goes over that Unix domain socket
+    instead of TCP.
+
+    Raises:
+        ImportError: If HTTP/2 is requested and the ``h2`` package is missing.
+    """
+    http2 = http2 or http2_prior_knowledge
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "HTTP/2 support requires the 'h2' package. "
+                "Install it with: pip install 'waiaas[http2]'"
+            ) from e
+    limits = (pool_limits or PoolLimits()).to_httpx()
+    http1 = not http2_prior_knowledge
+    if uds is None:
+        return httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            headers=headers,
+            limits=limits,
+            http1=http1,
+            http2=http2,
+        )
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=timeout,
+        headers=headers,
+        transport=httpx.AsyncHTTPTransport(
+            limits=limits, http1=http1, http2=http2, uds=uds
+        ),
+    )
@@ -0,0 +1,180 @@
+"""Batched status polling for many in-flight transactions."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, Optional
+
+from waiaas.deadline import deadline_scope, resolve_deadline
+from waiaas.decoding import ValidationMode
+from waiaas.errors import WAIaaSError
+from waiaas.models import TransactionDetail
+
+if TYPE_CHECKING:
+    from waiaas.client import WAIaaSClient
+
+# Statuses a transaction never leaves.
+TERMINAL_STATUSES: frozenset[str] = frozenset(
+    {"CONFIRMED", "FAILED", "CANCELLED", "EXPIRED", "PARTIAL_FAILURE", "SIGNED"}
+)
+
+# Pages of GET /v1/transactions scanned per round before falling back to
+# GET /v1/transactions/:id for the ids not found.
+_MAX_LIST_PAGES = 5
+# Concurrent GET /v1/transactions/:id requests per round.
+_MAX_SINGLE_LOOKUPS = 8
+
+
+async def wait_for_transactions(
+    client: WAIaaSClient,
+    tx_ids: Iterable[str],
+    *,
+    terminal_statuses: Iterable[str] = TERMINAL_STATUSES,
+    timeout: Optional[float] = None,
+    poll_interval: float = 1.0,
+    max_interval: float = 10.0,
+    backoff: float = 1.5,
+    validation: Optional[ValidationMode] = None,
+) -> AsyncIterator[TransactionDetail]:
+    """Poll ``tx_ids`` until each reaches a terminal status, yielding as they do.
+
+    Every round looks up all remaining ids together: one
+    ``list_pending_transactions`` call covers those still PENDING/QUEUED,
+    newest pages of ``list_transactions`` cover the rest, and only ids not
+    found there (e.g. other wallets) are fetched one by one.  The wait
+    between rounds starts at ``poll_interval`` and grows by ``backoff``
+    up to ``max_interval`` while no status changes, resetting on change.
+
+    The wait ends at ``timeout`` or at the deadline of an enclosing
+    ``deadline_scope``, whichever comes first, and each round runs under
+    what is left of it, so one slow round cannot overrun it.  An id the
+    daemon answers 404 for stops being polled while the others are still
+    waited for.
+
+    Raises:
+        WAIaaSError: ``WAIT_TIMEOUT`` when ``timeout`` or the enclosing
+            deadline passes first; ``details["pending"]`` lists the ids
+            still outstanding.
+            ``TX_NOT_FOUND`` once every other id has settled, if any id
+            was not found; ``details["not_found"]`` lists those ids.
+    """
+    terminal = frozenset(terminal_statuses)
+    remaining: dict[str, Optional[str]] = dict.fromkeys(tx_ids)
+    not_found: set[str] = set()
+    started = time.monotonic()
+    deadline = resolve_deadline(timeout)
+    interval = poll_interval
+    while remaining:
+        try:
+            with deadline_scope(deadline=deadline):
+                details, gone = await _poll(client, set(remaining), validation)
+        except WAIaaSError as e:
+            if e.code != "DEADLINE_EXCEEDED" or deadline is None or time.monotonic() < deadline:
+                raise
+            raise _wait_timeout(remaining, not_found, deadline - started) from None
+        for tx_id in gone:
+            del remaining[tx_id]
+        not_found |= gone
+        changed = bool(gone)
+        for tx_id, detail in details.items():
+            if detail.status != remaining[tx_id]:
+                changed = True
+                remaining[tx_id] = detail.status
+            if detail.status in terminal:
+                del remaining[tx_id]
+                yield detail
+        if not remaining:
+            break
+        interval = poll_interval if changed else min(interval * backoff, max_interval)
+        if deadline is not None:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise _wait_timeout(remaining, not_found, deadline - started)
+            await asyncio.sleep(min(interval, left))
+        else:
+            await asyncio.sleep(interval)
+    if not_found:
+        raise WAIaaSError(
+            code="TX_NOT_FOUND",
+            message=f"{len(not_found)} transaction(s) not found",
+            status_code=404,
+            details={"not_found": sorted(not_found)},
+        )
+
+
+def _wait_timeout(
+    remaining: dict[str, Optional[str]], not_found: set[str], waited: float
+) -> WAIaaSError:
+    details: dict[str, list[str]] = {"pending": sorted(remaining)}
+    if not_found:
+        details["not_found"] = sorted(not_found)
+    return WAIaaSError(
+        code="WAIT_TIMEOUT",
+        message=f"{len(remaining)} transaction(s) not settled after {waited:.3g}s",
+        details=details,
+    )
+
+
+async def _poll(
+    client: WAIaaSClient,
+    wanted: set[str],
+    validation: Optional[ValidationMode],
+) -> tuple[dict[str, TransactionDetail], set[str]]:
+    """Fetch the current state of every id in ``wanted`` with as few calls as possible.
+
+    Returns:
+        The details found, and the ids the daemon answered 404 for.
+    """
+    found: dict[str, TransactionDetail] = {}
+    gone: set[str] = set()
+    if len(wanted) > 1:
+        pending = await client.list_pending_transactions(validation=validation)
+        for detail in pending.items:
+            if detail.id in wanted:
+                found[detail.id] = detail
+    missing = wanted - found.keys()
+    if len(missing) > 1:
+        await _scan_recent(client, missing, found, validation)
+        missing -= found.keys()
+    if missing:
+        slots = asyncio.Semaphore(_MAX_SINGLE_LOOKUPS)
+
+        async def lookup(tx_id: str) -> None:
+            async with slots:
+                try:
+                    detail = await client.get_transaction(tx_id, validation=validation)
+                except WAIaaSError as e:
+                    if e.status_code != 404:
+                        raise
+                    gone.add(tx_id)
+                else:
+                    found[detail.id] = detail
+
+        await asyncio.gather(*(lookup(i) for i in missing))
+    return found, gone
+
+
+async def _scan_recent(
+    client: WAIaaSClient,
+    missing: set[str],
+    found: dict[str, TransactionDetail],
+    validation: Optional[ValidationMode],
+) -> None:
+    """Look ``missing`` ids up in the newest pages of ``list_transactions``.
+
+    Transaction ids are UUIDv7 and the list is ordered by id descending,
+    so the scan stops once a page reaches ids older than every one sought.
+    """
+    oldest = min(missing)
+    cursor: Optional[str] = None
+    for _ in range(_MAX_LIST_PAGES):
+        page = await client.list_transactions(limit=100, cursor=cursor, validation=validation)
+        for detail in page.items:
+            if detail.id in missing:
+                found[detail.id] = detail
+        if not page.has_more or not page.items or found.keys() >= missing:
+            return
+        if page.items[-1].id <= oldest:
+            return
+        cursor = page.cursor